@@ -1,5 +1,5 @@
 # Increment versions here according to SemVer
-__version__ = "0.9.0"
+__version__ = "0.10.0"
 
 from flask_utils.utils import is_it_true
 from flask_utils.errors import GoneError
@@ -8,14 +8,39 @@ from flask_utils.errors import NotFoundError
 from flask_utils.errors import ForbiddenError
 from flask_utils.errors import BadRequestError
 from flask_utils.errors import UnauthorizedError
+from flask_utils.errors import TooManyRequestsError
 from flask_utils.errors import WebServerIsDownError
 from flask_utils.errors import FailedDependencyError
 from flask_utils.errors import MethodNotAllowedError
 from flask_utils.errors import ServiceUnavailableError
 from flask_utils.errors import OriginIsUnreachableError
 from flask_utils.errors import UnprocessableEntityError
+from flask_utils.deadline import deadline
+from flask_utils.deadline import check_deadline
+from flask_utils.deadline import remaining_time
+from flask_utils.deadline import deadline_exceeded
+from flask_utils.sampling import SlowValidationSampler
 from flask_utils.extension import FlaskUtils
+from flask_utils.responses import etag
+from flask_utils.responses import stream_ndjson
+from flask_utils.responses import stream_json_array
 from flask_utils.decorators import validate_params
+from flask_utils.rate_limit import TokenBucketTable
+from flask_utils.rate_limit import rate_limit
+from flask_utils.constraints import Range
+from flask_utils.constraints import Pattern
+from flask_utils.constraints import MaxLength
+from flask_utils.constraints import MinLength
+from flask_utils.constraints import Constraint
+from flask_utils.idempotency import IdempotencyStore
+from flask_utils.idempotency import FileIdempotencyStore
+from flask_utils.idempotency import MemoryIdempotencyStore
+from flask_utils.idempotency import idempotent
+from flask_utils.error_logging import BackgroundErrorLogger
+from flask_utils.load_shedding import ConcurrencyLimiter
+from flask_utils.load_shedding import limit_concurrency
+from flask_utils.serialization import serialize_response
+from flask_utils.circuit_breaker import CircuitBreaker
 
 __all__ = [
     "ConflictError",
@@ -30,7 +55,32 @@ __all__ = [
     "UnprocessableEntityError",
     "ServiceUnavailableError",
     "MethodNotAllowedError",
+    "TooManyRequestsError",
     "validate_params",
+    "Constraint",
+    "MinLength",
+    "MaxLength",
+    "Range",
+    "Pattern",
+    "serialize_response",
     "is_it_true",
     "FlaskUtils",
+    "idempotent",
+    "IdempotencyStore",
+    "MemoryIdempotencyStore",
+    "FileIdempotencyStore",
+    "etag",
+    "stream_json_array",
+    "stream_ndjson",
+    "ConcurrencyLimiter",
+    "limit_concurrency",
+    "TokenBucketTable",
+    "rate_limit",
+    "CircuitBreaker",
+    "SlowValidationSampler",
+    "BackgroundErrorLogger",
+    "deadline",
+    "remaining_time",
+    "deadline_exceeded",
+    "check_deadline",
 ]
@@ -0,0 +1,75 @@
+import threading
+from typing import Any
+from typing import Hashable
+from collections import OrderedDict
+
+
+class _LRUCache(object):
+    """
+    A bounded, thread-safe, least recently used cache.
+
+    When the cache holds ``maxsize`` entries, setting a new key evicts the least recently used one.
+
+    :param maxsize: The maximum number of entries kept in the cache.
+    :type maxsize: int
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils._cache import _LRUCache
+
+        cache = _LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # 1
+        cache.set("c", 3)  # "b" is evicted
+        cache.get("b")  # None
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        :param key: The key to look up.
+        :type key: Hashable
+        :param default: The value returned if the key is not in the cache.
+        :type default: Any
+
+        :return: The cached value, or ``default``.
+        :rtype: Any
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        :param key: The key to store the value under.
+        :type key: Hashable
+        :param value: The value to store.
+        :type value: Any
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,803 @@
+import os
+import sys
+import hashlib
+import inspect
+import marshal
+import tempfile
+import threading
+from enum import Enum
+from types import CodeType
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Type
+from typing import Tuple
+from typing import Union
+from typing import Literal
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import FrozenSet
+from typing import get_args
+from typing import get_origin
+from weakref import WeakValueDictionary
+
+from flask_utils import __version__
+from flask_utils._cache import _LRUCache
+from flask_utils.constraints import Constraint
+
+# Same as ``value in [None, "", [], {}]`` in :func:`~flask_utils.decorators._is_allow_empty`.
+_EMPTY_CHECK = '({var} is None or {var} == "" or {var} == [] or {var} == {{}})'
+
+_MISSING = object()
+
+_UNKNOWN_KEYS_MODES = ("reject", "ignore", "strip")
+
+_SOURCE_FILENAME = "<flask_utils validator>"
+
+# The types of the JSON values that can be members of a ``Literal`` or an ``Enum``.
+_MEMBER_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_optional(type_hint: Type) -> bool:  # type: ignore
+    """Check if the type hint is :data:`~typing.Optional`.
+
+    :param type_hint: Type hint to check.
+    :type type_hint: Type
+
+    :return: True if the type hint is :data:`~typing.Optional`, False otherwise.
+    :rtype: bool
+
+    :Example:
+
+    .. code-block:: python
+
+        from typing import Optional
+        from flask_utils.decorators import _is_optional
+
+        _is_optional(Optional[str])  # True
+        _is_optional(str)  # False
+
+    .. versionchanged:: 0.10.0
+        Moved to :mod:`flask_utils._compiler`. It is still importable from :mod:`flask_utils.decorators`.
+        ``Annotated[Optional[X], ...]`` is optional too.
+
+    .. versionadded:: 0.2.0
+    """
+    if hasattr(type_hint, "__metadata__"):
+        type_hint = type_hint.__origin__
+    return get_origin(type_hint) is Union and type(None) in get_args(type_hint)
+
+
+def _get_constraints(type_hint: Any) -> Optional[Tuple[Constraint, ...]]:
+    """Get the constraints of an ``Annotated`` type hint.
+
+    The metadata which are not a :class:`~flask_utils.constraints.Constraint` are ignored.
+
+    :param type_hint: The type hint.
+    :type type_hint: Any
+
+    :return: The constraints, or ``None`` if the type hint is not ``Annotated``.
+        The annotated type is ``type_hint.__origin__``.
+    :rtype: Optional[Tuple[Constraint, ...]]
+
+    .. versionadded:: 0.10.0
+    """
+    metadata = getattr(type_hint, "__metadata__", None)
+    if metadata is None:
+        return None
+    return tuple(item for item in metadata if isinstance(item, Constraint))
+
+
+def _get_member_values(type_hint: Any) -> Optional[List[Any]]:
+    """Get the allowed values of a ``Literal`` or an ``Enum``.
+
+    The values of an ``Enum`` are the values of its members, as they are sent in JSON.
+
+    :param type_hint: The type hint.
+    :type type_hint: Any
+
+    :return: The allowed values, or ``None`` if the type hint is neither a ``Literal`` nor an ``Enum``.
+    :rtype: Optional[List[Any]]
+
+    .. versionadded:: 0.10.0
+    """
+    if get_origin(type_hint) is Literal:
+        return list(get_args(type_hint))
+    if inspect.isclass(type_hint) and issubclass(type_hint, Enum):
+        return [member.value for member in type_hint]
+    return None
+
+
+def _get_members(type_hint: Any) -> Optional[FrozenSet[Tuple[Type[Any], Any]]]:
+    """Get the set checking the membership of a value in a ``Literal`` or an ``Enum``.
+
+    The values are stored with their type, so that ``True`` is not a member of ``Literal[1]``,
+    nor ``1.0`` a member of ``Literal[1]``.
+
+    :param type_hint: The type hint.
+    :type type_hint: Any
+
+    :return: The ``(type, value)`` pairs of the allowed values, or ``None`` if the type hint is
+        neither a ``Literal`` nor an ``Enum``.
+    :rtype: Optional[FrozenSet[Tuple[Type[Any], Any]]]
+
+    .. versionadded:: 0.10.0
+    """
+    values = _get_member_values(type_hint)
+    if values is None:
+        return None
+    return frozenset((type(value), value) for value in values if isinstance(value, _MEMBER_TYPES))
+
+
+def _is_member(value: Any, members: FrozenSet[Tuple[Type[Any], Any]]) -> bool:
+    return isinstance(value, _MEMBER_TYPES) and (type(value), value) in members
+
+
+def _is_variadic_tuple(args: Tuple[Any, ...]) -> bool:
+    return len(args) == 2 and args[1] is Ellipsis
+
+
+class _SourceGenerator(object):
+    """Generate the Python source of the checkers of a schema.
+
+    Each type hint is turned into a single Python expression with the same result as
+    :func:`~flask_utils.decorators._check_type`, so that checking a value costs no function call per level,
+    no ``get_origin`` nor ``get_args``, and no dispatch on the type hint.
+    The classes used by the expressions are stored in :attr:`constants` and referenced by name.
+
+    :param allow_empty: Allow empty values, like :func:`~flask_utils.decorators.validate_params`.
+    :type allow_empty: bool
+    :param max_depth: The depth from which the values are not checked anymore.
+    :type max_depth: int
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, allow_empty: bool, max_depth: int) -> None:
+        self.allow_empty = allow_empty
+        self.max_depth = max_depth
+        self.constants: Dict[str, Any] = {}
+        self._constant_names: Dict[int, str] = {}
+        self._variables = 0
+
+    def constant(self, value: Any) -> str:
+        name = self._constant_names.get(id(value))
+        if name is None:
+            name = f"_c{len(self.constants)}"
+            self._constant_names[id(value)] = name
+            self.constants[name] = value
+        return name
+
+    def variable(self) -> str:
+        self._variables += 1
+        return f"v{self._variables}"
+
+    def expression(self, type_hint: Any, var: str, depth: int = 0) -> str:
+        """Generate the expression checking the value in ``var`` against ``type_hint``.
+
+        :param type_hint: The expected type.
+        :type type_hint: Any
+        :param var: The name of the variable holding the value.
+        :type var: str
+        :param depth: The current depth.
+        :type depth: int
+
+        :return: The Python expression.
+        :rtype: str
+        """
+        if depth >= self.max_depth or type_hint is Any:
+            return "True"
+
+        check = self._type_expression(type_hint, var, depth)
+        if _is_optional(type_hint) or self.allow_empty:
+            return f"({_EMPTY_CHECK.format(var=var)} or {check})"
+        return check
+
+    def _type_expression(self, type_hint: Any, var: str, depth: int) -> str:
+        if type_hint is bool:
+            return f"isinstance({var}, bool)"
+
+        constraints = _get_constraints(type_hint)
+        if constraints is not None:
+            checks = [self.expression(type_hint.__origin__, var, depth)]
+            for constraint in constraints:
+                types = self.constant(constraint.types)
+                checks.append(f"(not isinstance({var}, {types}) or {constraint._source(var, self.constant)})")
+            return f"({' and '.join(checks)})"
+
+        members = _get_members(type_hint)
+        if members is not None:
+            return (
+                f"(isinstance({var}, {self.constant(_MEMBER_TYPES)})"
+                f" and ({var}.__class__, {var}) in {self.constant(members)})"
+            )
+
+        origin = get_origin(type_hint)
+        args = get_args(type_hint)
+
+        if origin is Union:
+            args_check = " or ".join(self.expression(arg, var, depth + 1) for arg in args)
+            if any(arg is bool for arg in args):
+                return f"(isinstance({var}, bool) or ({args_check}))"
+            return f"(not isinstance({var}, bool) and ({args_check}))"
+
+        if origin is list:
+            if not args:
+                return f"isinstance({var}, list)"
+            item = self.variable()
+            item_check = self.expression(args[0], item, depth + 1)
+            if item_check == "True":
+                return f"isinstance({var}, list)"
+            return f"(isinstance({var}, list) and all({item_check} for {item} in {var}))"
+
+        if origin is dict:
+            if not args:
+                return f"isinstance({var}, dict)"
+            key, item = self.variable(), self.variable()
+            key_type, value_type = args
+            key_check = f"isinstance({key}, {self.constant(key_type)})"
+            item_check = self.expression(value_type, item, depth + 1)
+            if item_check == "True":
+                return f"(isinstance({var}, dict) and all({key_check} for {key} in {var}))"
+            return f"(isinstance({var}, dict) and all({key_check} and {item_check} for {key}, {item} in {var}.items()))"
+
+        if origin is tuple and args and not _is_variadic_tuple(args):
+            checks = [f"isinstance({var}, {self.constant((list, tuple))})", f"len({var}) == {len(args)}"]
+            checks.extend(self.expression(arg, f"{var}[{index}]", depth + 1) for index, arg in enumerate(args))
+            return f"({' and '.join(checks)})"
+
+        if origin in (tuple, set, frozenset):
+            # JSON has no tuples nor sets: they are sent as arrays.
+            array_types = self.constant((list, tuple)) if origin is tuple else "list"
+            if not args:
+                return f"isinstance({var}, {array_types})"
+            item = self.variable()
+            item_check = self.expression(args[0], item, depth + 1)
+            if item_check == "True":
+                return f"isinstance({var}, {array_types})"
+            return f"(isinstance({var}, {array_types}) and all({item_check} for {item} in {var}))"
+
+        # The type hints for which a ``bool`` value passes ``isinstance`` but must be rejected, like ``int``,
+        # get a ``not isinstance(value, bool)`` guard. It is skipped for the others, like ``str``.
+        check = f"isinstance({var}, {self.constant(type_hint)})"
+        try:
+            accepts_bool = isinstance(True, type_hint)
+        except TypeError:
+            accepts_bool = True
+        if accepts_bool:
+            return f"(not isinstance({var}, bool) and {check})"
+        return check
+
+
+def _generate_checkers_source(
+    parameters: Dict[Any, Any], allow_empty: bool, max_depth: int
+) -> Tuple[str, Dict[str, Any]]:
+    """Generate the source of a module defining one checker function per key of ``parameters``.
+
+    The checker of the n-th key is named ``check_<n>``. It takes the value and returns whether it is valid.
+
+    :param parameters: The parameters of :func:`~flask_utils.decorators.validate_params`.
+    :type parameters: Dict[Any, Any]
+    :param allow_empty: Allow empty values.
+    :type allow_empty: bool
+    :param max_depth: The depth from which the values are not checked anymore.
+    :type max_depth: int
+
+    :return: The source, and the constants it references.
+    :rtype: Tuple[str, Dict[str, Any]]
+
+    .. versionadded:: 0.10.0
+    """
+    generator = _SourceGenerator(allow_empty, max_depth)
+    lines: List[str] = []
+    for index, type_hint in enumerate(parameters.values()):
+        lines.append(f"def check_{index}(v0):")
+        lines.append(f"    return {generator.expression(type_hint, 'v0')}")
+        lines.append("")
+    return "\n".join(lines), generator.constants
+
+
+def _load_code(source: str) -> CodeType:
+    """Compile the source of the checkers, or load it from the on-disk cache.
+
+    If the ``FLASK_UTILS_VALIDATOR_CACHE`` environment variable is set to a directory, the code objects are
+    stored there, like in ``__pycache__``, so that the workers and the restarted processes load them instead
+    of compiling them again. The entries are keyed by a hash of the source, of the version of the library
+    and of the Python implementation: the entries of another schema, version or interpreter are never read.
+    The entries are written in a temporary file, then renamed, so that concurrent writers don't produce
+    partial entries. An unreadable or corrupted entry is ignored and replaced.
+
+    The cache is only an optimization: when the directory can't be read or written, the source is compiled.
+
+    :param source: The source of the checkers, generated by :func:`_generate_checkers_source`.
+    :type source: str
+
+    :return: The compiled module.
+    :rtype: types.CodeType
+
+    .. versionadded:: 0.10.0
+    """
+    directory = os.environ.get("FLASK_UTILS_VALIDATOR_CACHE")
+    if not directory:
+        return compile(source, _SOURCE_FILENAME, "exec")
+
+    cache_tag = sys.implementation.cache_tag
+    digest = hashlib.sha256(f"{__version__}\0{cache_tag}\0{source}".encode("utf-8")).hexdigest()
+    path = os.path.join(directory, f"{digest}.{cache_tag}.bin")
+
+    try:
+        with open(path, "rb") as f:
+            code = marshal.loads(f.read())
+        if isinstance(code, CodeType):
+            return code
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    code = compile(source, _SOURCE_FILENAME, "exec")
+    temporary_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(marshal.dumps(code))
+        os.replace(temporary_path, path)
+    except OSError:
+        if temporary_path is not None:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+    return code
+
+
+def _estimate_cost(expression: str) -> int:
+    """Estimate the cost of a checker from its expression: its length, weighted by its loops.
+
+    .. versionadded:: 0.10.0
+    """
+    return len(expression) * (1 + 4 * expression.count(" for "))
+
+
+def _type_name(type_hint: Any) -> str:
+    """Get the name of a type hint, as shown in the error messages.
+
+    .. versionadded:: 0.10.0
+    """
+    constraints = _get_constraints(type_hint)
+    if constraints is not None:
+        name = _type_name(type_hint.__origin__)
+        if constraints:
+            name += f" ({', '.join(constraint.describe() for constraint in constraints)})"
+        return name
+    values = _get_member_values(type_hint)
+    if values is not None:
+        return f"one of {values!r}"
+    return getattr(type_hint, "__name__", str(type_hint))
+
+
+def _error_detail(path: str, message: str, solution: Optional[str]) -> Dict[str, Any]:
+    return {"path": path, "message": message, "solution": solution}
+
+
+class _SchemaValidator(object):
+    """
+    A :func:`~flask_utils.decorators.validate_params` schema, compiled once.
+
+    The keys sets and the error messages are computed when the schema is compiled, and each key gets
+    a checker generated by :class:`_SourceGenerator`. Validating a body then only costs set operations and
+    one call per key of the body.
+
+    The validators are shared by the identical schemas, see :func:`_get_validator`.
+    They can be pickled (they are compiled again when unpickled, or taken from the validators of the process,
+    see :func:`_unpickle_validator`), so that they can be sent to a :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    In adaptive mode, the failures of each key are counted, and every :attr:`reorder_interval` validations
+    the keys are sorted so that the keys failing the most often and with the cheapest checkers are checked
+    first. The counters are halved at each reordering, so that the order follows the traffic.
+    They are not locked: a lost increment only makes the order slightly less accurate.
+
+    :param parameters: The parameters of :func:`~flask_utils.decorators.validate_params`.
+    :type parameters: Dict[Any, Any]
+    :param allow_empty: Allow empty values.
+    :type allow_empty: bool
+    :param max_depth: The depth from which the values are not checked anymore.
+    :type max_depth: int
+    :param adaptive: Check the types in the adaptive order instead of the order of the body.
+    :type adaptive: bool
+    :param unknown_keys: ``"reject"`` the bodies with keys missing from ``parameters``,
+        or ``"ignore"`` (or ``"strip"``) them without looking for them.
+    :type unknown_keys: str
+
+    .. versionadded:: 0.10.0
+    """
+
+    #: The number of validations between two reorderings of the keys, in adaptive mode.
+    reorder_interval = 1000
+
+    def __init__(
+        self,
+        parameters: Dict[Any, Any],
+        allow_empty: bool,
+        max_depth: int,
+        adaptive: bool = False,
+        unknown_keys: str = "reject",
+    ) -> None:
+        if unknown_keys not in _UNKNOWN_KEYS_MODES:
+            raise ValueError(f"unknown_keys must be one of {list(_UNKNOWN_KEYS_MODES)}, not {unknown_keys!r}")
+        self.parameters = parameters
+        self.allow_empty = allow_empty
+        self.max_depth = max_depth
+        self.adaptive = adaptive
+        self.unknown_keys = unknown_keys
+        self.reject_unknown_keys = unknown_keys == "reject"
+
+        self.required_keys = tuple(key for key, type_hint in parameters.items() if not _is_optional(type_hint))
+        self.required_keys_set = frozenset(self.required_keys)
+        self.expected_keys = frozenset(parameters)
+        self.keys_solution = f"Expected keys are: {list(parameters.keys())}"
+        self.type_solutions = {key: f"It should be {_type_name(type_hint)}" for key, type_hint in parameters.items()}
+
+        self.source, constants = _generate_checkers_source(parameters, allow_empty, max_depth)
+        namespace: Dict[str, Any] = dict(constants)
+        exec(_load_code(self.source), namespace)
+        self.checkers: Dict[Any, Callable[[Any], bool]] = {
+            key: namespace[f"check_{index}"] for index, key in enumerate(parameters)
+        }
+        # Checkers of the nested type hints, compiled the first time a body has an error inside them.
+        self._nested_checkers: Dict[Tuple[Any, int], Callable[[Any], bool]] = {}
+
+        expressions = [
+            line[len("    return ") :] for line in self.source.splitlines() if line.startswith("    return ")
+        ]
+        self.costs = {key: _estimate_cost(expression) for key, expression in zip(parameters, expressions)}
+        self.failures = dict.fromkeys(parameters, 0)
+        self._validations = 0
+        self._order: Tuple[Tuple[Any, Callable[[Any], bool]], ...] = ()
+        self._ranks: Dict[Any, int] = {}
+        self._reorder()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _unpickle_validator, (
+            self.parameters,
+            self.allow_empty,
+            self.max_depth,
+            self.adaptive,
+            self.unknown_keys,
+        )
+
+    def _reorder(self) -> None:
+        """Sort the keys by decreasing failures per unit of cost, and halve the failure counters."""
+        failures, costs = self.failures, self.costs
+        order = sorted(self.checkers, key=lambda key: (failures[key] + 1) / costs[key], reverse=True)
+        self._order = tuple((key, self.checkers[key]) for key in order)
+        self._ranks = {key: rank for rank, key in enumerate(order)}
+        for key in failures:
+            failures[key] //= 2
+
+    def validate(self, data: Any, partial: bool = False) -> Optional[Tuple[str, Optional[str]]]:
+        """Validate a loaded JSON body.
+
+        :param data: The loaded JSON body.
+        :type data: Any
+        :param partial: Only check the keys present in the body, without requiring any key.
+        :type partial: bool
+
+        :return: ``None`` if the data is valid, otherwise a tuple containing the error message and the solution.
+        :rtype: Optional[Tuple[str, Optional[str]]]
+        """
+        return self.check_keys(data, partial) or self.check_types(data)
+
+    def check_keys(self, data: Any, partial: bool = False) -> Optional[Tuple[str, Optional[str]]]:
+        """Check that the body is a dict, with the required keys and without unexpected keys.
+
+        :param data: The loaded JSON body.
+        :type data: Any
+        :param partial: Don't require any key.
+        :type partial: bool
+
+        :return: ``None`` if the keys are valid, otherwise a tuple containing the error message and the solution.
+        :rtype: Optional[Tuple[str, Optional[str]]]
+        """
+        if not data:
+            return "Missing json body.", None
+
+        if not isinstance(data, dict):
+            return "JSON body must be a dict", None
+
+        if not partial and not self.required_keys_set <= data.keys():
+            for key in self.required_keys:
+                if key not in data:
+                    return f"Missing key: {key}", self.keys_solution
+
+        if self.reject_unknown_keys and not data.keys() <= self.expected_keys:
+            for key in data:
+                if key not in self.expected_keys:
+                    return f"Unexpected key: {key}.", self.keys_solution
+
+        return None
+
+    def check_types(self, data: Dict[Any, Any]) -> Optional[Tuple[str, Optional[str]]]:
+        """Check the types of the values of a body whose keys passed :meth:`check_keys`.
+
+        :param data: The loaded JSON body.
+        :type data: Dict[Any, Any]
+
+        :return: ``None`` if the types are valid, otherwise a tuple containing the error message and the solution.
+        :rtype: Optional[Tuple[str, Optional[str]]]
+        """
+        if self.adaptive:
+            return self._check_types_adaptive(data)
+
+        checkers = self.checkers
+        if self.reject_unknown_keys:
+            for key, value in data.items():
+                if not checkers[key](value):
+                    return f"Wrong type for key {key}.", self.type_solutions[key]
+        else:
+            for key, value in data.items():
+                checker = checkers.get(key)
+                if checker is not None and not checker(value):
+                    return f"Wrong type for key {key}.", self.type_solutions[key]
+
+        return None
+
+    def _check_types_adaptive(self, data: Dict[Any, Any]) -> Optional[Tuple[str, Optional[str]]]:
+        """Check the types of the keys in the adaptive order.
+
+        When several keys have a wrong type, the reported key is the first one in this order,
+        which may not be the first one in the body.
+
+        The bodies with fewer keys than the schema, like the partial ones, are checked in the order of their own
+        keys sorted by rank, so that their cost doesn't grow with the size of the schema.
+        """
+        self._validations += 1
+        if self._validations >= self.reorder_interval:
+            self._validations = 0
+            self._reorder()
+
+        if len(data) < len(self._order):
+            ranks = self._ranks
+            for key in sorted([key for key in data if key in ranks], key=ranks.__getitem__):
+                if not self.checkers[key](data[key]):
+                    self.failures[key] += 1
+                    return f"Wrong type for key {key}.", self.type_solutions[key]
+            return None
+
+        for key, checker in self._order:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING and not checker(value):
+                self.failures[key] += 1
+                return f"Wrong type for key {key}.", self.type_solutions[key]
+
+        return None
+
+    def _nested_checker(self, type_hint: Any, depth: int) -> Callable[[Any], bool]:
+        try:
+            return self._nested_checkers[(type_hint, depth)]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable type hint
+            return self._compile_nested_checker(type_hint, depth)
+        checker = self._nested_checkers[(type_hint, depth)] = self._compile_nested_checker(type_hint, depth)
+        return checker
+
+    def _compile_nested_checker(self, type_hint: Any, depth: int) -> Callable[[Any], bool]:
+        generator = _SourceGenerator(self.allow_empty, self.max_depth)
+        source = f"check = lambda v0: {generator.expression(type_hint, 'v0', depth)}"
+        namespace: Dict[str, Any] = dict(generator.constants)
+        exec(compile(source, _SOURCE_FILENAME, "exec"), namespace)
+        checker: Callable[[Any], bool] = namespace["check"]
+        return checker
+
+    def _collect_type_errors(
+        self, value: Any, type_hint: Any, depth: int, path: str, errors: List[Dict[str, Any]], max_errors: int
+    ) -> None:
+        """Find where an invalid value is wrong, descending into the lists and the dicts to report
+        the path of each invalid item, like ``courses[3]`` or ``grades.math``.
+
+        Only called on the values whose checker failed, so the valid bodies never pay for it.
+        """
+        errors_count = len(errors)
+        origin = get_origin(type_hint)
+        args = get_args(type_hint)
+
+        if not isinstance(value, bool):
+            if origin is Union and _is_optional(type_hint):
+                not_none = [arg for arg in args if arg is not type(None)]
+                if len(not_none) == 1 and get_origin(not_none[0]) in (list, dict, tuple, set, frozenset):
+                    # ``value`` is not ``None`` (or the checker wouldn't have failed)
+                    type_hint, depth = not_none[0], depth + 1
+                    origin, args = get_origin(type_hint), get_args(type_hint)
+
+            item_hints: Optional[List[Any]] = None
+            if origin in (list, set, frozenset) and args and isinstance(value, list):
+                item_hints = [args[0]] * len(value)
+            elif origin is tuple and args and isinstance(value, (list, tuple)):
+                if _is_variadic_tuple(args):
+                    item_hints = [args[0]] * len(value)
+                elif len(args) == len(value):
+                    item_hints = list(args)
+
+            if item_hints is not None:
+                for index, (item, item_hint) in enumerate(zip(value, item_hints)):
+                    if not self._nested_checker(item_hint, depth + 1)(item):
+                        self._collect_type_errors(item, item_hint, depth + 1, f"{path}[{index}]", errors, max_errors)
+                        if len(errors) >= max_errors:
+                            return
+
+            elif origin is dict and args and isinstance(value, dict):
+                key_type, value_type = args
+                check_item = self._nested_checker(value_type, depth + 1)
+                for key, item in value.items():
+                    if not isinstance(key, key_type):
+                        errors.append(
+                            _error_detail(
+                                f"{path}.{key}",
+                                f"Wrong type for key {path}.{key}.",
+                                f"Keys should be {_type_name(key_type)}",
+                            )
+                        )
+                    elif not check_item(item):
+                        self._collect_type_errors(item, value_type, depth + 1, f"{path}.{key}", errors, max_errors)
+                    if len(errors) >= max_errors:
+                        return
+
+        if len(errors) == errors_count:
+            errors.append(_error_detail(path, f"Wrong type for key {path}.", f"It should be {_type_name(type_hint)}"))
+
+    def collect(
+        self, data: Any, partial: bool = False, max_errors: int = 100
+    ) -> Optional[Tuple[str, Optional[str], List[Dict[str, Any]]]]:
+        """Validate a loaded JSON body, collecting all the errors instead of stopping at the first one.
+
+        The body is checked with the compiled checkers first, so a valid body costs the same as with
+        :meth:`validate`. Only the invalid values are traversed again to find the path of each error.
+
+        :param data: The loaded JSON body.
+        :type data: Any
+        :param partial: Only check the keys present in the body, without requiring any key.
+        :type partial: bool
+        :param max_errors: The number of errors after which the validation stops.
+        :type max_errors: int
+
+        :return: ``None`` if the data is valid, otherwise a tuple containing the message and the solution
+            of the first error, and the list of the errors, each one with a ``path``, a ``message`` and
+            a ``solution``.
+        :rtype: Optional[Tuple[str, Optional[str], List[Dict[str, Any]]]]
+        """
+        error = self.validate(data, partial) if not data or not isinstance(data, dict) else None
+        if error is not None:
+            return error[0], error[1], [_error_detail("", error[0], error[1])]
+
+        errors: List[Dict[str, Any]] = []
+
+        if not partial and not self.required_keys_set <= data.keys():
+            for key in self.required_keys:
+                if key not in data:
+                    errors.append(_error_detail(str(key), f"Missing key: {key}", self.keys_solution))
+                    if len(errors) >= max_errors:
+                        break
+
+        if len(errors) < max_errors and self.reject_unknown_keys and not data.keys() <= self.expected_keys:
+            for key in data:
+                if key not in self.expected_keys:
+                    errors.append(_error_detail(str(key), f"Unexpected key: {key}.", self.keys_solution))
+                    if len(errors) >= max_errors:
+                        break
+
+        if len(errors) < max_errors:
+            checkers = self.checkers
+            for key, value in data.items():
+                if key in checkers and not checkers[key](value):
+                    self._collect_type_errors(value, self.parameters[key], 0, str(key), errors, max_errors)
+                    if len(errors) >= max_errors:
+                        break
+
+        if not errors:
+            return None
+        del errors[max_errors:]
+        return errors[0]["message"], errors[0]["solution"], errors
+
+
+# The compiled validators, by canonical schema. The validators are dropped with the last view using them.
+_validators: "WeakValueDictionary[Hashable, _SchemaValidator]" = WeakValueDictionary()
+_validators_lock = threading.Lock()
+
+# The unpickled validators, kept alive as no view holds them in the worker processes.
+_unpickled_validators = _LRUCache(64)
+
+
+def _canonical_schema(
+    parameters: Dict[Any, Any], allow_empty: bool, max_depth: int, adaptive: bool, unknown_keys: str
+) -> Optional[Hashable]:
+    """Build a hashable key identifying a schema and the options it is compiled with.
+
+    The order of the keys is part of the key, as it appears in the error messages. The type of the keys too,
+    so that ``{1: int}`` and ``{True: int}`` don't share their validator.
+
+    :return: The key, or ``None`` if a type hint of the schema is not hashable.
+    :rtype: Optional[Hashable]
+
+    .. versionadded:: 0.10.0
+    """
+    key = (
+        tuple((type(name), name, type_hint) for name, type_hint in parameters.items()),
+        allow_empty,
+        max_depth,
+        adaptive,
+        unknown_keys,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_validator(
+    parameters: Dict[Any, Any],
+    allow_empty: bool,
+    max_depth: int,
+    adaptive: bool = False,
+    unknown_keys: str = "reject",
+) -> _SchemaValidator:
+    """Get the compiled validator of a schema, compiling it only if no other view uses the same schema.
+
+    The applications with many routes often repeat the same schemas (pagination, authentication...):
+    their routes share a single validator, with its checkers and its precomputed messages, so that the memory
+    and the time spent compiling grow with the number of distinct schemas, not with the number of routes.
+    The adaptive validators share their failure counters too.
+
+    :param parameters: The parameters of :func:`~flask_utils.decorators.validate_params`.
+    :type parameters: Dict[Any, Any]
+    :param allow_empty: Allow empty values.
+    :type allow_empty: bool
+    :param max_depth: The depth from which the values are not checked anymore.
+    :type max_depth: int
+    :param adaptive: Check the types in the adaptive order instead of the order of the body.
+    :type adaptive: bool
+    :param unknown_keys: ``"reject"``, ``"ignore"`` or ``"strip"`` the keys missing from ``parameters``.
+    :type unknown_keys: str
+
+    :return: The validator.
+    :rtype: _SchemaValidator
+
+    .. versionadded:: 0.10.0
+    """
+    key = _canonical_schema(parameters, allow_empty, max_depth, adaptive, unknown_keys)
+    if key is None:
+        return _SchemaValidator(parameters, allow_empty, max_depth, adaptive, unknown_keys)
+
+    validator = _validators.get(key)
+    if validator is None:
+        with _validators_lock:
+            validator = _validators.get(key)
+            if validator is None:
+                validator = _SchemaValidator(parameters, allow_empty, max_depth, adaptive, unknown_keys)
+                _validators[key] = validator
+    return validator
+
+
+def _unpickle_validator(
+    parameters: Dict[Any, Any],
+    allow_empty: bool,
+    max_depth: int,
+    adaptive: bool = False,
+    unknown_keys: str = "reject",
+) -> _SchemaValidator:
+    """Get the validator of a schema sent to another process, like :func:`_get_validator`.
+
+    In the worker processes of an ``offload_executor``, no view holds the unpickled validators, so the
+    last used ones are kept alive: the schema is compiled once per worker, not once per offloaded validation.
+
+    :return: The validator.
+    :rtype: _SchemaValidator
+
+    .. versionadded:: 0.10.0
+    """
+    validator = _get_validator(parameters, allow_empty, max_depth, adaptive, unknown_keys)
+    key = _canonical_schema(parameters, allow_empty, max_depth, adaptive, unknown_keys)
+    if key is not None:
+        _unpickled_validators.set(key, validator)
+    return validator
@@ -0,0 +1,247 @@
+import math
+import time
+import threading
+from types import TracebackType
+from typing import Any
+from typing import List
+from typing import Type
+from typing import Tuple
+from typing import Callable
+from typing import Optional
+from functools import wraps
+
+from flask_utils.errors import FailedDependencyError
+from flask_utils.deadline import check_deadline
+from flask_utils.errors.base_class import _BaseFlaskException
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker protecting the calls to a downstream dependency.
+
+    While the circuit is ``closed``, the calls go through and their failures are counted over a rolling window
+    of ``window`` seconds. When there are ``failure_threshold`` failures in the window (or, if
+    ``failure_rate_threshold`` is set, when the proportion of failed calls reaches it), the circuit opens.
+
+    While the circuit is ``open``, the calls fail immediately with ``error_class``
+    (:class:`~flask_utils.errors.FailedDependencyError` by default, or for example
+    :class:`~flask_utils.errors.OriginIsUnreachableError`), with a ``Retry-After`` header, instead of waiting
+    for a timeout and holding a worker.
+
+    After ``recovery_timeout`` seconds, the circuit becomes ``half-open``: up to ``half_open_max_calls`` trial
+    calls go through. If they succeed the circuit closes, if one of them fails the circuit opens again.
+
+    When the current request has a deadline (see :func:`~flask_utils.deadline.deadline`) and it has passed,
+    the call is not made either, and fails with a :class:`~flask_utils.errors.ServiceUnavailableError`.
+    Use :func:`~flask_utils.deadline.remaining_time` to set the timeout of the call.
+
+    The breaker is thread safe and can be used as a decorator or as a context manager.
+    It should be created once per dependency, for example at the module level.
+
+    :param name: The name of the dependency, used in the error message.
+    :type name: str
+    :param failure_threshold: The number of failures in the window opening the circuit. Defaults to ``5``.
+    :type failure_threshold: int
+    :param failure_rate_threshold: The proportion of failed calls in the window (between 0 and 1) opening the
+        circuit, instead of ``failure_threshold``. Defaults to ``None``.
+    :type failure_rate_threshold: Optional[float]
+    :param minimum_calls: The minimum number of calls in the window before ``failure_rate_threshold``
+        is considered. Defaults to ``10``.
+    :type minimum_calls: int
+    :param window: The duration of the rolling window, in seconds. Defaults to ``60``.
+    :type window: float
+    :param buckets: The number of buckets the window is divided into. Defaults to ``10``.
+    :type buckets: int
+    :param recovery_timeout: The number of seconds the circuit stays open before trying again.
+        Defaults to ``30``.
+    :type recovery_timeout: float
+    :param half_open_max_calls: The number of concurrent trial calls while the circuit is half-open.
+        Defaults to ``1``.
+    :type half_open_max_calls: int
+    :param exceptions: The exceptions counted as failures. Defaults to ``(Exception,)``.
+    :type exceptions: Tuple[Type[BaseException], ...]
+    :param error_class: The error raised while the circuit is open. Defaults to
+        :class:`~flask_utils.errors.FailedDependencyError`.
+    :type error_class: Type[_BaseFlaskException]
+
+    :Example:
+
+    .. code-block:: python
+
+        import requests
+        from flask_utils import CircuitBreaker
+        from flask_utils import OriginIsUnreachableError
+
+        billing_breaker = CircuitBreaker("billing", failure_threshold=5, recovery_timeout=30)
+        search_breaker = CircuitBreaker("search", error_class=OriginIsUnreachableError)
+
+        @billing_breaker
+        def get_invoices(user_id):
+            return requests.get(f"http://billing/users/{user_id}/invoices", timeout=2).json()
+
+        @app.route("/search")
+        def search():
+            with search_breaker:
+                results = requests.get("http://search/", params=request.args, timeout=1).json()
+            return results
+
+    .. versionadded:: 0.10.0
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        failure_rate_threshold: Optional[float] = None,
+        minimum_calls: int = 10,
+        window: float = 60,
+        buckets: int = 10,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+        error_class: Type[_BaseFlaskException] = FailedDependencyError,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.exceptions = exceptions
+        self.error_class = error_class
+
+        self._bucket_duration = window / buckets
+        # Each bucket is [bucket number, number of successes, number of failures]
+        self._buckets: List[List[int]] = [[-1, 0, 0] for _ in range(buckets)]
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The current state of the circuit: ``closed``, ``open`` or ``half-open``."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def reset(self) -> None:
+        """Close the circuit and forget the recorded calls."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._half_open_calls = 0
+        for bucket in self._buckets:
+            bucket[:] = [-1, 0, 0]
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._half_open_calls = 0
+
+    def _current_bucket(self, now: float) -> List[int]:
+        number = int(now / self._bucket_duration)
+        bucket = self._buckets[number % len(self._buckets)]
+        if bucket[0] != number:
+            bucket[:] = [number, 0, 0]
+        return bucket
+
+    def _window_counts(self, now: float) -> Tuple[int, int]:
+        oldest = int(now / self._bucket_duration) - len(self._buckets)
+        successes = failures = 0
+        for number, bucket_successes, bucket_failures in self._buckets:
+            if number > oldest:
+                successes += bucket_successes
+                failures += bucket_failures
+        return successes, failures
+
+    def _should_open(self, now: float) -> bool:
+        successes, failures = self._window_counts(now)
+        if self.failure_rate_threshold is None:
+            return failures >= self.failure_threshold
+        calls = successes + failures
+        return calls >= self.minimum_calls and failures / calls >= self.failure_rate_threshold
+
+    def _rejection_error(self, now: float) -> _BaseFlaskException:
+        error = self.error_class(f"The {self.name} dependency is unavailable.", "Try again later.")
+        error.retry_after = max(1, math.ceil(self.recovery_timeout - (now - self._opened_at)))
+        return error
+
+    def before_call(self) -> None:
+        """Check that a call can go through. Called automatically by the decorator and the context manager.
+
+        :raises _BaseFlaskException: ``error_class``, if the circuit is open.
+        :raises ServiceUnavailableError: If the deadline of the current request has passed. The call is then
+            not made, and not recorded.
+        """
+        check_deadline()
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.OPEN:
+                if now - self._opened_at < self.recovery_timeout:
+                    raise self._rejection_error(now)
+                self._state = self.HALF_OPEN
+            if self._state == self.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    raise self._rejection_error(now)
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._close()
+                return
+            now = time.monotonic()
+            self._current_bucket(now)[1] += 1
+            if self._state == self.CLOSED and self.failure_rate_threshold is not None and self._should_open(now):
+                self._open(now)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if needed."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+            self._current_bucket(now)[2] += 1
+            if self._state == self.CLOSED and self._should_open(now):
+                self._open(now)
+
+    def record_ignored(self) -> None:
+        """Record a call that raised an exception not counted as a failure."""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def __call__(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self:
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    def __enter__(self) -> "CircuitBreaker":
+        self.before_call()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.record_success()
+        elif issubclass(exc_type, self.exceptions):
+            self.record_failure()
+        else:
+            self.record_ignored()
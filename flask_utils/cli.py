@@ -0,0 +1,246 @@
+import os
+import json
+from typing import IO
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Iterator
+from typing import Optional
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+from flask import Flask
+from flask import current_app
+from flask.cli import AppGroup
+
+from flask_utils.errors import BadRequestError
+from flask_utils._compiler import _SchemaValidator
+from flask_utils.decorators import _validate_data
+from flask_utils.errors._error_template import _generate_error_dict
+
+# A record of the file: its line number (NDJSON) or its index (JSON array), and its raw text or loaded value.
+_Record = Tuple[int, Any]
+_Validation = Tuple[_SchemaValidator, bool, Optional[int]]
+
+cli = AppGroup("flask-utils", help="Commands of Flask-Utils.")
+
+# The validation run by the worker processes, set once per process by :func:`_init_worker`.
+_worker_validation: Optional[_Validation] = None
+
+
+def _validate_record(validation: _Validation, record: Any, raw: bool) -> Optional[Dict[str, Any]]:
+    """Validate a record of the file like :func:`~flask_utils.decorators.validate_params` validates a body.
+
+    :param validation: The validator, whether the validation is partial, and the maximum number of errors
+        to collect (``None`` to stop at the first error).
+    :type validation: Tuple[_SchemaValidator, bool, Optional[int]]
+    :param record: The record, as a JSON string if ``raw``, otherwise already loaded.
+    :type record: Any
+    :param raw: Whether the record must be loaded first.
+    :type raw: bool
+
+    :return: ``None`` if the record is valid, otherwise the error, in the format of the error responses.
+    :rtype: Optional[Dict[str, Any]]
+
+    .. versionadded:: 0.10.0
+    """
+    validator, partial, max_errors = validation
+    error: Optional[Tuple[Any, ...]]
+    try:
+        data = json.loads(record) if raw else record
+    except ValueError:
+        error = ("The Json Body is malformed.", None)
+    else:
+        error = _validate_data(data, validator, validator.allow_empty, partial, max_errors)
+    if error is None:
+        return None
+    return _generate_error_dict(BadRequestError(*error))
+
+
+def _init_worker(validation: _Validation) -> None:
+    global _worker_validation
+    _worker_validation = validation
+
+
+def _validate_chunk(chunk: List[_Record], raw: bool) -> List[Tuple[int, Dict[str, Any]]]:
+    """Validate a chunk of records in a worker process.
+
+    :return: The number and the error of each invalid record.
+    :rtype: List[Tuple[int, Dict[str, Any]]]
+
+    .. versionadded:: 0.10.0
+    """
+    assert _worker_validation is not None
+    errors = []
+    for number, record in chunk:
+        error = _validate_record(_worker_validation, record, raw)
+        if error is not None:
+            errors.append((number, error))
+    return errors
+
+
+def _read_records(file: IO[str]) -> Tuple[Iterator[_Record], bool]:
+    """Read the records of a NDJSON file, line by line, or of a JSON array.
+
+    :param file: The file.
+    :type file: IO[str]
+
+    :return: The records, and whether they are raw JSON lines (NDJSON) or loaded values (JSON array).
+        The NDJSON records are numbered by their line in the file, blank lines included.
+    :rtype: Tuple[Iterator[Tuple[int, Any]], bool]
+
+    :raises click.BadParameter: If the file is a malformed JSON array.
+
+    .. versionadded:: 0.10.0
+    """
+    # The leading blank lines are counted, so that the records are numbered by their line in the file.
+    first_number = 0
+    first_line = ""
+    for line in file:
+        first_number += 1
+        if line.strip():
+            first_line = line
+            break
+
+    if first_line.lstrip().startswith("["):
+        try:
+            records = json.loads(first_line + file.read())
+        except ValueError as error:
+            raise click.BadParameter(f"The JSON array is malformed: {error}", param_hint="FILE") from error
+        return iter(enumerate(records)), False
+
+    def lines() -> Iterator[_Record]:
+        if first_line.strip():
+            yield first_number, first_line
+        for number, line in enumerate(file, start=first_number + 1):
+            if line.strip():
+                yield number, line
+
+    return lines(), True
+
+
+def _chunks(records: Iterator[_Record], chunk_size: int) -> Iterator[List[_Record]]:
+    chunk: List[_Record] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate_records(
+    validation: _Validation, records: Iterator[_Record], raw: bool, jobs: int, chunk_size: int
+) -> Iterator[Tuple[int, List[Tuple[int, Dict[str, Any]]]]]:
+    """Validate the records by chunks, in a pool of ``jobs`` processes, keeping the order of the file.
+
+    At most two chunks per process are read ahead, so that the memory doesn't depend on the size of the file.
+
+    :return: The number of records and the errors of each chunk.
+    :rtype: Iterator[Tuple[int, List[Tuple[int, Dict[str, Any]]]]]
+
+    .. versionadded:: 0.10.0
+    """
+    if jobs <= 1:
+        _init_worker(validation)
+        for chunk in _chunks(records, chunk_size):
+            yield len(chunk), _validate_chunk(chunk, raw)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(validation,)) as executor:
+        pending: "deque[Tuple[int, Future[List[Tuple[int, Dict[str, Any]]]]]]" = deque()
+        for chunk in _chunks(records, chunk_size):
+            pending.append((len(chunk), executor.submit(_validate_chunk, chunk, raw)))
+            if len(pending) >= jobs * 2:
+                count, future = pending.popleft()
+                yield count, future.result()
+        while pending:
+            count, future = pending.popleft()
+            yield count, future.result()
+
+
+@cli.command("validate")
+@click.argument("endpoint")
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+@click.option("-j", "--jobs", type=int, default=None, help="Number of processes. Defaults to the number of CPUs.")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=1000, show_default=True, help="Records per task.")
+@click.option("--partial/--no-partial", default=None, help="Override the partial mode of the view.")
+@click.option("--collect-errors", is_flag=True, help="Report all the errors of each record.")
+@click.option("--max-errors", type=click.IntRange(min=1), default=100, show_default=True)
+@click.option("-o", "--output", type=click.File("w", encoding="utf-8"), default="-", help="Errors output file.")
+@click.option("-q", "--quiet", is_flag=True, help="Only print the summary.")
+def validate_command(
+    endpoint: str,
+    file: IO[str],
+    jobs: Optional[int],
+    chunk_size: int,
+    partial: Optional[bool],
+    collect_errors: bool,
+    max_errors: int,
+    output: IO[str],
+    quiet: bool,
+) -> None:
+    """Validate the records of FILE against the schema of the view ENDPOINT.
+
+    FILE is a NDJSON file (one JSON body per line) or a JSON array. Each record is validated like a request body
+    by the validate_params decorator of the view, and the invalid records are printed as NDJSON, with their line
+    number (or their index in the array) and the error in the format of the error responses.
+    The command exits with the status 1 if a record is invalid.
+    """
+    view = current_app.view_functions.get(endpoint)
+    if view is None:
+        raise click.BadParameter(f"No view is registered for the endpoint {endpoint!r}.", param_hint="ENDPOINT")
+    view_validation = getattr(view, "_flask_utils_validation", None)
+    if view_validation is None:
+        raise click.BadParameter(f"The view {endpoint!r} is not decorated with validate_params.", param_hint="ENDPOINT")
+
+    validator, view_partial = view_validation
+    validation: _Validation = (
+        validator,
+        view_partial if partial is None else partial,
+        max_errors if collect_errors else None,
+    )
+
+    records, raw = _read_records(file)
+    number_key = "line" if raw else "index"
+    total = invalid = 0
+    for count, errors in _validate_records(validation, records, raw, jobs or os.cpu_count() or 1, chunk_size):
+        total += count
+        invalid += len(errors)
+        if not quiet:
+            for number, error in errors:
+                output.write(json.dumps({number_key: number, **error}) + "\n")
+
+    click.echo(f"Validated {total} records: {total - invalid} valid, {invalid} invalid.", err=True)
+    if invalid:
+        raise click.exceptions.Exit(1)
+
+
+def _register_cli(application: Flask) -> None:
+    """
+    Register the ``flask flask-utils`` commands on the application:
+
+    * ``flask flask-utils validate ENDPOINT FILE`` validates a NDJSON file or a JSON array against the
+      :func:`~flask_utils.decorators.validate_params` schema of a view, offline and in parallel, to replay captured
+      traffic or migration data against a new schema before deploying it.
+
+    :param application: The Flask application to register the commands
+    :type application: flask.Flask
+
+    :return: None
+    :rtype: None
+
+    :Example:
+
+    .. code-block:: bash
+
+        flask flask-utils validate create_user captured_bodies.ndjson --jobs 8 > errors.ndjson
+        # Validated 1000000 records: 999982 valid, 18 invalid.
+
+    .. versionadded:: 0.10.0
+    """
+    application.cli.add_command(cli)
@@ -0,0 +1,176 @@
+import zlib
+from typing import Any
+from typing import Union
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+from flask import Flask
+from flask import Response
+from flask import request
+from flask import current_app
+
+DEFAULT_COMPRESS_MIMETYPES = [
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+    "text/xml",
+]
+
+# The ``wbits`` value to pass to zlib for each content coding.
+_ENCODINGS_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def _compress(data: bytes, encoding: str, level: int) -> bytes:
+    """Compress the data in one go with the given content coding.
+
+    :param data: The data to compress.
+    :type data: bytes
+    :param encoding: The content coding, ``gzip`` or ``deflate``.
+    :type encoding: str
+    :param level: The compression level, from 0 to 9.
+    :type level: int
+
+    :return: The compressed data.
+    :rtype: bytes
+
+    .. versionadded:: 0.10.0
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _ENCODINGS_WBITS[encoding])
+    return compressor.compress(data) + compressor.flush()
+
+
+def _compress_stream(iterable: Iterable[Union[str, bytes]], encoding: str, level: int) -> Iterator[bytes]:
+    """Compress a streamed response chunk by chunk.
+
+    Each chunk is flushed with :data:`zlib.Z_SYNC_FLUSH`, so that the client can decompress
+    what it has received so far without waiting for the end of the stream.
+
+    :param iterable: The chunks of the response.
+    :type iterable: Iterable[Union[str, bytes]]
+    :param encoding: The content coding, ``gzip`` or ``deflate``.
+    :type encoding: str
+    :param level: The compression level, from 0 to 9.
+    :type level: int
+
+    :return: An iterator over the compressed chunks.
+    :rtype: Iterator[bytes]
+
+    .. versionadded:: 0.10.0
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _ENCODINGS_WBITS[encoding])
+    try:
+        for chunk in iterable:
+            if not chunk:
+                continue
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        close = getattr(iterable, "close", None)
+        if close is not None:
+            close()
+
+
+def _choose_encoding() -> Optional[str]:
+    """Choose the content coding to use from the ``Accept-Encoding`` header of the request.
+
+    :return: ``gzip``, ``deflate`` or ``None`` if the client accepts neither.
+    :rtype: Optional[str]
+
+    .. versionadded:: 0.10.0
+    """
+    return request.accept_encodings.best_match(["gzip", "deflate"])
+
+
+def _compress_response(response: Response) -> Response:
+    """Compress the response if it is eligible. Registered as an ``after_request`` function.
+
+    :param response: The response to compress.
+    :type response: flask.Response
+
+    :return: The response, compressed or not.
+    :rtype: flask.Response
+
+    .. versionadded:: 0.10.0
+    """
+    config: Any = current_app.config
+    if response.mimetype not in config["FLASK_UTILS_COMPRESS_MIMETYPES"]:
+        return response
+
+    response.vary.add("Accept-Encoding")
+
+    if (
+        response.status_code < 200
+        or response.status_code in (204, 304)
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    streamed = response.is_streamed
+    if streamed and not config["FLASK_UTILS_COMPRESS_STREAMS"]:
+        return response
+    if not streamed and response.content_length is not None:
+        if response.content_length < config["FLASK_UTILS_COMPRESS_MIN_SIZE"]:
+            return response
+
+    encoding = _choose_encoding()
+    if encoding is None:
+        return response
+
+    level = config["FLASK_UTILS_COMPRESS_LEVEL"]
+    if streamed:
+        response.response = _compress_stream(response.response, encoding, level)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < config["FLASK_UTILS_COMPRESS_MIN_SIZE"]:
+            return response
+        response.set_data(_compress(data, encoding, level))
+
+    response.headers["Content-Encoding"] = encoding
+
+    # The compressed body is a different representation, it can't keep a strong ETag.
+    tag, weak = response.get_etag()
+    if tag is not None and not weak:
+        response.set_etag(tag, weak=True)
+
+    return response
+
+
+def _register_compression(application: Flask) -> None:
+    """
+    This function will register the response compression for the application.
+
+    The responses are compressed with ``gzip`` or ``deflate``, depending on the ``Accept-Encoding`` header
+    of the request. It is configured with the following keys of the application config:
+
+    * ``FLASK_UTILS_COMPRESS_MIN_SIZE``: Responses smaller than this number of bytes are not compressed,
+      which includes the error responses of this library. Defaults to ``500``.
+    * ``FLASK_UTILS_COMPRESS_MIMETYPES``: The mimetypes of the responses to compress.
+      Defaults to ``DEFAULT_COMPRESS_MIMETYPES``.
+    * ``FLASK_UTILS_COMPRESS_LEVEL``: The compression level, from 1 (fastest) to 9 (smallest). Defaults to ``6``.
+    * ``FLASK_UTILS_COMPRESS_STREAMS``: Also compress the streamed responses (for example from a generator),
+      chunk by chunk. Defaults to ``True``.
+
+    :param application: The Flask application to register the compression for.
+    :type application: flask.Flask
+
+    :return: None
+    :rtype: None
+
+    .. versionadded:: 0.10.0
+    """
+    application.config.setdefault("FLASK_UTILS_COMPRESS_MIN_SIZE", 500)
+    application.config.setdefault("FLASK_UTILS_COMPRESS_MIMETYPES", list(DEFAULT_COMPRESS_MIMETYPES))
+    application.config.setdefault("FLASK_UTILS_COMPRESS_LEVEL", 6)
+    application.config.setdefault("FLASK_UTILS_COMPRESS_STREAMS", True)
+
+    application.after_request(_compress_response)
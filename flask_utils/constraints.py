@@ -0,0 +1,210 @@
+import re
+from typing import Any
+from typing import Type
+from typing import Tuple
+from typing import Union
+from typing import Callable
+from typing import Optional
+
+
+class Constraint(object):
+    """
+    Base class of the constraints that can be added to the types of
+    :func:`~flask_utils.decorators.validate_params` with :data:`typing.Annotated`.
+
+    A constraint only applies to the values of its :attr:`types`: the type itself is checked by the
+    annotated type. The constraints are turned into plain Python expressions when the schema is compiled.
+
+    :Example:
+
+    .. code-block:: python
+
+        from typing import Annotated
+        from flask_utils import Range
+        from flask_utils import Pattern
+        from flask_utils import MaxLength
+        from flask_utils import MinLength
+        from flask_utils import validate_params
+
+        @app.route("/users", methods=["POST"])
+        @validate_params(
+            {
+                "username": Annotated[str, MinLength(3), MaxLength(32), Pattern(r"[a-z0-9_]+")],
+                "age": Annotated[int, Range(min=13, max=130)],
+            }
+        )
+        def create_user():
+            ...
+
+    .. versionadded:: 0.10.0
+    """
+
+    #: The types of the values the constraint applies to.
+    types: Tuple[Type[Any], ...] = ()
+
+    def __call__(self, value: Any) -> bool:
+        """
+        :param value: The value to check.
+        :type value: Any
+
+        :return: ``True`` if the value satisfies the constraint, or is not one of its :attr:`types`.
+        :rtype: bool
+        """
+        return not isinstance(value, self.types) or self._check(value)
+
+    def _check(self, value: Any) -> bool:
+        raise NotImplementedError
+
+    def _source(self, var: str, constant: Callable[[Any], str]) -> str:
+        """Generate the expression checking the value in ``var``, for the schema compiler.
+
+        :param var: The name of the variable holding the value.
+        :type var: str
+        :param constant: Function storing a constant for the expression, and returning its name.
+        :type constant: Callable[[Any], str]
+
+        :return: The Python expression.
+        :rtype: str
+        """
+        return f"{constant(self)}._check({var})"
+
+    def describe(self) -> str:
+        """
+        :return: The description of the constraint, used in the error messages.
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def _key(self) -> Tuple[Any, ...]:
+        """
+        :return: The arguments of the constraint. Two constraints of the same class with the same
+            arguments are equal, so that the identical schemas share their compiled validator.
+        :rtype: Tuple[Any, ...]
+        """
+        return tuple(self.__dict__.values())
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Constraint) and type(other) is type(self) and other._key() == self._key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._key()))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.describe()})"
+
+
+class MinLength(Constraint):
+    """
+    The minimum length of a string, a list or a dict.
+
+    :param length: The minimum length.
+    :type length: int
+
+    .. versionadded:: 0.10.0
+    """
+
+    types = (str, list, dict)
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+    def _check(self, value: Any) -> bool:
+        return len(value) >= self.length
+
+    def _source(self, var: str, constant: Callable[[Any], str]) -> str:
+        return f"len({var}) >= {self.length!r}"
+
+    def describe(self) -> str:
+        return f"min length {self.length}"
+
+
+class MaxLength(Constraint):
+    """
+    The maximum length of a string, a list or a dict.
+
+    :param length: The maximum length.
+    :type length: int
+
+    .. versionadded:: 0.10.0
+    """
+
+    types = (str, list, dict)
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+
+    def _check(self, value: Any) -> bool:
+        return len(value) <= self.length
+
+    def _source(self, var: str, constant: Callable[[Any], str]) -> str:
+        return f"len({var}) <= {self.length!r}"
+
+    def describe(self) -> str:
+        return f"max length {self.length}"
+
+
+class Range(Constraint):
+    """
+    The range of a number, bounds included.
+
+    :param min: The minimum value. Defaults to ``None`` (no minimum).
+    :type min: Optional[Union[int, float]]
+    :param max: The maximum value. Defaults to ``None`` (no maximum).
+    :type max: Optional[Union[int, float]]
+
+    .. versionadded:: 0.10.0
+    """
+
+    types = (int, float)
+
+    def __init__(self, min: Optional[Union[int, float]] = None, max: Optional[Union[int, float]] = None) -> None:
+        self.min = min
+        self.max = max
+
+    def _check(self, value: Any) -> bool:
+        return (self.min is None or value >= self.min) and (self.max is None or value <= self.max)
+
+    def _source(self, var: str, constant: Callable[[Any], str]) -> str:
+        checks = []
+        if self.min is not None:
+            checks.append(f"{var} >= {constant(self.min)}")
+        if self.max is not None:
+            checks.append(f"{var} <= {constant(self.max)}")
+        return f"({' and '.join(checks)})" if checks else "True"
+
+    def describe(self) -> str:
+        if self.max is None:
+            return f"min {self.min}"
+        if self.min is None:
+            return f"max {self.max}"
+        return f"between {self.min} and {self.max}"
+
+
+class Pattern(Constraint):
+    """
+    A regular expression the whole string must match. It is compiled once, when the constraint is created.
+
+    :param pattern: The regular expression.
+    :type pattern: str
+    :param flags: The flags of the regular expression, like :data:`re.IGNORECASE`. Defaults to ``0``.
+    :type flags: int
+
+    .. versionadded:: 0.10.0
+    """
+
+    types = (str,)
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        self.regex = re.compile(pattern, flags)
+
+    def _key(self) -> Tuple[Any, ...]:
+        return self.regex.pattern, self.regex.flags
+
+    def _check(self, value: Any) -> bool:
+        return self.regex.fullmatch(value) is not None
+
+    def _source(self, var: str, constant: Callable[[Any], str]) -> str:
+        return f"{constant(self.regex.fullmatch)}({var}) is not None"
+
+    def describe(self) -> str:
+        return f"matching {self.regex.pattern!r}"
@@ -0,0 +1,196 @@
+import math
+import time
+import inspect
+from typing import Callable
+from typing import Optional
+from functools import wraps
+
+from flask import Flask
+from flask import g
+from flask import request
+from flask import current_app
+from flask import has_request_context
+
+from flask_utils.errors import ServiceUnavailableError
+
+
+def _set_deadline(budget: float, start: Optional[float] = None) -> None:
+    """Set the deadline of the current request, keeping the earliest one if there is already one.
+
+    :param budget: The time budget, in seconds.
+    :type budget: float
+    :param start: The time the budget starts from (from :func:`time.monotonic`). Defaults to now.
+    :type start: Optional[float]
+
+    .. versionadded:: 0.10.0
+    """
+    new_deadline = (start if start is not None else time.monotonic()) + budget
+    current_deadline = g.get("_flask_utils_deadline")
+    if current_deadline is None or new_deadline < current_deadline:
+        g._flask_utils_deadline = new_deadline
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Get the time left before the deadline of the current request.
+
+    :return: The number of seconds left, negative if the deadline has passed,
+        or ``None`` if the request has no deadline (or if there is no request).
+    :rtype: Optional[float]
+
+    :Example:
+
+    .. code-block:: python
+
+        import requests
+        from flask_utils import remaining_time
+
+        @app.route("/profile")
+        def profile():
+            timeout = remaining_time() or 5
+            return requests.get("http://users/me", timeout=timeout).json()
+
+    .. versionadded:: 0.10.0
+    """
+    if not has_request_context():
+        return None
+    request_deadline: Optional[float] = g.get("_flask_utils_deadline")
+    if request_deadline is None:
+        return None
+    return request_deadline - time.monotonic()
+
+
+def deadline_exceeded() -> bool:
+    """
+    :return: ``True`` if the current request has a deadline and it has passed.
+    :rtype: bool
+
+    .. versionadded:: 0.10.0
+    """
+    remaining = remaining_time()
+    return remaining is not None and remaining <= 0
+
+
+def check_deadline() -> None:
+    """
+    Stop the current request if its deadline has passed.
+
+    :raises ServiceUnavailableError: If the deadline of the current request has passed.
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils import check_deadline
+
+        @app.route("/report")
+        def report():
+            for section in sections:
+                check_deadline()
+                ...
+
+    .. versionadded:: 0.10.0
+    """
+    if deadline_exceeded():
+        raise ServiceUnavailableError("The request deadline has been exceeded.")
+
+
+def deadline(budget: float) -> Callable:  # type: ignore
+    """
+    Decorator setting the default time budget of a route.
+
+    The budget starts when the request is received if the deadlines are enabled on the
+    :class:`~flask_utils.extension.FlaskUtils` extension, otherwise when the view is called.
+    If the client sent an earlier deadline, it is kept.
+
+    :param budget: The time budget, in seconds.
+    :type budget: float
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils import deadline
+
+        @app.route("/search")
+        @deadline(0.5)
+        def search():
+            ...
+
+    .. versionadded:: 0.10.0
+    """
+
+    def decorator(fn):  # type: ignore
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):  # type: ignore
+                _set_deadline(budget, g.get("_flask_utils_request_start"))
+                return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):  # type: ignore
+            _set_deadline(budget, g.get("_flask_utils_request_start"))
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _read_deadline_header() -> None:
+    """Set the deadline of the request from its header, or from the default budget.
+    Registered as a ``before_request`` function.
+
+    .. versionadded:: 0.10.0
+    """
+    start = time.monotonic()
+    g._flask_utils_request_start = start
+
+    budget = current_app.config["FLASK_UTILS_DEFAULT_DEADLINE"]
+    header = request.headers.get(current_app.config["FLASK_UTILS_DEADLINE_HEADER"])
+    if header:
+        try:
+            header_budget = float(header) / 1000
+        except ValueError:
+            pass
+        else:
+            # A NaN or infinite deadline would never pass, letting the clients disable the default one
+            if math.isfinite(header_budget):
+                budget = header_budget
+
+    if budget is not None:
+        _set_deadline(budget, start)
+
+
+def _register_deadlines(application: Flask) -> None:
+    """
+    This function will enable the request deadlines for the application.
+
+    The deadline of each request is read from a header containing the remaining time budget of the caller,
+    in milliseconds, and can be shortened per route with :func:`deadline`. It is configured with the following
+    keys of the application config:
+
+    * ``FLASK_UTILS_DEADLINE_HEADER``: The name of the header. Defaults to ``X-Request-Timeout``.
+    * ``FLASK_UTILS_DEFAULT_DEADLINE``: The time budget of the requests, in seconds, when the header is missing
+      or invalid. Defaults to ``None`` (no deadline).
+
+    The views can check the deadline with :func:`remaining_time`, :func:`deadline_exceeded` and
+    :func:`check_deadline`. The :func:`~flask_utils.decorators.validate_params` decorator and the
+    :class:`~flask_utils.circuit_breaker.CircuitBreaker` stop the request with a
+    :class:`~flask_utils.errors.ServiceUnavailableError` once it has passed.
+
+    :param application: The Flask application to enable the deadlines for.
+    :type application: flask.Flask
+
+    :return: None
+    :rtype: None
+
+    .. versionadded:: 0.10.0
+    """
+    application.config.setdefault("FLASK_UTILS_DEADLINE_HEADER", "X-Request-Timeout")
+    application.config.setdefault("FLASK_UTILS_DEFAULT_DEADLINE", None)
+
+    application.before_request(_read_deadline_header)
@@ -0,0 +1,159 @@
+import io
+import zlib
+from typing import Any
+from typing import List
+from typing import Optional
+
+from flask import Flask
+from flask import Response
+from flask import request
+from flask import current_app
+from werkzeug.wsgi import get_input_stream
+
+from flask_utils.errors import BadRequestError
+from flask_utils.errors import _generate_error_response
+
+# The ``wbits`` value to pass to zlib for each content coding.
+_ENCODINGS_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "x-gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+# Size of the chunks read from the compressed body.
+_READ_CHUNK_SIZE = 64 * 1024
+
+# The compression ratio is only enforced above this decompressed size,
+# so that small and very repetitive bodies are still accepted.
+_RATIO_MIN_SIZE = 64 * 1024
+
+
+class _DecompressionError(Exception):
+    """Raised when the request body can't be decompressed safely.
+
+    .. versionadded:: 0.10.0
+    """
+
+
+def _decompress_stream(stream: Any, wbits: int, max_size: int, max_ratio: float) -> bytes:
+    """Decompress a stream chunk by chunk, enforcing the size and ratio limits as it goes.
+
+    At most ``max_size`` bytes (plus one chunk) are held in memory, whatever the size of the body
+    once decompressed.
+
+    :param stream: The stream containing the compressed data.
+    :type stream: Any
+    :param wbits: The ``wbits`` parameter of :func:`zlib.decompressobj`.
+    :type wbits: int
+    :param max_size: The maximum size of the decompressed data, in bytes.
+    :type max_size: int
+    :param max_ratio: The maximum ratio between the decompressed and the compressed sizes.
+    :type max_ratio: float
+
+    :raises _DecompressionError: If a limit is exceeded or the data is not valid.
+
+    :return: The decompressed data.
+    :rtype: bytes
+
+    .. versionadded:: 0.10.0
+    """
+    decompressor = zlib.decompressobj(wbits)
+    chunks: List[bytes] = []
+    compressed_size = 0
+    decompressed_size = 0
+
+    try:
+        while not decompressor.eof:
+            data = stream.read(_READ_CHUNK_SIZE)
+            if not data:
+                break
+            compressed_size += len(data)
+            while data and not decompressor.eof:
+                chunk = decompressor.decompress(data, max_size - decompressed_size + 1)
+                decompressed_size += len(chunk)
+                if decompressed_size > max_size:
+                    raise _DecompressionError(f"The decompressed body is bigger than {max_size} bytes.")
+                if decompressed_size > _RATIO_MIN_SIZE and decompressed_size > max_ratio * compressed_size:
+                    raise _DecompressionError(f"The compression ratio of the body is higher than {max_ratio}.")
+                chunks.append(chunk)
+                data = decompressor.unconsumed_tail
+        chunk = decompressor.flush()
+        if decompressed_size + len(chunk) > max_size:
+            raise _DecompressionError(f"The decompressed body is bigger than {max_size} bytes.")
+        chunks.append(chunk)
+    except zlib.error as e:
+        raise _DecompressionError("The compressed body is invalid.") from e
+
+    if not decompressor.eof:
+        raise _DecompressionError("The compressed body is truncated.")
+
+    return b"".join(chunks)
+
+
+def _decompress_request() -> Optional[Response]:
+    """Decompress the body of the request if it has a ``Content-Encoding``.
+    Registered as a ``before_request`` function.
+
+    The decompressed body replaces the original one in the WSGI environ, so that
+    :func:`~flask_utils.decorators.validate_params` and :meth:`flask.Request.get_json` read it transparently.
+
+    :return: ``None``, or a 400 response if the body can't be decompressed safely.
+    :rtype: Optional[flask.Response]
+
+    .. versionadded:: 0.10.0
+    """
+    encoding = request.headers.get("Content-Encoding", "").strip().lower()
+    if not encoding or encoding == "identity":
+        return None
+
+    wbits = _ENCODINGS_WBITS.get(encoding)
+    if wbits is None:
+        return _generate_error_response(
+            BadRequestError(
+                f"Unsupported Content-Encoding: {encoding}.",
+                f"Supported encodings are: {sorted(_ENCODINGS_WBITS)}",
+            )
+        )
+
+    environ = request.environ
+    try:
+        body = _decompress_stream(
+            get_input_stream(environ),
+            wbits,
+            current_app.config["FLASK_UTILS_DECOMPRESS_MAX_SIZE"],
+            current_app.config["FLASK_UTILS_DECOMPRESS_MAX_RATIO"],
+        )
+    except _DecompressionError as e:
+        return _generate_error_response(BadRequestError(str(e), "Send a smaller or uncompressed body."))
+
+    environ["wsgi.input"] = io.BytesIO(body)
+    environ["CONTENT_LENGTH"] = str(len(body))
+    environ.pop("HTTP_CONTENT_ENCODING", None)
+    environ.pop("HTTP_TRANSFER_ENCODING", None)
+    environ["wsgi.input_terminated"] = False
+    return None
+
+
+def _register_decompression(application: Flask) -> None:
+    """
+    This function will register the request body decompression for the application.
+
+    Request bodies sent with a ``Content-Encoding: gzip`` or ``Content-Encoding: deflate`` header are
+    decompressed as a stream before the view (and :func:`~flask_utils.decorators.validate_params`) runs.
+    To protect against decompression bombs, the body is rejected with a
+    :class:`~flask_utils.errors.BadRequestError` as soon as a limit is exceeded. The limits are configured
+    with the following keys of the application config:
+
+    * ``FLASK_UTILS_DECOMPRESS_MAX_SIZE``: The maximum size of the decompressed body, in bytes.
+      Defaults to ``10485760`` (10 MiB).
+    * ``FLASK_UTILS_DECOMPRESS_MAX_RATIO``: The maximum ratio between the decompressed and the compressed sizes.
+      It is only enforced on bodies bigger than 64 KiB once decompressed. Defaults to ``100``.
+
+    :param application: The Flask application to register the decompression for.
+    :type application: flask.Flask
+
+    :return: None
+    :rtype: None
+
+    .. versionadded:: 0.10.0
+    """
+    application.config.setdefault("FLASK_UTILS_DECOMPRESS_MAX_SIZE", 10 * 1024 * 1024)
+    application.config.setdefault("FLASK_UTILS_DECOMPRESS_MAX_RATIO", 100)
+
+    application.before_request(_decompress_request)
@@ -1,12 +1,22 @@
+import time
+import asyncio
+import hashlib
+import inspect
+import threading
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Type
+from typing import Tuple
 from typing import Union
 from typing import Callable
 from typing import Optional
+from typing import FrozenSet
 from typing import get_args
 from typing import get_origin
 from functools import wraps
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
 
 from flask import Response
 from flask import jsonify
@@ -16,49 +26,86 @@ from flask import make_response
 from werkzeug.exceptions import BadRequest
 from werkzeug.exceptions import UnsupportedMediaType
 
+from flask_utils._cache import _LRUCache
 from flask_utils.errors import BadRequestError
+from flask_utils.errors import ServiceUnavailableError
+from flask_utils.deadline import deadline_exceeded
+from flask_utils.sampling import SlowValidationSampler
+from flask_utils._compiler import _is_member
+from flask_utils._compiler import _get_members
+from flask_utils._compiler import _is_optional
+from flask_utils._compiler import _get_validator
+from flask_utils._compiler import _get_constraints
+from flask_utils._compiler import _SchemaValidator
+from flask_utils._compiler import _is_variadic_tuple
 
 VALIDATE_PARAMS_MAX_DEPTH = 4
+VALIDATION_CACHE_MAX_BODY_SIZE = 64 * 1024
+
+_MISSING = object()
+
+#: The signature of the validation hooks: ``hook(phase, start, end)``, see :class:`~flask_utils.extension.FlaskUtils`.
+ValidationHook = Callable[[str, int, int], None]
+
+_offload_executor: Optional[Executor] = None
+_offload_executor_lock = threading.Lock()
 
 
 def _handle_bad_request(
     use_error_handlers: bool,
     message: str,
     solution: Optional[str] = None,
+    errors: Optional[List[Dict[str, Any]]] = None,
     status_code: int = 400,
     original_exception: Optional[Exception] = None,
 ) -> Response:
     if use_error_handlers:
-        raise BadRequestError(message, solution) from original_exception
+        raise BadRequestError(message, solution, errors) from original_exception
     else:
-        error_response = {"error": message}
+        error_response: Dict[str, Any] = {"error": message}
         if solution:
             error_response["solution"] = solution
+        if errors is not None:
+            error_response["errors"] = errors
         return make_response(jsonify(error_response), status_code)
 
 
-def _is_optional(type_hint: Type) -> bool:  # type: ignore
-    """Check if the type hint is :data:`~typing.Optional`.
+def _handle_deadline_exceeded(use_error_handlers: bool) -> Response:
+    """Stop a request whose deadline has passed, without reading nor validating its body.
 
-    :param type_hint: Type hint to check.
-    :type type_hint: Type
+    :param use_error_handlers: Raise a :class:`~flask_utils.errors.ServiceUnavailableError`
+        instead of returning the response.
+    :type use_error_handlers: bool
 
-    :return: True if the type hint is :data:`~typing.Optional`, False otherwise.
-    :rtype: bool
+    :return: A 503 response.
+    :rtype: flask.Response
 
-    :Example:
+    .. versionadded:: 0.10.0
+    """
+    message = "The request deadline has been exceeded."
+    if use_error_handlers:
+        raise ServiceUnavailableError(message)
+    return make_response(jsonify({"error": message}), 503)
 
-    .. code-block:: python
 
-        from typing import Optional
-        from flask_utils.decorators import _is_optional
+def _get_offload_executor() -> Executor:
+    """Return the thread pool shared by every :func:`validate_params` decorated async view.
 
-        _is_optional(Optional[str])  # True
-        _is_optional(str)  # False
+    The pool is created lazily the first time a payload goes over the ``offload_threshold``
+    of a decorated view and is reused afterwards, so that a new event loop (Flask creates one per
+    async request) does not spin up and tear down its own threads.
 
-    .. versionadded:: 0.2.0
+    :return: The shared executor.
+    :rtype: concurrent.futures.Executor
+
+    .. versionadded:: 0.10.0
     """
-    return get_origin(type_hint) is Union and type(None) in get_args(type_hint)
+    global _offload_executor
+    if _offload_executor is None:
+        with _offload_executor_lock:
+            if _offload_executor is None:
+                _offload_executor = ThreadPoolExecutor(thread_name_prefix="flask_utils_validation")
+    return _offload_executor
 
 
 def _make_optional(type_hint: Type) -> Type:  # type: ignore
@@ -167,6 +214,22 @@ def _check_type(value: Any, expected_type: Type, allow_empty: bool = False, curr
                     _check_type([{"name": "Jules", "city": "Rouen"},
                         {"name": "John", "city": 42}], List[Dict[str, str]])  # False
 
+    ``Literal`` and ``Enum`` values are checked by membership, ``Tuple`` and ``Set`` values are JSON arrays,
+    and the :class:`~flask_utils.constraints.Constraint` of an ``Annotated`` type are checked after its type:
+
+    .. code-block:: python
+
+                    from typing import Tuple, Literal, Annotated
+                    from flask_utils import MinLength
+                    from flask_utils.decorators import _check_type
+
+                    _check_type("asc", Literal["asc", "desc"])  # True
+                    _check_type([48.8, 2.3], Tuple[float, float])  # True
+                    _check_type("ab", Annotated[str, MinLength(3)])  # False
+
+    .. versionchanged:: 0.10.0
+        Added the support of ``Literal``, ``Enum``, ``Tuple``, ``Set`` and ``Annotated``.
+
     .. versionadded:: 0.2.0
     """
 
@@ -175,6 +238,16 @@ def _check_type(value: Any, expected_type: Type, allow_empty: bool = False, curr
     if expected_type is Any or _is_allow_empty(value, expected_type, allow_empty):  # type: ignore
         return True
 
+    constraints = _get_constraints(expected_type)
+    if constraints is not None:
+        return _check_type(value, expected_type.__origin__, allow_empty, curr_depth) and all(
+            constraint(value) for constraint in constraints
+        )
+
+    members = _get_members(expected_type)
+    if members is not None:
+        return _is_member(value, members)
+
     if isinstance(value, bool):
         if expected_type is bool or expected_type is Optional[bool]:  # type: ignore
             return True
@@ -201,13 +274,195 @@ def _check_type(value: Any, expected_type: Type, allow_empty: bool = False, curr
             if not _check_type(v, val_type, allow_empty, (curr_depth + 1)):
                 return False
         return True
+    elif origin is tuple and args and not _is_variadic_tuple(args):
+        return (
+            isinstance(value, (list, tuple))
+            and len(value) == len(args)
+            and all(_check_type(item, arg, allow_empty, (curr_depth + 1)) for item, arg in zip(value, args))
+        )
+    elif origin in (tuple, set, frozenset):
+        # JSON has no tuples nor sets: they are sent as arrays.
+        if not isinstance(value, (list, tuple) if origin is tuple else list):
+            return False
+        return not args or all(_check_type(item, args[0], allow_empty, (curr_depth + 1)) for item in value)
     else:
         return isinstance(value, expected_type)
 
 
+def _get_json_body(use_error_handlers: bool) -> Tuple[Any, Optional[Response]]:
+    """Load the JSON body of the current request.
+
+    :param use_error_handlers: Whether to raise :class:`~flask_utils.errors.BadRequestError`
+        instead of returning the error response.
+    :type use_error_handlers: bool
+
+    :return: A tuple containing the loaded JSON body and the error response if the body could not be loaded.
+    :rtype: Tuple[Any, Optional[flask.Response]]
+
+    .. versionadded:: 0.10.0
+    """
+    try:
+        return request.get_json(), None
+    except BadRequest as e:
+        return None, _handle_bad_request(use_error_handlers, "The Json Body is malformed.", original_exception=e)
+    except UnsupportedMediaType as e:
+        return None, _handle_bad_request(
+            use_error_handlers,
+            "The Content-Type header is missing or is not set to application/json, or the JSON body is missing.",
+            original_exception=e,
+        )
+
+
+def _trace(hook: ValidationHook, phase: str, start: int) -> int:
+    """Report a phase of the validation to the hook.
+
+    :param hook: The validation hook of the extension.
+    :type hook: ValidationHook
+    :param phase: The name of the phase.
+    :type phase: str
+    :param start: The start of the phase, from :func:`time.time_ns`.
+    :type start: int
+
+    :return: The end of the phase, to use as the start of the next one.
+    :rtype: int
+
+    .. versionadded:: 0.10.0
+    """
+    end = time.time_ns()
+    hook(phase, start, end)
+    return end
+
+
+def _get_json_body_traced(hook: ValidationHook, use_error_handlers: bool) -> Tuple[Any, Optional[Response]]:
+    """Same as :func:`_get_json_body`, reporting the ``body_read`` and ``json_parse`` phases to the hook.
+
+    .. versionadded:: 0.10.0
+    """
+    start = time.time_ns()
+    request.get_data(cache=True)
+    start = _trace(hook, "body_read", start)
+    try:
+        return _get_json_body(use_error_handlers)
+    finally:
+        _trace(hook, "json_parse", start)
+
+
+def _validate_data_traced(
+    hook: ValidationHook, data: Any, validator: _SchemaValidator, partial: bool, max_errors: Optional[int]
+) -> Optional[Tuple[Any, ...]]:
+    """Same as :func:`_validate_data`, reporting the ``key_check`` and ``type_check`` phases to the hook.
+
+    When collecting the errors, the keys and the types are checked together, and reported as ``type_check``.
+
+    .. versionadded:: 0.10.0
+    """
+    start = time.time_ns()
+    if max_errors is not None:
+        errors = validator.collect(data, partial, max_errors)
+        _trace(hook, "type_check", start)
+        return errors
+
+    error = validator.check_keys(data, partial)
+    start = _trace(hook, "key_check", start)
+    if error is None:
+        error = validator.check_types(data)
+        _trace(hook, "type_check", start)
+    return error
+
+
+def _handle_bad_request_traced(hook: ValidationHook, use_error_handlers: bool, *error: Any) -> Response:
+    """Same as :func:`_handle_bad_request`, reporting the ``error_render`` phase to the hook.
+
+    .. versionadded:: 0.10.0
+    """
+    start = time.time_ns()
+    try:
+        return _handle_bad_request(use_error_handlers, *error)
+    finally:
+        _trace(hook, "error_render", start)
+
+
+def _strip_unknown_keys(data: Dict[Any, Any], expected_keys: FrozenSet[Any]) -> None:
+    """Remove the keys which are not in ``expected_keys`` from the JSON body of the current request.
+
+    The body is the one cached by :meth:`flask.Request.get_json`, so the view gets the same plain dict,
+    without the unknown keys. Only the top level is filtered: nothing is copied.
+
+    :param data: The loaded and validated JSON body.
+    :type data: Dict[Any, Any]
+    :param expected_keys: The keys of the schema.
+    :type expected_keys: FrozenSet[Any]
+
+    .. versionadded:: 0.10.0
+    """
+    if data.keys() <= expected_keys:
+        return
+    for key in [key for key in data if key not in expected_keys]:
+        del data[key]
+
+
+def _validate_data(
+    data: Any,
+    parameters: Union[Dict[Any, Any], _SchemaValidator],
+    allow_empty: bool,
+    partial: bool = False,
+    max_errors: Optional[int] = None,
+) -> Optional[Tuple[Any, ...]]:
+    """Validate an already loaded JSON body against the parameters of :func:`validate_params`.
+
+    This function doesn't need a request context, so it can run in a worker thread or
+    in a worker process.
+
+    :param data: The loaded JSON body.
+    :type data: Any
+    :param parameters: Dictionary of parameters to validate, or the schema already compiled by
+        :func:`validate_params`.
+    :type parameters: Union[Dict[Any, Any], flask_utils._compiler._SchemaValidator]
+    :param allow_empty: Allow empty values for parameters.
+    :type allow_empty: bool
+    :param partial: Only check the keys present in the body, without requiring any key.
+    :type partial: bool
+    :param max_errors: Collect up to ``max_errors`` errors instead of stopping at the first one.
+        Defaults to ``None`` (stop at the first error).
+    :type max_errors: Optional[int]
+
+    :return: ``None`` if the data is valid, otherwise a tuple containing the error message and the solution,
+        and the list of the errors if ``max_errors`` is set.
+    :rtype: Optional[Tuple[Any, ...]]
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils.decorators import _validate_data
+
+        _validate_data({"name": "Jules"}, {"name": str}, False)  # None
+        _validate_data({"name": 42}, {"name": str}, False)  # ("Wrong type for key name.", "It should be str")
+        _validate_data({"age": 42}, {"name": str, "age": int}, False, partial=True)  # None
+
+    The checks are done by a :class:`~flask_utils._compiler._SchemaValidator`, compiled from ``parameters``
+    if they are not compiled yet (see :func:`~flask_utils._compiler._get_validator`).
+
+    .. versionadded:: 0.10.0
+    """
+    if not isinstance(parameters, _SchemaValidator):
+        parameters = _get_validator(parameters, allow_empty, VALIDATE_PARAMS_MAX_DEPTH)
+    if max_errors is not None:
+        return parameters.collect(data, partial, max_errors)
+    return parameters.validate(data, partial)
+
+
 def validate_params(
     parameters: Dict[Any, Any],
     allow_empty: bool = False,
+    offload_threshold: Optional[int] = None,
+    offload_executor: Optional[Executor] = None,
+    cache_size: Optional[int] = None,
+    partial: bool = False,
+    collect_errors: bool = False,
+    max_errors: int = 100,
+    adaptive_order: bool = False,
+    unknown_keys: str = "reject",
 ) -> Callable:  # type: ignore
     """
     Decorator to validate request JSON body parameters.
@@ -220,10 +475,58 @@ def validate_params(
     :type parameters: Dict[Any, Any]
     :param allow_empty: Allow empty values for parameters. Defaults to False.
     :type allow_empty: bool
+    :param offload_threshold: Only used on ``async def`` views. Size in bytes of the request body
+        from which the validation is run in ``offload_executor`` instead of on the event loop.
+        Smaller bodies are still validated inline. Defaults to ``None`` (never offload).
+    :type offload_threshold: Optional[int]
+    :param offload_executor: The executor used to validate the bodies over ``offload_threshold``.
+        Defaults to a thread pool shared by all the decorated views. Pass a
+        :class:`~concurrent.futures.ProcessPoolExecutor` to run the validation outside of
+        the GIL, in which case the types in ``parameters`` must be picklable.
+    :type offload_executor: Optional[concurrent.futures.Executor]
+    :param cache_size: Number of validation results to keep in a LRU cache keyed by a hash
+        of the raw request body. Byte-identical bodies then skip the type checks entirely.
+        Bodies bigger than ``VALIDATION_CACHE_MAX_BODY_SIZE`` (64 KiB) are never cached.
+        Defaults to ``None`` (no cache).
+    :type cache_size: Optional[int]
+    :param partial: Only check the keys present in the body, for ``PATCH`` routes: no key is required,
+        but the keys present must have the right type (a key typed ``str`` still rejects ``None``).
+        The cost of the validation then depends on the size of the body, not of the schema.
+        Defaults to ``False``.
+    :type partial: bool
+    :param collect_errors: Report all the errors of the body at once instead of the first one. Each error has
+        a ``path`` pointing into the nested lists and dicts, like ``courses[3]`` or ``grades.math``, a ``message``
+        and a ``solution``. They are sent in the ``errors`` list of the
+        :class:`~flask_utils.errors.BadRequestError`. Defaults to ``False``.
+    :type collect_errors: bool
+    :param max_errors: The maximum number of errors reported when ``collect_errors`` is ``True``.
+        Defaults to ``100``.
+    :type max_errors: int
+    :param adaptive_order: Check the types of the keys in an order learned from the traffic, instead of the order
+        of the body: the failures of each key are counted, and the keys failing the most often with the cheapest
+        checks are checked first, so that rejecting the bad bodies of a misbehaving client costs less.
+        The valid bodies are checked as before. When several keys of a body have a wrong type, the reported key
+        may differ from the first one of the body; when only one key is wrong, the error is the same.
+        Ignored when ``collect_errors`` is ``True``. Defaults to ``False``.
+    :type adaptive_order: bool
+    :param unknown_keys: What to do with the keys of the body which are not in ``parameters``:
+        ``"reject"`` the body with an ``Unexpected key`` error, ``"ignore"`` them (the body is not even
+        scanned for them), or ``"strip"`` them: they are removed from the body returned to the view by
+        :meth:`flask.Request.get_json`. The body is filtered in place, nothing is copied.
+        Defaults to ``"reject"``.
+    :type unknown_keys: str
 
     :raises BadRequestError: If the JSON body is malformed,
         the Content-Type header is missing or incorrect, required parameters are missing,
         or parameters are of the wrong type.
+    :raises ServiceUnavailableError: If the deadline of the request has passed
+        (see :func:`~flask_utils.deadline.deadline`). The body is then neither read nor validated.
+    :raises ValueError: If ``unknown_keys`` is not ``"reject"``, ``"ignore"`` or ``"strip"``,
+        or if ``max_errors`` is lower than ``1``.
+
+    The phases of the validation can be timed with the ``validation_hook`` of the
+    :class:`~flask_utils.extension.FlaskUtils` extension, and the slow validations recorded with its
+    ``slow_validation_sampler`` (see :class:`~flask_utils.sampling.SlowValidationSampler`).
 
     :Example:
 
@@ -258,6 +561,32 @@ def validate_params(
             data = request.get_json()
             return data
 
+    It also works with ``async def`` views. Big bodies can be validated in a worker
+    so that they don't block the event loop:
+
+    .. code-block:: python
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        @app.route("/import", methods=["POST"])
+        @validate_params(
+            {"rows": List[Dict[str, int]]},
+            offload_threshold=1024 * 1024,
+            offload_executor=ProcessPoolExecutor(max_workers=2),
+        )
+        async def import_rows():
+            ...
+
+    Endpoints receiving the same payloads over and over (webhooks, retries, polling agents)
+    can cache the validation results:
+
+    .. code-block:: python
+
+        @app.route("/webhook", methods=["POST"])
+        @validate_params({"event": str, "payload": Dict[str, Any]}, cache_size=1024)
+        def webhook():
+            ...
+
     .. tip::
         You can use any of the following types:
             * str
@@ -270,6 +599,51 @@ def validate_params(
             * Optional
             * Union
 
+    ``PATCH`` routes can validate only the keys sent by the client:
+
+    .. code-block:: python
+
+        @app.route("/users/<int:user_id>", methods=["PATCH"])
+        @validate_params({"name": str, "email": str, "age": int, "bio": Optional[str]}, partial=True)
+        def update_user(user_id):
+            ...
+
+    Forms can report all their errors at once:
+
+    .. code-block:: python
+
+        @app.route("/students", methods=["POST"])
+        @validate_params({"name": str, "courses": List[str], "grades": Dict[str, int]}, collect_errors=True)
+        def create_student():
+            ...
+
+        # {"name": "Jules", "courses": ["math", 3], "grades": {"math": "A"}} is rejected with:
+        # "errors": [
+        #     {"path": "courses[1]", "message": "Wrong type for key courses[1].", "solution": "It should be str"},
+        #     {"path": "grades.math", "message": "Wrong type for key grades.math.", "solution": "It should be int"}
+        # ]
+
+    The extra keys sent by some clients can be dropped instead of rejected:
+
+    .. code-block:: python
+
+        @app.route("/events", methods=["POST"])
+        @validate_params({"name": str, "timestamp": int}, unknown_keys="strip")
+        def create_event():
+            data = request.get_json()  # {"name": ..., "timestamp": ...} without the telemetry keys
+            ...
+
+    .. versionchanged:: 0.10.0
+        Added the ``offload_threshold`` and ``offload_executor`` parameters for ``async def`` views,
+        and the ``cache_size``, ``partial``, ``collect_errors``, ``max_errors``, ``adaptive_order``
+        and ``unknown_keys`` parameters.
+        The requests whose deadline has passed are rejected with a 503 error before their body is read.
+        The schema is compiled once, when the view is decorated, and the views with identical schemas
+        share the compiled schema. Set the ``FLASK_UTILS_VALIDATOR_CACHE`` environment variable to a directory
+        to keep the compiled schemas on disk between the processes (see :func:`~flask_utils._compiler._load_code`).
+        The compiled schema is kept on the view, so that files of bodies can be validated offline against it
+        with the ``flask flask-utils validate`` command (see :func:`~flask_utils.cli._register_cli`).
+
     .. versionchanged:: 0.7.0
         The decorator will now use the custom error handlers if ``register_error_handlers`` has been set to ``True``
         when initializing the :class:`~flask_utils.extension.FlaskUtils` extension.
@@ -277,54 +651,133 @@ def validate_params(
     .. versionadded:: 0.2.0
     """
 
+    def _get_settings() -> Tuple[bool, Optional[ValidationHook], Optional[SlowValidationSampler]]:
+        extension = current_app.extensions.get("flask_utils")
+        if extension is None:
+            return False, None, None
+        return extension.has_error_handlers_registered, extension.validation_hook, extension.slow_validation_sampler
+
+    if max_errors < 1:
+        raise ValueError("max_errors must be at least 1")
+    validator = _get_validator(parameters, allow_empty, VALIDATE_PARAMS_MAX_DEPTH, adaptive_order, unknown_keys)
+    strip_unknown_keys = unknown_keys == "strip"
+    errors_limit = max_errors if collect_errors else None
+    validation_cache = _LRUCache(cache_size) if cache_size is not None else None
+
+    def _get_cached_error() -> Tuple[Optional[bytes], Any]:
+        if validation_cache is None:
+            return None, _MISSING
+        body = request.get_data(cache=True)
+        if len(body) > VALIDATION_CACHE_MAX_BODY_SIZE:
+            return None, _MISSING
+        cache_key = hashlib.blake2b(body, digest_size=16).digest()
+        return cache_key, validation_cache.get(cache_key, _MISSING)
+
+    def _set_cached_error(cache_key: Optional[bytes], error: Optional[Tuple[Any, ...]]) -> None:
+        if validation_cache is not None and cache_key is not None:
+            validation_cache.set(cache_key, error)
+
+    def _load_body(
+        use_error_handlers: bool,
+        hook: Optional[ValidationHook],
+        sampler: Optional[SlowValidationSampler],
+        started: float,
+    ) -> Tuple[Any, Optional[Response]]:
+        # The bodies which can't be loaded (malformed or huge invalid JSON) are sampled too
+        try:
+            if hook is None:
+                data, error_response = _get_json_body(use_error_handlers)
+            else:
+                data, error_response = _get_json_body_traced(hook, use_error_handlers)
+        except BadRequestError:
+            if sampler is not None:
+                sampler.observe(None, time.perf_counter() - started, False)
+            raise
+        if error_response is not None and sampler is not None:
+            sampler.observe(None, time.perf_counter() - started, False)
+        return data, error_response
+
     def decorator(fn):  # type: ignore
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):  # type: ignore
+                use_error_handlers, hook, sampler = _get_settings()
+                if deadline_exceeded():
+                    return _handle_deadline_exceeded(use_error_handlers)
+
+                started = time.perf_counter() if sampler is not None else 0.0
+                data, error_response = _load_body(use_error_handlers, hook, sampler, started)
+                if error_response is not None:
+                    return error_response
+
+                cache_key, error = _get_cached_error()
+                if error is _MISSING:
+                    if offload_threshold is not None and len(request.get_data(cache=True)) >= offload_threshold:
+                        start = time.time_ns()
+                        loop = asyncio.get_running_loop()
+                        error = await loop.run_in_executor(
+                            offload_executor or _get_offload_executor(),
+                            _validate_data,
+                            data,
+                            validator,
+                            allow_empty,
+                            partial,
+                            errors_limit,
+                        )
+                        if hook is not None:
+                            _trace(hook, "type_check", start)
+                    elif hook is None:
+                        error = _validate_data(data, validator, allow_empty, partial, errors_limit)
+                    else:
+                        error = _validate_data_traced(hook, data, validator, partial, errors_limit)
+                    _set_cached_error(cache_key, error)
+
+                if sampler is not None:
+                    sampler.observe(data, time.perf_counter() - started, error is None)
+                if error is not None:
+                    if hook is None:
+                        return _handle_bad_request(use_error_handlers, *error)
+                    return _handle_bad_request_traced(hook, use_error_handlers, *error)
+                if strip_unknown_keys:
+                    _strip_unknown_keys(data, validator.expected_keys)
+
+                return await fn(*args, **kwargs)
+
+            async_wrapper._flask_utils_validation = (validator, partial)  # type: ignore
+            return async_wrapper
+
         @wraps(fn)
         def wrapper(*args, **kwargs):  # type: ignore
-            use_error_handlers = (
-                current_app.extensions.get("flask_utils") is not None
-                and current_app.extensions["flask_utils"].has_error_handlers_registered
-            )
-
-            try:
-                data = request.get_json()
-            except BadRequest as e:
-                return _handle_bad_request(use_error_handlers, "The Json Body is malformed.", original_exception=e)
-            except UnsupportedMediaType as e:
-                return _handle_bad_request(
-                    use_error_handlers,
-                    "The Content-Type header is missing or is not set to application/json, "
-                    "or the JSON body is missing.",
-                    original_exception=e,
-                )
-
-            if not data:
-                return _handle_bad_request(use_error_handlers, "Missing json body.")
-
-            if not isinstance(data, dict):
-                return _handle_bad_request(use_error_handlers, "JSON body must be a dict")
-
-            for key, type_hint in parameters.items():
-                if not _is_optional(type_hint) and key not in data:
-                    return _handle_bad_request(
-                        use_error_handlers, f"Missing key: {key}", f"Expected keys are: {list(parameters.keys())}"
-                    )
-
-            for key in data:
-                if key not in parameters:
-                    return _handle_bad_request(
-                        use_error_handlers, f"Unexpected key: {key}.", f"Expected keys are: {list(parameters.keys())}"
-                    )
-
-            for key in data:
-                if key in parameters and not _check_type(data[key], parameters[key], allow_empty):
-                    return _handle_bad_request(
-                        use_error_handlers,
-                        f"Wrong type for key {key}.",
-                        f"It should be {getattr(parameters[key], '__name__', str(parameters[key]))}",
-                    )
+            use_error_handlers, hook, sampler = _get_settings()
+            if deadline_exceeded():
+                return _handle_deadline_exceeded(use_error_handlers)
+
+            started = time.perf_counter() if sampler is not None else 0.0
+            data, error_response = _load_body(use_error_handlers, hook, sampler, started)
+            if error_response is not None:
+                return error_response
+
+            cache_key, error = _get_cached_error()
+            if error is _MISSING:
+                if hook is None:
+                    error = _validate_data(data, validator, allow_empty, partial, errors_limit)
+                else:
+                    error = _validate_data_traced(hook, data, validator, partial, errors_limit)
+                _set_cached_error(cache_key, error)
+
+            if sampler is not None:
+                sampler.observe(data, time.perf_counter() - started, error is None)
+            if error is not None:
+                if hook is None:
+                    return _handle_bad_request(use_error_handlers, *error)
+                return _handle_bad_request_traced(hook, use_error_handlers, *error)
+            if strip_unknown_keys:
+                _strip_unknown_keys(data, validator.expected_keys)
 
             return fn(*args, **kwargs)
 
+        wrapper._flask_utils_validation = (validator, partial)  # type: ignore
         return wrapper
 
     return decorator
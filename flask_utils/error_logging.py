@@ -0,0 +1,195 @@
+import time
+import queue
+import logging
+import threading
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Optional
+
+from flask import request
+from flask import has_request_context
+
+from flask_utils.errors.base_class import _BaseFlaskException
+
+_ErrorKey = Tuple[str, int, str, Optional[str], Optional[str]]
+
+_DROP_POLICIES = ("newest", "oldest")
+
+_STOP = object()
+
+
+class BackgroundErrorLogger(object):
+    """
+    Logger of the errors rendered by the error handlers of the extension, writing the logs from a background
+    thread so that an error storm doesn't make the requests wait on the logging I/O.
+
+    The request threads only push a small record (the error type, status code, message, method and endpoint)
+    in a bounded queue. The background thread logs the first occurrence of each distinct error, then counts
+    the identical ones and logs a single summary for them at the end of each ``window``, like
+    ``NotFoundError (404) on GET get_user: User not found (repeated 152 times in 10s)``.
+
+    The memory is bounded: the queue holds at most ``max_queue_size`` records, and at most ``max_keys`` distinct
+    errors are counted per window (the others are logged one by one). When the queue is full, the records are
+    dropped following ``drop_policy``: ``"newest"`` drops the incoming record, ``"oldest"`` drops the oldest
+    queued one. The number of dropped records is logged with the next summaries, and their total is
+    kept in :attr:`dropped`.
+
+    The errors with a 5xx status code are logged at the ``ERROR`` level, the others at ``level``.
+
+    :param logger: The logger to write to. Defaults to the ``flask_utils.errors`` logger.
+    :type logger: Optional[logging.Logger]
+    :param level: The level of the errors with a status code under 500. Defaults to ``logging.WARNING``.
+    :type level: int
+    :param window: The deduplication window, in seconds. Defaults to ``10``.
+    :type window: float
+    :param max_queue_size: The maximum number of records waiting to be logged. Defaults to ``10000``.
+    :type max_queue_size: int
+    :param max_keys: The maximum number of distinct errors counted per window. Defaults to ``1000``.
+    :type max_keys: int
+    :param drop_policy: ``"newest"`` or ``"oldest"``, the record dropped when the queue is full.
+        Defaults to ``"newest"``.
+    :type drop_policy: str
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask import Flask
+        from flask_utils import FlaskUtils
+        from flask_utils import BackgroundErrorLogger
+
+        app = Flask(__name__)
+        FlaskUtils(app, error_logger=BackgroundErrorLogger(window=30))
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.WARNING,
+        window: float = 10.0,
+        max_queue_size: int = 10000,
+        max_keys: int = 1000,
+        drop_policy: str = "newest",
+    ) -> None:
+        if drop_policy not in _DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {list(_DROP_POLICIES)}, not {drop_policy!r}")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self.logger = logger or logging.getLogger("flask_utils.errors")
+        self.level = level
+        self.window = window
+        self.max_keys = max_keys
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._unreported_drops = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def log(self, error: _BaseFlaskException) -> None:
+        """Queue an error to be logged. Never blocks.
+
+        :param error: The error rendered by the error handler.
+        :type error: _BaseFlaskException
+        """
+        error_type = type(error).__name__
+        if has_request_context():
+            key: _ErrorKey = (error_type, error.status_code, error.msg, request.method, request.endpoint)
+        else:
+            key = (error_type, error.status_code, error.msg, None, None)
+
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(key)
+        except queue.Full:
+            self._drop(key)
+
+    def _drop(self, key: _ErrorKey) -> None:
+        with self._lock:
+            self.dropped += 1
+            self._unreported_drops += 1
+        if self.drop_policy == "oldest":
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self._queue.put_nowait(key)
+            except (queue.Empty, queue.Full):
+                pass
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="flask_utils_error_logger", daemon=True)
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Wait until the queued errors are logged. The counts of the current window are kept."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Log the queued errors and the summaries of the current window, then stop the background thread.
+
+        The logger starts again if another error is logged.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        counts: Dict[_ErrorKey, int] = {}
+        window_end = time.monotonic() + self.window
+        while True:
+            try:
+                item = self._queue.get(timeout=max(window_end - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._queue.task_done()
+                self._log_summaries(counts)
+                return
+
+            if item is not None:
+                try:
+                    if item in counts:
+                        counts[item] += 1
+                    else:
+                        if len(counts) < self.max_keys:
+                            counts[item] = 0
+                        self._log(item, "")
+                except Exception:  # Never let a broken handler kill the thread
+                    pass
+                self._queue.task_done()
+
+            if time.monotonic() >= window_end:
+                self._log_summaries(counts)
+                counts = {}
+                window_end = time.monotonic() + self.window
+
+    def _log_summaries(self, counts: Dict[_ErrorKey, int]) -> None:
+        try:
+            for key, count in counts.items():
+                if count:
+                    self._log(key, f" (repeated {count} times in {self.window:g}s)")
+            with self._lock:
+                dropped, self._unreported_drops = self._unreported_drops, 0
+            if dropped:
+                self.logger.warning("Dropped %d error log records: the queue was full", dropped)
+        except Exception:
+            pass
+
+    def _log(self, key: _ErrorKey, suffix: str) -> None:
+        name, status_code, message, method, endpoint = key
+        level = logging.ERROR if status_code >= 500 else self.level
+        if method is None:
+            self.logger.log(level, "%s (%d): %s%s", name, status_code, message, suffix)
+        else:
+            self.logger.log(level, "%s (%d) on %s %s: %s%s", name, status_code, method, endpoint, message, suffix)
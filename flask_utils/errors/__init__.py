@@ -1,5 +1,10 @@
+from typing import Dict
+from typing import Type
+from typing import Tuple
+
 from flask import Flask
 from flask import Response
+from werkzeug.exceptions import HTTPException
 
 from flask_utils.errors.gone import GoneError
 from flask_utils.errors.conflict import ConflictError
@@ -8,7 +13,9 @@ from flask_utils.errors.forbidden import ForbiddenError
 from flask_utils.errors.badrequest import BadRequestError
 from flask_utils.errors.unauthorized import UnauthorizedError
 from flask_utils.errors._error_template import _generate_error_response
+from flask_utils.errors._error_template import _generate_http_exception_response
 from flask_utils.errors.failed_dependency import FailedDependencyError
+from flask_utils.errors.too_many_requests import TooManyRequestsError
 from flask_utils.errors.method_not_allowed import MethodNotAllowedError
 from flask_utils.errors.web_server_is_down import WebServerIsDownError
 from flask_utils.errors.service_unavailable import ServiceUnavailableError
@@ -227,6 +234,54 @@ def _register_error_handlers(application: Flask) -> None:
         """
         return _generate_error_response(error)
 
+    @application.errorhandler(TooManyRequestsError)
+    def generate_too_many_requests(error: TooManyRequestsError) -> Response:
+        """
+        This is the 429 response creator. It will create a 429 response with
+        a custom message and the 429 code.
+
+        :param error: The error body
+        :type error: TooManyRequestsError
+
+        :return: Returns the response formatted
+        :rtype: flask.Response
+        """
+        return _generate_error_response(error)
+
+
+def _register_http_exception_handler(application: Flask) -> None:
+    """
+    This function will render all the werkzeug :class:`~werkzeug.exceptions.HTTPException` of the application
+    (like the 404 and 405 errors raised by the routing, or the ones raised with :func:`flask.abort`)
+    in the same JSON format as the custom errors, instead of the werkzeug HTML pages.
+
+    The encoded bodies of the exceptions with their default description are cached per exception class and
+    status code, so that the routing errors, which make up most of the scanners traffic, are almost free.
+
+    :param application: The Flask application to register the error handler
+    :type application: flask.Flask
+
+    :return: None
+    :rtype: None
+
+    .. versionadded:: 0.10.0
+    """
+    cache: Dict[Tuple[Type[HTTPException], int], bytes] = {}
+
+    @application.errorhandler(HTTPException)
+    def generate_http_exception(error: HTTPException) -> Response:
+        """
+        This is the werkzeug exceptions response creator. It will create a response with
+        the description and the code of the exception.
+
+        :param error: The werkzeug exception
+        :type error: werkzeug.exceptions.HTTPException
+
+        :return: Returns the response formatted
+        :rtype: flask.Response
+        """
+        return _generate_http_exception_response(error, cache)
+
 
 __all__ = [
     "BadRequestError",
@@ -242,5 +297,7 @@ __all__ = [
     "UnprocessableEntityError",
     "ServiceUnavailableError",
     "MethodNotAllowedError",
+    "TooManyRequestsError",
     "_register_error_handlers",
+    "_register_http_exception_handler",
 ]
@@ -1,8 +1,13 @@
 from typing import Any
 from typing import Dict
+from typing import Type
+from typing import Tuple
+from typing import Optional
 
 from flask import Response
 from flask import jsonify
+from flask import current_app
+from werkzeug.exceptions import HTTPException
 
 from flask_utils.errors.base_class import _BaseFlaskException
 
@@ -37,17 +42,23 @@ def _generate_error_dict(error: _BaseFlaskException) -> Dict[str, Any]:
         #     "code": 409
         # }
 
+    .. versionchanged:: 0.10.0
+        The ``errors`` of the error, if any, are added to the ``error`` object.
+
     .. versionadded:: 0.8.0
     """
 
+    error_dict: Dict[str, Any] = {
+        "type": error.__class__.__name__,
+        "name": error.name,
+        "message": error.msg,
+        "solution": error.solution,
+    }
+    if error.errors is not None:
+        error_dict["errors"] = error.errors
     return {
         "success": False,
-        "error": {
-            "type": error.__class__.__name__,
-            "name": error.name,
-            "message": error.msg,
-            "solution": error.solution,
-        },
+        "error": error_dict,
         "code": error.status_code,
     }
 
@@ -79,6 +90,13 @@ def _generate_error_response(error: _BaseFlaskException) -> Response:
 
         response = _generate_error_response(error, 666)
 
+    .. versionchanged:: 0.10.0
+        The ``Retry-After`` header is set if the error has a ``retry_after`` value, and the ``Cache-Control``
+        and ``Vary`` headers are set from the caching policy of the error
+        (see :class:`~flask_utils.errors.base_class._BaseFlaskException`).
+        The error is logged by the ``error_logger`` of the extension, if any
+        (see :class:`~flask_utils.error_logging.BackgroundErrorLogger`).
+
     .. versionchanged:: 0.8.0
         This function was renamed from ``_generate_error_json`` to ``_generate_error_response``.
         It now returns a ``flask.Response`` object, calling
@@ -86,7 +104,110 @@ def _generate_error_response(error: _BaseFlaskException) -> Response:
 
     .. versionadded:: 0.1.0
     """
+    error_logger = getattr(current_app.extensions.get("flask_utils"), "error_logger", None)
+    if error_logger is not None:
+        error_logger.log(error)
+
     json = _generate_error_dict(error)
     resp: Response = jsonify(json)
     resp.status_code = error.status_code
+    if error.retry_after is not None:
+        resp.headers["Retry-After"] = str(error.retry_after)
+    if error.cache_max_age is not None:
+        if error.cache_max_age > 0:
+            resp.cache_control.max_age = error.cache_max_age
+            if error.cache_private:
+                resp.cache_control.private = True
+            else:
+                resp.cache_control.public = True
+        else:
+            resp.cache_control.no_store = True
+    for header in error.vary:
+        resp.vary.add(header)
+    return resp
+
+
+def _generate_http_exception_dict(error: HTTPException) -> Dict[str, Any]:
+    """
+    This function is used to generate a dict of a werkzeug :class:`~werkzeug.exceptions.HTTPException`,
+    in the same format as :func:`_generate_error_dict`.
+
+    :param error: The werkzeug exception, for example :class:`~werkzeug.exceptions.NotFound`
+    :type error: werkzeug.exceptions.HTTPException
+
+    :return: Returns a dict containing a json representation of the error
+    :rtype: Dict[str, Any]
+
+    :Example:
+
+    .. code-block:: python
+
+        from werkzeug.exceptions import NotFound
+        from flask_utils.errors._error_template import _generate_http_exception_dict
+
+        json = _generate_http_exception_dict(NotFound())
+        # Sample output:
+        # {
+        #     "success": False,
+        #     "error": {
+        #         "type": "NotFound",
+        #         "name": "Not Found",
+        #         "message": "The requested URL was not found on the server. ...",
+        #         "solution": None
+        #     },
+        #     "code": 404
+        # }
+
+    .. versionadded:: 0.10.0
+    """
+
+    return {
+        "success": False,
+        "error": {
+            "type": error.__class__.__name__,
+            "name": error.name,
+            "message": error.description,
+            "solution": None,
+        },
+        "code": error.code,
+    }
+
+
+def _generate_http_exception_response(
+    error: HTTPException, cache: Optional[Dict[Tuple[Type[HTTPException], int], bytes]] = None
+) -> Response:
+    """
+    This function is used to generate a json response of a werkzeug :class:`~werkzeug.exceptions.HTTPException`.
+
+    When the exception has its default description, which is the case of the 404 and 405 errors raised
+    by the routing, the encoded body is stored in ``cache`` and reused for the next exceptions of the
+    same class and code, so that they don't go through the JSON encoder again.
+    The headers of the exception (like the ``Allow`` header of a 405) are still computed for each response.
+
+    :param error: The werkzeug exception
+    :type error: werkzeug.exceptions.HTTPException
+    :param cache: The pre-encoded bodies, by exception class and status code
+    :type cache: Optional[Dict[Tuple[Type[HTTPException], int], bytes]]
+
+    :return: Returns a json containing all the info, or the response of the exception if it has one
+    :rtype: flask.Response
+
+    .. versionadded:: 0.10.0
+    """
+    if error.response is not None:
+        return error.response  # type: ignore
+
+    code = error.code or 500
+    cacheable = cache is not None and error.description == type(error).description
+    cache_key = (type(error), code)
+    body = cache.get(cache_key) if cache is not None and cacheable else None
+    if body is None:
+        body = f"{current_app.json.dumps(_generate_http_exception_dict(error))}\n".encode()
+        if cache is not None and cacheable:
+            cache[cache_key] = body
+
+    resp = Response(body, status=code, mimetype="application/json")
+    for header, value in error.get_headers():
+        if header.lower() != "content-type":
+            resp.headers.add(header, value)
     return resp
@@ -1,3 +1,6 @@
+from typing import Any
+from typing import Dict
+from typing import List
 from typing import Optional
 
 from flask_utils.errors.base_class import _BaseFlaskException
@@ -12,6 +15,8 @@ class BadRequestError(_BaseFlaskException):
     :type msg: str
     :param solution: The solution to the error.
     :type solution: Optional[str]
+    :param errors: The detail of each error, when there are several. Added to the ``error`` object.
+    :type errors: Optional[List[Dict[str, Any]]]
 
     :Example:
 
@@ -41,11 +46,46 @@ class BadRequestError(_BaseFlaskException):
             "code": 400
         }
 
+    With ``errors``, for example when :func:`~flask_utils.decorators.validate_params` collects
+    all the errors of a body:
+
+    .. code-block:: json
+
+        {
+            "success": false,
+            "error": {
+                "type": "BadRequestError",
+                "name": "Bad Request",
+                "message": "Wrong type for key courses[3].",
+                "solution": "It should be str",
+                "errors": [
+                    {
+                        "path": "courses[3]",
+                        "message": "Wrong type for key courses[3].",
+                        "solution": "It should be str"
+                    },
+                    {
+                        "path": "grades.math",
+                        "message": "Wrong type for key grades.math.",
+                        "solution": "It should be int"
+                    }
+                ]
+            },
+            "code": 400
+        }
+
+    .. versionchanged:: 0.10.0
+        Added the ``errors`` parameter.
+
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, msg: str, solution: Optional[str] = "Try again.") -> None:
+    def __init__(
+        self, msg: str, solution: Optional[str] = "Try again.", errors: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
         self.name = "Bad Request"
         self.msg = msg
         self.solution = solution
         self.status_code = 400
+        if errors is not None:
+            self.errors = errors
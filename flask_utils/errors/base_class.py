@@ -1,4 +1,12 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import TypeVar
 from typing import Optional
+from typing import Sequence
+
+_E = TypeVar("_E", bound="_BaseFlaskException")
 
 
 class _BaseFlaskException(Exception):
@@ -17,6 +25,22 @@ class _BaseFlaskException(Exception):
     :param status_code: The status code to be returned
     :type status_code: int
 
+    :param retry_after: The number of seconds to send in the ``Retry-After`` header, if any
+    :type retry_after: Optional[int]
+
+    :param cache_max_age: The number of seconds the response can be cached for, sent in the
+        ``Cache-Control`` header. ``0`` forbids caching (``no-store``), ``None`` sends no header
+    :type cache_max_age: Optional[int]
+
+    :param cache_private: Only allow the browser of the client to cache the response, not the shared caches
+    :type cache_private: bool
+
+    :param vary: The request headers the response depends on, sent in the ``Vary`` header
+    :type vary: Tuple[str, ...]
+
+    :param errors: The detail of each error, when there are several, added to the ``error`` object of the response
+    :type errors: Optional[List[Dict[str, Any]]]
+
     :Example:
 
     .. code-block:: python
@@ -29,6 +53,24 @@ class _BaseFlaskException(Exception):
             self.solution = solution
             self.status_code = 666
 
+    The caching policy can be set for a whole class of errors, or for a single error with :meth:`cache`:
+
+    .. code-block:: python
+
+        from flask_utils import GoneError
+        from flask_utils import NotFoundError
+
+        class ArticleGoneError(GoneError):
+            cache_max_age = 86400
+            vary = ("Accept-Language",)
+
+        # Inside a Flask route
+        raise NotFoundError("This article does not exist.").cache(300)
+
+    .. versionchanged:: 0.10.0
+        Added the ``retry_after``, ``cache_max_age``, ``cache_private``, ``vary`` and ``errors`` attributes,
+        and the :meth:`cache` method.
+
     .. versionadded:: 0.1.0
     """
 
@@ -36,3 +78,30 @@ class _BaseFlaskException(Exception):
     msg: str = "An error occurred"
     solution: Optional[str] = "Try again."
     status_code: int = 400
+    retry_after: Optional[int] = None
+    cache_max_age: Optional[int] = None
+    cache_private: bool = False
+    vary: Tuple[str, ...] = ()
+    errors: Optional[List[Dict[str, Any]]] = None
+
+    def cache(self: _E, max_age: int, private: bool = False, vary: Optional[Sequence[str]] = None) -> _E:
+        """
+        Set the caching policy of the response of this error.
+
+        :param max_age: The number of seconds the response can be cached for. ``0`` forbids caching.
+        :type max_age: int
+        :param private: Only allow the browser of the client to cache the response. Defaults to ``False``.
+        :type private: bool
+        :param vary: The request headers the response depends on. Defaults to the ones of the class.
+        :type vary: Optional[Sequence[str]]
+
+        :return: The error itself, so that it can be raised directly.
+        :rtype: _BaseFlaskException
+
+        .. versionadded:: 0.10.0
+        """
+        self.cache_max_age = max_age
+        self.cache_private = private
+        if vary is not None:
+            self.vary = tuple(vary)
+        return self
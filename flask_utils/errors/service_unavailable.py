@@ -12,6 +12,9 @@ class ServiceUnavailableError(_BaseFlaskException):
     :type msg: str
     :param solution: The solution to the error.
     :type solution: Optional[str]
+    :param retry_after: The number of seconds after which the client can try again,
+        sent in the ``Retry-After`` header. Defaults to the ``retry_after`` attribute of the class.
+    :type retry_after: Optional[int]
 
     :Example:
 
@@ -41,11 +44,18 @@ class ServiceUnavailableError(_BaseFlaskException):
             "code": 503
         }
 
+    .. versionchanged:: 0.10.0
+        Added the ``retry_after`` parameter.
+
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, msg: str, solution: Optional[str] = "Try again later.") -> None:
+    def __init__(
+        self, msg: str, solution: Optional[str] = "Try again later.", retry_after: Optional[int] = None
+    ) -> None:
         self.name = "Service Unavailable"
         self.msg = msg
         self.solution = solution
         self.status_code = 503
+        if retry_after is not None:
+            self.retry_after = retry_after
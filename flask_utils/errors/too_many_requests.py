@@ -0,0 +1,58 @@
+from typing import Optional
+
+from flask_utils.errors.base_class import _BaseFlaskException
+
+
+class TooManyRequestsError(_BaseFlaskException):
+    """This is the TooManyRequestsError exception class.
+
+    When raised, it will return a 429 status code with the message and solution provided.
+
+    :param msg: The message to be displayed in the error.
+    :type msg: str
+    :param solution: The solution to the error.
+    :type solution: Optional[str]
+    :param retry_after: The number of seconds after which the client can try again,
+        sent in the ``Retry-After`` header. Defaults to the ``retry_after`` attribute of the class.
+    :type retry_after: Optional[int]
+
+    :Example:
+
+    .. code-block:: python
+
+            from flask_utils.errors import TooManyRequestsError
+
+            # Inside a Flask route
+            @app.route('/example', methods=['POST'])
+            def example_route():
+                ...
+                if some_condition:
+                    raise TooManyRequestsError("This is a too many requests error.", retry_after=30)
+
+    The above code would return the following JSON response from Flask:
+
+    .. code-block:: json
+
+        {
+            "success": false,
+            "error": {
+                "type": "TooManyRequestsError",
+                "name": "Too Many Requests",
+                "message": "This is a too many requests error.",
+                "solution": "Try again later."
+            },
+            "code": 429
+        }
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(
+        self, msg: str, solution: Optional[str] = "Try again later.", retry_after: Optional[int] = None
+    ) -> None:
+        self.name = "Too Many Requests"
+        self.msg = msg
+        self.solution = solution
+        self.status_code = 429
+        if retry_after is not None:
+            self.retry_after = retry_after
@@ -2,7 +2,17 @@ from typing import Optional
 
 from flask import Flask
 
+from flask_utils.cli import _register_cli
 from flask_utils.errors import _register_error_handlers
+from flask_utils.errors import _register_http_exception_handler
+from flask_utils.deadline import _register_deadlines
+from flask_utils.sampling import SlowValidationSampler
+from flask_utils.decorators import ValidationHook
+from flask_utils.compression import _register_compression
+from flask_utils.decompression import _register_decompression
+from flask_utils.error_logging import BackgroundErrorLogger
+from flask_utils.load_shedding import ConcurrencyLimiter
+from flask_utils.load_shedding import _register_concurrency_limiter
 
 
 class FlaskUtils(object):
@@ -18,6 +28,32 @@ class FlaskUtils(object):
     :param register_error_handlers: Register the custom error handlers. Default is ``True``.
     :param register_error_handlers: bool
 
+    :param compress_responses: Compress the responses with gzip or deflate. Default is ``False``.
+    :type compress_responses: bool
+
+    :param decompress_requests: Decompress the gzip or deflate request bodies. Default is ``False``.
+    :type decompress_requests: bool
+
+    :param concurrency_limiter: Limit the number of requests processed at the same time. Default is ``None``.
+    :type concurrency_limiter: Optional[ConcurrencyLimiter]
+
+    :param propagate_deadlines: Read the deadline of the requests from a header. Default is ``False``.
+    :type propagate_deadlines: bool
+
+    :param handle_http_exceptions: Render the werkzeug HTTP exceptions as JSON. Default is ``False``.
+    :type handle_http_exceptions: bool
+
+    :param validation_hook: Function called with the timings of the phases of
+        :func:`~flask_utils.decorators.validate_params`. Default is ``None``.
+    :type validation_hook: Optional[ValidationHook]
+
+    :param slow_validation_sampler: Record the requests whose validation is slow. Default is ``None``.
+    :type slow_validation_sampler: Optional[SlowValidationSampler]
+
+    :param error_logger: Log the errors rendered by the error handlers from a background thread.
+        Default is ``None``.
+    :type error_logger: Optional[BackgroundErrorLogger]
+
     :Example:
 
     .. code-block:: python
@@ -36,7 +72,19 @@ class FlaskUtils(object):
     .. versionadded:: 0.5.0
     """
 
-    def __init__(self, app: Optional[Flask] = None, register_error_handlers: bool = True):
+    def __init__(
+        self,
+        app: Optional[Flask] = None,
+        register_error_handlers: bool = True,
+        compress_responses: bool = False,
+        decompress_requests: bool = False,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        propagate_deadlines: bool = False,
+        handle_http_exceptions: bool = False,
+        validation_hook: Optional[ValidationHook] = None,
+        slow_validation_sampler: Optional[SlowValidationSampler] = None,
+        error_logger: Optional[BackgroundErrorLogger] = None,
+    ):
         """
         :param app: Flask application instance.
         :type app: Optional[Flask]
@@ -44,6 +92,33 @@ class FlaskUtils(object):
         :param register_error_handlers: Register the custom error handlers. Default is ``True``.
         :type register_error_handlers: bool
 
+        :param compress_responses: Compress the responses with gzip or deflate. Default is ``False``.
+        :type compress_responses: bool
+
+        :param decompress_requests: Decompress the gzip or deflate request bodies. Default is ``False``.
+        :type decompress_requests: bool
+
+        :param concurrency_limiter: Limit the number of requests processed at the same time.
+            Default is ``None``.
+        :type concurrency_limiter: Optional[ConcurrencyLimiter]
+
+        :param propagate_deadlines: Read the deadline of the requests from a header. Default is ``False``.
+        :type propagate_deadlines: bool
+
+        :param handle_http_exceptions: Render the werkzeug HTTP exceptions as JSON. Default is ``False``.
+        :type handle_http_exceptions: bool
+
+        :param validation_hook: Function called with the timings of the phases of
+            :func:`~flask_utils.decorators.validate_params`. Default is ``None``.
+        :type validation_hook: Optional[ValidationHook]
+
+        :param slow_validation_sampler: Record the requests whose validation is slow. Default is ``None``.
+        :type slow_validation_sampler: Optional[SlowValidationSampler]
+
+        :param error_logger: Log the errors rendered by the error handlers from a background thread.
+            Default is ``None``.
+        :type error_logger: Optional[BackgroundErrorLogger]
+
         :Example:
 
         .. code-block:: python
@@ -59,14 +134,45 @@ class FlaskUtils(object):
                 fu = FlaskUtils()
                 fu.init_app(app)
 
+        .. versionchanged:: 0.10.0
+            Added the ``compress_responses``, ``decompress_requests``, ``concurrency_limiter``,
+            ``propagate_deadlines``, ``handle_http_exceptions``, ``validation_hook``,
+            ``slow_validation_sampler`` and ``error_logger`` parameters.
+
         .. versionadded:: 0.5.0
         """
         self.has_error_handlers_registered = False
+        self.validation_hook: Optional[ValidationHook] = None
+        self.slow_validation_sampler: Optional[SlowValidationSampler] = None
+        self.error_logger: Optional[BackgroundErrorLogger] = None
 
         if app is not None:
-            self.init_app(app, register_error_handlers)
-
-    def init_app(self, app: Flask, register_error_handlers: bool = True) -> None:
+            self.init_app(
+                app,
+                register_error_handlers=register_error_handlers,
+                compress_responses=compress_responses,
+                decompress_requests=decompress_requests,
+                concurrency_limiter=concurrency_limiter,
+                propagate_deadlines=propagate_deadlines,
+                handle_http_exceptions=handle_http_exceptions,
+                validation_hook=validation_hook,
+                slow_validation_sampler=slow_validation_sampler,
+                error_logger=error_logger,
+            )
+
+    def init_app(
+        self,
+        app: Flask,
+        register_error_handlers: bool = True,
+        compress_responses: bool = False,
+        decompress_requests: bool = False,
+        concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+        propagate_deadlines: bool = False,
+        handle_http_exceptions: bool = False,
+        validation_hook: Optional[ValidationHook] = None,
+        slow_validation_sampler: Optional[SlowValidationSampler] = None,
+        error_logger: Optional[BackgroundErrorLogger] = None,
+    ) -> None:
         """
         :param app: The Flask application to initialize.
         :type app: Flask
@@ -74,6 +180,33 @@ class FlaskUtils(object):
         :param register_error_handlers: Register the custom error handlers. Default is ``True``.
         :type register_error_handlers: bool
 
+        :param compress_responses: Compress the responses with gzip or deflate. Default is ``False``.
+        :type compress_responses: bool
+
+        :param decompress_requests: Decompress the gzip or deflate request bodies. Default is ``False``.
+        :type decompress_requests: bool
+
+        :param concurrency_limiter: Limit the number of requests processed at the same time.
+            Default is ``None``.
+        :type concurrency_limiter: Optional[ConcurrencyLimiter]
+
+        :param propagate_deadlines: Read the deadline of the requests from a header. Default is ``False``.
+        :type propagate_deadlines: bool
+
+        :param handle_http_exceptions: Render the werkzeug HTTP exceptions as JSON. Default is ``False``.
+        :type handle_http_exceptions: bool
+
+        :param validation_hook: Function called with the timings of the phases of
+            :func:`~flask_utils.decorators.validate_params`. Default is ``None``.
+        :type validation_hook: Optional[ValidationHook]
+
+        :param slow_validation_sampler: Record the requests whose validation is slow. Default is ``None``.
+        :type slow_validation_sampler: Optional[SlowValidationSampler]
+
+        :param error_logger: Log the errors rendered by the error handlers from a background thread.
+            Default is ``None``.
+        :type error_logger: Optional[BackgroundErrorLogger]
+
         Initialize a Flask application for use with this extension instance. This
         must be called before any request is handled by the application.
 
@@ -85,6 +218,64 @@ class FlaskUtils(object):
         The decorator :func:`~flask_utils.decorators.validate_params` will also use the custom error handlers
         if set to ``True``.
 
+        If ``compress_responses`` is ``True``, the responses are compressed with gzip or deflate, depending
+        on the ``Accept-Encoding`` header of the request. See
+        :func:`~flask_utils.compression._register_compression` for the related configuration keys.
+
+        If ``decompress_requests`` is ``True``, the request bodies sent with a ``Content-Encoding`` header
+        are decompressed before reaching the views, with limits protecting against decompression bombs. See
+        :func:`~flask_utils.decompression._register_decompression` for the related configuration keys.
+
+        If a ``concurrency_limiter`` is given, the requests over its limit are rejected early with a
+        :class:`~flask_utils.errors.ServiceUnavailableError` and a ``Retry-After`` header. See
+        :class:`~flask_utils.load_shedding.ConcurrencyLimiter`.
+
+        If ``propagate_deadlines`` is ``True``, the deadline of each request is read from a header sent by the
+        caller (``X-Request-Timeout`` by default, in milliseconds), and the requests whose deadline has passed
+        are stopped early with a :class:`~flask_utils.errors.ServiceUnavailableError`. See
+        :func:`~flask_utils.deadline._register_deadlines` for the related configuration keys.
+
+        If ``handle_http_exceptions`` is ``True``, the werkzeug :class:`~werkzeug.exceptions.HTTPException`
+        (like the 404 and 405 errors raised by the routing) are rendered in the same JSON format as the custom
+        errors. See :func:`~flask_utils.errors._register_http_exception_handler`.
+
+        If a ``validation_hook`` is given, :func:`~flask_utils.decorators.validate_params` calls it at the end of
+        each phase of the validation with the name of the phase and its start and end, from :func:`time.time_ns`,
+        so that they can be turned into tracing spans or profiling metrics. It is called in the request context.
+        The phases are ``body_read``, ``json_parse``, ``key_check``, ``type_check`` (the keys and the types
+        are checked together, and reported as ``type_check``, when collecting the errors or when the validation is
+        offloaded) and ``error_render`` (with the error handlers, it only covers raising the error).
+        The phases skipped by a cached validation result are not reported. Without a hook, the validation only
+        pays for a few ``is None`` checks.
+
+        .. code-block:: python
+
+                from opentelemetry import trace
+
+                tracer = trace.get_tracer("validation")
+
+                def validation_hook(phase, start, end):
+                    tracer.start_span(f"validate_params.{phase}", start_time=start).end(end_time=end)
+
+                FlaskUtils(app, validation_hook=validation_hook)
+
+        If a ``slow_validation_sampler`` is given, the requests whose validation by
+        :func:`~flask_utils.decorators.validate_params` exceeds its time budget are recorded with the shape
+        of their body, without its values. See :class:`~flask_utils.sampling.SlowValidationSampler`.
+
+        If an ``error_logger`` is given, the errors rendered by the custom error handlers are logged from a
+        background thread, with the repeated errors summarized per time window.
+        See :class:`~flask_utils.error_logging.BackgroundErrorLogger`.
+
+        The ``flask flask-utils`` commands are registered on the application.
+        See :func:`~flask_utils.cli._register_cli`.
+
+        .. versionchanged:: 0.10.0
+            The ``flask flask-utils`` commands are registered on the application.
+            Added the ``compress_responses``, ``decompress_requests``, ``concurrency_limiter``,
+            ``propagate_deadlines``, ``handle_http_exceptions``, ``validation_hook``,
+            ``slow_validation_sampler`` and ``error_logger`` parameters.
+
         .. versionchanged:: 0.7.0
             Setting ``register_error_handlers`` to True will now enable using the custom error handlers
             in the :func:`~flask_utils.decorators.validate_params`. decorator.
@@ -102,8 +293,30 @@ class FlaskUtils(object):
 
         .. versionadded:: 0.5.0
         """
+        # Registered first, so that the time spent waiting for a concurrency slot counts against the deadline.
+        if propagate_deadlines:
+            _register_deadlines(app)
+
+        if concurrency_limiter is not None:
+            _register_concurrency_limiter(app, concurrency_limiter)
+
         if register_error_handlers:
             _register_error_handlers(app)
             self.has_error_handlers_registered = True
 
+        if handle_http_exceptions:
+            _register_http_exception_handler(app)
+
+        if compress_responses:
+            _register_compression(app)
+
+        if decompress_requests:
+            _register_decompression(app)
+
+        self.validation_hook = validation_hook
+        self.slow_validation_sampler = slow_validation_sampler
+        self.error_logger = error_logger
+
+        _register_cli(app)
+
         app.extensions["flask_utils"] = self
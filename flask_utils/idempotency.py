@@ -0,0 +1,453 @@
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+import inspect
+import tempfile
+import threading
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+from functools import wraps
+from contextlib import contextmanager
+from collections import OrderedDict
+
+from flask import Response
+from flask import request
+from flask import current_app
+from werkzeug.http import is_hop_by_hop_header
+
+from flask_utils.errors import ConflictError
+from flask_utils.errors import BadRequestError
+from flask_utils.errors import UnprocessableEntityError
+from flask_utils.errors import _generate_error_response
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+_IN_FLIGHT = "in-flight"
+
+
+class IdempotencyStore(object):
+    """
+    Base class of the stores used by :func:`idempotent` to keep the completed responses.
+
+    A stored response is a JSON serializable dict containing the ``status`` code, the ``headers``
+    as a list of ``[name, value]`` pairs, the base64 encoded ``body`` and the ``fingerprint``
+    of the request body that produced it.
+
+    Subclasses must implement :meth:`get`, :meth:`reserve`, :meth:`save` and :meth:`release`.
+
+    .. versionadded:: 0.10.0
+    """
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        :param key: The idempotency key.
+        :type key: str
+
+        :return: The stored response, or ``None`` if there is none (or it expired).
+        :rtype: Optional[Dict[str, Any]]
+        """
+        raise NotImplementedError
+
+    def reserve(self, key: str) -> bool:
+        """Atomically mark the key as being processed.
+
+        :param key: The idempotency key.
+        :type key: str
+
+        :return: ``True`` if the key was reserved, ``False`` if it is already being processed
+            or already has a stored response.
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, response: Dict[str, Any]) -> None:
+        """Store the completed response and release the reservation.
+
+        :param key: The idempotency key.
+        :type key: str
+        :param response: The response to store.
+        :type response: Dict[str, Any]
+        """
+        raise NotImplementedError
+
+    def release(self, key: str) -> None:
+        """Release the reservation without storing anything, so that the request can be retried.
+
+        :param key: The idempotency key.
+        :type key: str
+        """
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    In-memory :class:`IdempotencyStore`, with a time to live and a least recently used eviction.
+
+    The responses are only shared between the threads of a single process.
+    Use :class:`FileIdempotencyStore` to share them between several workers.
+
+    :param maxsize: The maximum number of stored responses. Defaults to ``1024``.
+    :type maxsize: int
+    :param ttl: Number of seconds a response is kept. Defaults to ``86400`` (24 hours).
+    :type ttl: float
+    :param lock_timeout: Number of seconds after which a reservation is considered abandoned.
+        Defaults to ``60``.
+    :type lock_timeout: float
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 86400, lock_timeout: float = 60) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_entry(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_entry(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._get_entry(key)
+        return None if value is None or value == _IN_FLIGHT else value
+
+    def reserve(self, key: str) -> bool:
+        with self._lock:
+            if self._get_entry(key) is not None:
+                return False
+            self._set_entry(key, _IN_FLIGHT, self.lock_timeout)
+            return True
+
+    def save(self, key: str, response: Dict[str, Any]) -> None:
+        with self._lock:
+            self._set_entry(key, response, self.ttl)
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class FileIdempotencyStore(IdempotencyStore):
+    """
+    File-backed :class:`IdempotencyStore`, that can be shared by several workers (or hosts
+    mounting the same directory).
+
+    Each response is a JSON file named after a hash of its key. Reservations are lock files
+    created with :data:`os.O_EXCL`, and responses are written to a temporary file then moved
+    in place, so concurrent workers never read a partially written response.
+    An abandoned lock is only taken over while holding an exclusive lock on a guard file of the directory
+    (:func:`fcntl.flock`, or :func:`msvcrt.locking` on Windows), so that two workers can't both take it over.
+
+    :param directory: The directory where the responses are stored. It is created if needed.
+    :type directory: str
+    :param ttl: Number of seconds a response is kept. Defaults to ``86400`` (24 hours).
+    :type ttl: float
+    :param lock_timeout: Number of seconds after which a reservation is considered abandoned
+        (for example if the worker was killed). Defaults to ``60``.
+    :type lock_timeout: float
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils import idempotent
+        from flask_utils import FileIdempotencyStore
+
+        store = FileIdempotencyStore("/var/run/my-app/idempotency")
+
+        @app.route("/payments", methods=["POST"])
+        @idempotent(store=store)
+        def create_payment():
+            ...
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, directory: str, ttl: float = 86400, lock_timeout: float = 60) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + extension)
+
+    def _is_expired(self, path: str, ttl: float) -> bool:
+        try:
+            return os.path.getmtime(path) + ttl <= time.time()
+        except FileNotFoundError:
+            return False
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key, ".json")
+        if self._is_expired(path, self.ttl):
+            self._remove(path)
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)  # type: ignore
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def reserve(self, key: str) -> bool:
+        if self.get(key) is not None:
+            return False
+        lock_path = self._path(key, ".lock")
+        if self._is_expired(lock_path, self.lock_timeout):
+            with self._guard():
+                # Checked again, as another worker may have taken the lock over in the meantime.
+                if self._is_expired(lock_path, self.lock_timeout):
+                    self._remove(lock_path)
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return False
+        return True
+
+    def save(self, key: str, response: Dict[str, Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(response, file)
+            os.replace(tmp_path, self._path(key, ".json"))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        finally:
+            self.release(key)
+
+    def release(self, key: str) -> None:
+        self._remove(self._path(key, ".lock"))
+
+    @contextmanager
+    def _guard(self) -> Iterator[None]:
+        fd = os.open(os.path.join(self.directory, "guard"), os.O_CREAT | os.O_RDWR)
+        try:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # Releases the lock
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _default_scope() -> Optional[str]:
+    """Get the caller of the current request: its ``Authorization`` header, or its remote address without one.
+
+    :return: The caller.
+    :rtype: Optional[str]
+
+    .. versionadded:: 0.10.0
+    """
+    return request.headers.get("Authorization") or request.remote_addr
+
+
+def idempotent(
+    store: Optional[IdempotencyStore] = None,
+    header: str = "Idempotency-Key",
+    required: bool = False,
+    scope: Callable[[], Optional[str]] = _default_scope,
+) -> Callable:  # type: ignore
+    """
+    Decorator making a route idempotent using the ``Idempotency-Key`` request header.
+
+    The first request with a given key runs the view and its response (status, headers and body)
+    is stored. Retries with the same key get the stored response back, with an
+    ``Idempotent-Replayed: true`` header, without running the view again.
+
+    The key is scoped to the method and the path of the request, and to its caller, so that a client reusing
+    the key of another one doesn't get its response. Responses with a 5xx status code,
+    streamed responses and views raising an exception are not stored, so they can be retried.
+    The ``Set-Cookie`` and hop-by-hop headers of the responses are not stored.
+    It also works with ``async def`` views.
+
+    :param store: The store used to keep the responses. Defaults to a
+        :class:`MemoryIdempotencyStore` owned by the decorated view.
+    :type store: Optional[IdempotencyStore]
+    :param header: The name of the header containing the idempotency key.
+        Defaults to ``Idempotency-Key``.
+    :type header: str
+    :param required: Reject the requests without the header. Defaults to ``False``,
+        in which case those requests are processed normally.
+    :type required: bool
+    :param scope: Function returning the caller of the current request, like its user id. Defaults to the
+        ``Authorization`` header of the request, or its remote address without one. Only a hash of the caller
+        is stored.
+    :type scope: Callable[[], Optional[str]]
+
+    The following errors are returned as JSON responses, even if the error handlers of the extension
+    are not registered:
+
+    * :class:`~flask_utils.errors.BadRequestError` if ``required`` is ``True`` and the header is missing.
+    * :class:`~flask_utils.errors.ConflictError` if a request with the same key is still being processed.
+    * :class:`~flask_utils.errors.UnprocessableEntityError` if the key was already used with a different
+      request body.
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask import Flask
+        from flask_utils import FlaskUtils
+        from flask_utils import idempotent
+        from flask_utils import validate_params
+
+        app = Flask(__name__)
+        FlaskUtils(app)
+
+        @app.route("/payments", methods=["POST"])
+        @idempotent()
+        @validate_params({"amount": int, "currency": str})
+        def create_payment():
+            ...
+
+    .. versionadded:: 0.10.0
+    """
+    if store is None:
+        store = MemoryIdempotencyStore()
+
+    def _replay_or_reserve() -> Tuple[Optional[Response], Optional[str], str]:
+        """Get the response to return without running the view, or reserve the key of the request.
+
+        :return: The response, if any, otherwise the reserved key (``None`` if the request has no idempotency key)
+            and the fingerprint of the request body.
+        """
+        idempotency_key = request.headers.get(header)
+        if not idempotency_key:
+            if required:
+                error = BadRequestError(f"Missing {header} header.", f"Send a unique {header} header.")
+                return _generate_error_response(error), None, ""
+            return None, None, ""
+
+        caller = hashlib.blake2b(str(scope()).encode("utf-8"), digest_size=16).hexdigest()
+        key = f"{request.method}:{request.path}:{caller}:{idempotency_key}"
+        fingerprint = hashlib.blake2b(request.get_data(cache=True), digest_size=16).hexdigest()
+
+        stored = store.get(key)
+        if stored is None:
+            if store.reserve(key):
+                return None, key, fingerprint
+            stored = store.get(key)
+            if stored is None:
+                return (
+                    _generate_error_response(
+                        ConflictError(
+                            "A request with the same idempotency key is already being processed.",
+                            "Wait for the first request to complete, then try again.",
+                        )
+                    ),
+                    None,
+                    "",
+                )
+
+        if stored["fingerprint"] != fingerprint:
+            return (
+                _generate_error_response(
+                    UnprocessableEntityError(
+                        "This idempotency key was already used with a different request body.",
+                        "Use a new idempotency key for a different request.",
+                    )
+                ),
+                None,
+                "",
+            )
+
+        response = Response(base64.b64decode(stored["body"]), status=stored["status"], headers=stored["headers"])
+        response.headers["Idempotent-Replayed"] = "true"
+        return response, None, ""
+
+    def decorator(fn):  # type: ignore
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):  # type: ignore
+                response, key, fingerprint = _replay_or_reserve()
+                if response is not None:
+                    return response
+                if key is None:
+                    return await fn(*args, **kwargs)
+                try:
+                    response = current_app.make_response(await fn(*args, **kwargs))
+                except BaseException:
+                    store.release(key)
+                    raise
+                return _store_response(store, key, fingerprint, response)
+
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):  # type: ignore
+            response, key, fingerprint = _replay_or_reserve()
+            if response is not None:
+                return response
+            if key is None:
+                return fn(*args, **kwargs)
+            try:
+                response = current_app.make_response(fn(*args, **kwargs))
+            except BaseException:
+                store.release(key)
+                raise
+            return _store_response(store, key, fingerprint, response)
+
+        return wrapper
+
+    return decorator
+
+
+def _store_response(store: IdempotencyStore, key: str, fingerprint: str, response: Response) -> Response:
+    """Store the response of the view, or release the key if the response can't be stored.
+    The key must have been reserved.
+
+    .. versionadded:: 0.10.0
+    """
+    if response.status_code >= 500 or response.is_streamed or response.direct_passthrough:
+        store.release(key)
+        return response
+
+    store.save(
+        key,
+        {
+            "status": response.status_code,
+            "headers": [
+                [name, value]
+                for name, value in response.headers.items()
+                if name.lower() != "set-cookie" and not is_hop_by_hop_header(name)
+            ],
+            "body": base64.b64encode(response.get_data()).decode("ascii"),
+            "fingerprint": fingerprint,
+        },
+    )
+    return response
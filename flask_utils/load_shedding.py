@@ -0,0 +1,283 @@
+import time
+import inspect
+import threading
+from typing import Any
+from typing import Union
+from typing import Callable
+from typing import Optional
+from functools import wraps
+
+from flask import Flask
+from flask import Response
+from flask import g
+
+from flask_utils.errors import ServiceUnavailableError
+from flask_utils.errors import _generate_error_response
+
+
+class ConcurrencyLimiter(object):
+    """
+    Admission controller limiting the number of requests processed at the same time.
+
+    Requests over the limit wait in a bounded queue for at most ``queue_timeout`` seconds. When the queue
+    is full, or the timeout expires, the request is rejected right away with a
+    :class:`~flask_utils.errors.ServiceUnavailableError` and a ``Retry-After`` header, instead of piling up
+    and making every other request slower.
+
+    When ``adaptive`` is ``True``, the limit is adjusted with an AIMD (additive increase, multiplicative decrease)
+    algorithm based on the observed latency: every request completing under the latency target increases the limit
+    by ``1 / limit``, and every request completing over it multiplies the limit by ``decrease_factor``.
+    The latency target is ``target_latency`` if given, otherwise ``tolerance`` times the lowest latency observed
+    recently, in the style of TCP Vegas.
+
+    The limiter is thread safe. Use it with :class:`~flask_utils.extension.FlaskUtils` to limit the whole
+    application, or with :func:`limit_concurrency` to limit a single route.
+
+    :param limit: The maximum number of concurrent requests (the initial one if ``adaptive`` is ``True``).
+    :type limit: int
+    :param queue_size: The maximum number of requests waiting for a slot. Defaults to ``0`` (no queue).
+    :type queue_size: int
+    :param queue_timeout: The maximum number of seconds a request waits in the queue. Defaults to ``1``.
+    :type queue_timeout: float
+    :param retry_after: The value of the ``Retry-After`` header of the rejected requests, in seconds.
+        Defaults to ``1``.
+    :type retry_after: int
+    :param adaptive: Adjust the limit based on the observed latency. Defaults to ``False``.
+    :type adaptive: bool
+    :param min_limit: The lowest value of an adaptive limit. Defaults to ``1``.
+    :type min_limit: int
+    :param max_limit: The highest value of an adaptive limit. Defaults to ``limit * 10``.
+    :type max_limit: Optional[int]
+    :param target_latency: The latency target of an adaptive limit, in seconds.
+        Defaults to ``None`` (based on the lowest observed latency).
+    :type target_latency: Optional[float]
+    :param tolerance: The factor applied to the lowest observed latency to get the latency target.
+        Defaults to ``2``.
+    :type tolerance: float
+    :param decrease_factor: The factor applied to the limit when the latency target is exceeded.
+        Defaults to ``0.9``.
+    :type decrease_factor: float
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask import Flask
+        from flask_utils import FlaskUtils
+        from flask_utils import ConcurrencyLimiter
+
+        app = Flask(__name__)
+        FlaskUtils(app, concurrency_limiter=ConcurrencyLimiter(100, queue_size=50, adaptive=True))
+
+    .. versionadded:: 0.10.0
+    """
+
+    # Number of latency samples after which the lowest observed latency is forgotten,
+    # so that the baseline can follow a permanent change of the latency.
+    _MIN_LATENCY_WINDOW = 1000
+
+    def __init__(
+        self,
+        limit: int,
+        queue_size: int = 0,
+        queue_timeout: float = 1,
+        retry_after: int = 1,
+        adaptive: bool = False,
+        min_limit: int = 1,
+        max_limit: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        tolerance: float = 2,
+        decrease_factor: float = 0.9,
+    ) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.adaptive = adaptive
+        self.min_limit = min_limit
+        self.max_limit = max_limit if max_limit is not None else limit * 10
+        self.target_latency = target_latency
+        self.tolerance = tolerance
+        self.decrease_factor = decrease_factor
+
+        self._limit = float(limit)
+        self._in_flight = 0
+        self._waiting = 0
+        self._min_latency: Optional[float] = None
+        self._next_min_latency: Optional[float] = None
+        self._samples = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The current maximum number of concurrent requests."""
+        return max(1, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently being processed."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """The number of requests currently waiting in the queue."""
+        return self._waiting
+
+    def acquire(self) -> bool:
+        """Take a slot, waiting in the queue if needed.
+
+        :return: ``True`` if a slot was taken, ``False`` if the request must be rejected.
+        :rtype: bool
+        """
+        with self._condition:
+            if self._in_flight < self.limit:
+                self._in_flight += 1
+                return True
+            if self._waiting >= self.queue_size:
+                return False
+
+            self._waiting += 1
+            try:
+                deadline = time.monotonic() + self.queue_timeout
+                while self._in_flight >= self.limit:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                self._in_flight += 1
+                return True
+            finally:
+                self._waiting -= 1
+
+    def release(self, latency: Optional[float] = None) -> None:
+        """Give a slot back.
+
+        :param latency: The time it took to process the request, in seconds.
+            Used to adjust the limit when ``adaptive`` is ``True``.
+        :type latency: Optional[float]
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if self.adaptive and latency is not None:
+                self._adjust_limit(latency)
+            self._condition.notify()
+
+    def _adjust_limit(self, latency: float) -> None:
+        self._samples += 1
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        if self._next_min_latency is None or latency < self._next_min_latency:
+            self._next_min_latency = latency
+        if self._samples >= self._MIN_LATENCY_WINDOW:
+            self._min_latency, self._next_min_latency, self._samples = self._next_min_latency, None, 0
+
+        target = self.target_latency if self.target_latency is not None else self._min_latency * self.tolerance
+        if latency > target:
+            self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+    def rejection_response(self) -> Response:
+        """
+        :return: The 503 response sent to the rejected requests.
+        :rtype: flask.Response
+        """
+        return _generate_error_response(
+            ServiceUnavailableError(
+                "The server is overloaded.",
+                f"Try again in {self.retry_after} seconds.",
+                retry_after=self.retry_after,
+            )
+        )
+
+
+def limit_concurrency(limiter: Union[int, ConcurrencyLimiter]) -> Callable:  # type: ignore
+    """
+    Decorator limiting the number of concurrent requests processed by a route.
+
+    :param limiter: The maximum number of concurrent requests, or a :class:`ConcurrencyLimiter`
+        for the queue and adaptive options.
+    :type limiter: Union[int, ConcurrencyLimiter]
+
+    It also works with ``async def`` views: the slot is held until the view has completed.
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils import limit_concurrency
+        from flask_utils import ConcurrencyLimiter
+
+        @app.route("/reports", methods=["POST"])
+        @limit_concurrency(4)
+        def generate_report():
+            ...
+
+        @app.route("/search")
+        @limit_concurrency(ConcurrencyLimiter(20, queue_size=20, queue_timeout=0.5, adaptive=True))
+        def search():
+            ...
+
+    .. versionadded:: 0.10.0
+    """
+    if isinstance(limiter, int):
+        limiter = ConcurrencyLimiter(limiter)
+
+    def decorator(fn):  # type: ignore
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):  # type: ignore
+                if not limiter.acquire():
+                    return limiter.rejection_response()
+                start = time.monotonic()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    limiter.release(time.monotonic() - start)
+
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):  # type: ignore
+            if not limiter.acquire():
+                return limiter.rejection_response()
+            start = time.monotonic()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                limiter.release(time.monotonic() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def _register_concurrency_limiter(application: Flask, limiter: ConcurrencyLimiter) -> None:
+    """
+    This function will limit the number of concurrent requests processed by the application.
+
+    :param application: The Flask application to limit.
+    :type application: flask.Flask
+    :param limiter: The limiter to use.
+    :type limiter: ConcurrencyLimiter
+
+    :return: None
+    :rtype: None
+
+    .. versionadded:: 0.10.0
+    """
+
+    @application.before_request
+    def acquire_concurrency_slot() -> Optional[Response]:
+        if not limiter.acquire():
+            return limiter.rejection_response()
+        g._flask_utils_admitted_at = time.monotonic()
+        return None
+
+    @application.teardown_request
+    def release_concurrency_slot(exc: Optional[BaseException]) -> None:
+        admitted_at: Any = g.pop("_flask_utils_admitted_at", None)
+        if admitted_at is not None:
+            limiter.release(time.monotonic() - admitted_at)
@@ -0,0 +1,272 @@
+import os
+import math
+import mmap
+import time
+import zlib
+import inspect
+import threading
+from typing import Any
+from typing import Union
+from typing import Callable
+from typing import Optional
+from functools import wraps
+
+from flask import Response
+from flask import request
+from flask import current_app
+
+from flask_utils.errors import TooManyRequestsError
+from flask_utils.errors import _generate_error_response
+
+# Size of a bucket in the table: two doubles, the number of tokens and the time of the last update.
+_BUCKET_SIZE = 2 * 8
+
+_DEFAULT_TABLE_KEY = "flask_utils.rate_limit"
+_default_table_lock = threading.Lock()
+
+
+class TokenBucketTable(object):
+    """
+    Fixed-size table of token buckets, used by :func:`rate_limit`.
+
+    The buckets are stored in a flat array of doubles, and each key is mapped to a bucket with a stable hash
+    (CRC32), so checking a bucket is O(1) and the memory used doesn't depend on the number of clients.
+    Two keys can land in the same bucket and then share their budget, so the table should have several times
+    more slots than the number of clients active at the same time.
+
+    The buckets are updated without any lock: under heavy concurrency, two requests updating the same bucket
+    at the same time can lose one of the updates, making the limit slightly less strict, but no request
+    ever waits for another one.
+
+    The memory of the table can be:
+
+    * private to the process (the default),
+    * an anonymous shared memory mapping (``shared=True``), inherited by the workers forked after its creation,
+      for example when the table is created before a pre-forking server (like gunicorn) forks its workers,
+    * a memory-mapped file (``path="..."``), shared by every process opening the same file.
+
+    :param slots: The number of buckets in the table. Defaults to ``65536`` (1 MiB of memory).
+    :type slots: int
+    :param shared: Use an anonymous shared memory mapping. Defaults to ``False``.
+    :type shared: bool
+    :param path: Use a memory-mapped file at this path. Defaults to ``None``.
+    :type path: Optional[str]
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils import rate_limit
+        from flask_utils import TokenBucketTable
+
+        # Created at import time, before gunicorn forks the workers
+        shared_table = TokenBucketTable(shared=True)
+
+        @app.route("/login", methods=["POST"])
+        @rate_limit(5, period=60, table=shared_table)
+        def login():
+            ...
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(self, slots: int = 65536, shared: bool = False, path: Optional[str] = None) -> None:
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        self.slots = slots
+        size = slots * _BUCKET_SIZE
+        self._buffer: Any
+        if path is not None:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if os.fstat(fd).st_size != size:
+                    os.ftruncate(fd, size)
+                self._buffer = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+        elif shared:
+            self._buffer = mmap.mmap(-1, size)
+        else:
+            self._buffer = bytearray(size)
+        self._buckets = memoryview(self._buffer).cast("d")
+
+    def consume(self, key: str, rate: float, burst: float, cost: float = 1) -> float:
+        """Take ``cost`` tokens from the bucket of ``key``, if it has enough.
+
+        :param key: The key of the bucket.
+        :type key: str
+        :param rate: The number of tokens added to the bucket per second.
+        :type rate: float
+        :param burst: The capacity of the bucket.
+        :type burst: float
+        :param cost: The number of tokens to take. Defaults to ``1``.
+        :type cost: float
+
+        :return: ``0`` if the tokens were taken, otherwise the number of seconds to wait until
+            the bucket has enough tokens.
+        :rtype: float
+        """
+        index = (zlib.crc32(key.encode("utf-8")) % self.slots) * 2
+        buckets = self._buckets
+        now = time.time()
+
+        tokens, updated_at = buckets[index], buckets[index + 1]
+        if updated_at == 0:
+            tokens = burst
+        else:
+            tokens = min(burst, tokens + max(0.0, now - updated_at) * rate)
+
+        if tokens >= cost:
+            buckets[index], buckets[index + 1] = tokens - cost, now
+            return 0
+
+        buckets[index], buckets[index + 1] = tokens, now
+        return (cost - tokens) / rate
+
+    def clear(self) -> None:
+        """Reset every bucket of the table."""
+        self._buffer[:] = bytes(len(self._buffer))
+
+
+def _get_key_func(key: Union[str, Callable[[], Optional[str]]]) -> Callable[[], Optional[str]]:
+    """Turn the ``key`` parameter of :func:`rate_limit` into a function returning the key of the current request.
+
+    :param key: ``"ip"``, ``"header:<name>"`` or a function.
+    :type key: Union[str, Callable[[], Optional[str]]]
+
+    :return: The function returning the key.
+    :rtype: Callable[[], Optional[str]]
+
+    .. versionadded:: 0.10.0
+    """
+    if callable(key):
+        return key
+    if key == "ip":
+        return lambda: request.remote_addr
+    if key.startswith("header:"):
+        header = key[len("header:") :]
+        return lambda: request.headers.get(header)
+    raise ValueError(f'Invalid rate limit key: {key}. It should be "ip", "header:<name>" or a function.')
+
+
+def _get_default_table() -> TokenBucketTable:
+    """Get the table of the views of the current application decorated by :func:`rate_limit` without a ``table``.
+
+    The table is created on the first rate limited request of the application and stored in its
+    ``extensions``, so that all its views share a single table, and the applications don't share their buckets.
+
+    :return: The default table of the current application.
+    :rtype: TokenBucketTable
+
+    .. versionadded:: 0.10.0
+    """
+    table: Optional[TokenBucketTable] = current_app.extensions.get(_DEFAULT_TABLE_KEY)
+    if table is None:
+        with _default_table_lock:
+            table = current_app.extensions.get(_DEFAULT_TABLE_KEY)
+            if table is None:
+                table = current_app.extensions[_DEFAULT_TABLE_KEY] = TokenBucketTable()
+    return table
+
+
+def rate_limit(
+    limit: int,
+    period: float = 1,
+    burst: Optional[int] = None,
+    key: Union[str, Callable[[], Optional[str]]] = "ip",
+    table: Optional[TokenBucketTable] = None,
+) -> Callable:  # type: ignore
+    """
+    Decorator limiting the rate of requests to a route, with a token bucket per client.
+
+    Each client can make ``limit`` requests per ``period`` seconds on average, with bursts of up to ``burst``
+    requests. The requests over the limit get a :class:`~flask_utils.errors.TooManyRequestsError` response
+    with a ``Retry-After`` header, without calling the view. It also works with ``async def`` views.
+
+    :param limit: The number of requests allowed per ``period``.
+    :type limit: int
+    :param period: The period, in seconds. Defaults to ``1``.
+    :type period: float
+    :param burst: The maximum number of requests in a burst. Defaults to ``limit``.
+    :type burst: Optional[int]
+    :param key: How to identify the clients: ``"ip"`` for the remote address, ``"header:<name>"``
+        for the value of a header (for example ``"header:X-Api-Key"``), or a function returning the key.
+        The requests for which the key is ``None`` are not limited. Defaults to ``"ip"``.
+    :type key: Union[str, Callable[[], Optional[str]]]
+    :param table: The table storing the buckets, to share them between workers. Defaults to a
+        :class:`TokenBucketTable` private to the process and shared by all the views of the application
+        decorated without a ``table`` (see :func:`_get_default_table`).
+    :type table: Optional[TokenBucketTable]
+
+    :raises ValueError: If ``limit`` or ``burst`` is lower than ``1``, or if ``period`` is not positive.
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask import g
+        from flask_utils import rate_limit
+
+        @app.route("/search")
+        @rate_limit(10)  # 10 requests per second per IP address
+        def search():
+            ...
+
+        @app.route("/export", methods=["POST"])
+        @rate_limit(100, period=3600, burst=10, key=lambda: g.user.id)
+        def export():
+            ...
+
+    .. versionadded:: 0.10.0
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    if period <= 0:
+        raise ValueError("period must be greater than 0")
+    if burst is not None and burst < 1:
+        raise ValueError("burst must be at least 1")
+    rate = limit / period
+    capacity = float(burst if burst is not None else limit)
+    get_key = _get_key_func(key)
+
+    def decorator(fn):  # type: ignore
+        # The name of the view is part of the key, so that several routes can share a table.
+        prefix = f"{fn.__module__}.{fn.__qualname__}:"
+
+        def _check_limit() -> Optional[Response]:
+            client_key = get_key()
+            if client_key is None:
+                return None
+            bucket_table = table if table is not None else _get_default_table()
+            wait = bucket_table.consume(prefix + str(client_key), rate, capacity)
+            if wait <= 0:
+                return None
+            return _generate_error_response(
+                TooManyRequestsError(
+                    "Too many requests.",
+                    f"Try again in {math.ceil(wait)} seconds.",
+                    retry_after=math.ceil(wait),
+                )
+            )
+
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):  # type: ignore
+                error_response = _check_limit()
+                if error_response is not None:
+                    return error_response
+                return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):  # type: ignore
+            error_response = _check_limit()
+            if error_response is not None:
+                return error_response
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
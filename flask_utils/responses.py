@@ -0,0 +1,318 @@
+import hashlib
+import inspect
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from functools import wraps
+
+from flask import Response
+from flask import request
+from flask import current_app
+
+from flask_utils.errors.base_class import _BaseFlaskException
+from flask_utils.errors._error_template import _generate_error_dict
+
+
+def _compute_etag(data: bytes) -> str:
+    """Hash the given data into an ETag value.
+
+    :param data: The data to hash.
+    :type data: bytes
+
+    :return: The hexadecimal digest of the data.
+    :rtype: str
+
+    .. versionadded:: 0.10.0
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _not_modified(tag: str, weak: bool) -> Response:
+    """Create an empty 304 response carrying the given ETag.
+
+    :param tag: The ETag value.
+    :type tag: str
+    :param weak: Whether the ETag is weak.
+    :type weak: bool
+
+    :return: The 304 response.
+    :rtype: flask.Response
+
+    .. versionadded:: 0.10.0
+    """
+    response = Response(status=304)
+    response.set_etag(tag, weak)
+    return response
+
+
+def etag(version: Optional[Callable[..., Any]] = None, weak: bool = False) -> Callable:  # type: ignore
+    """
+    Decorator adding an ``ETag`` header to the responses of a ``GET`` route,
+    and answering ``304 Not Modified`` when the client already has the current version.
+
+    If ``version`` is given, it is called with the same arguments as the view, before the view.
+    Its return value (for example an ``updated_at`` timestamp or a revision number) is used to
+    compute the ETag. If the ``If-None-Match`` header of the request matches, the view is never called,
+    so nothing is queried nor serialized.
+
+    Otherwise, or if ``version`` returns ``None``, the view is called and the ETag is a hash of the
+    response body. This saves the bandwidth but not the serialization.
+
+    Only the ``GET`` and ``HEAD`` requests are handled, other methods are passed through.
+    Only the ``200`` responses get an ETag, and without ``version`` they must not be streamed.
+    It also works with ``async def`` views, ``version`` staying a regular function.
+
+    :param version: Cheap function returning the version of the resource. Defaults to ``None``.
+    :type version: Optional[Callable[..., Any]]
+    :param weak: Whether to send a weak ETag (``W/"..."``). Defaults to ``False``.
+    :type weak: bool
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask import Flask
+        from flask_utils import etag
+
+        app = Flask(__name__)
+
+        @app.get("/articles/<int:article_id>")
+        @etag(version=lambda article_id: Article.get_updated_at(article_id))
+        def get_article(article_id):
+            return Article.get(article_id).to_dict()
+
+        @app.get("/countries")
+        @etag()
+        def get_countries():
+            return {"countries": COUNTRIES}
+
+    .. versionadded:: 0.10.0
+    """
+
+    def _check_version(*args: Any, **kwargs: Any) -> Tuple[Optional[Response], Optional[str]]:
+        """Get the ETag of the resource from ``version``, and the 304 response if the client has it."""
+        if version is None:
+            return None, None
+        current_version = version(*args, **kwargs)
+        if current_version is None:
+            return None, None
+        tag = _compute_etag(str(current_version).encode("utf-8"))
+        if request.if_none_match.contains_weak(tag):
+            return _not_modified(tag, weak), tag
+        return None, tag
+
+    def _set_etag(response: Response, tag: Optional[str]) -> Response:
+        """Set the ETag of the response of the view, hashing its body if the version is unknown."""
+        if response.status_code != 200:
+            return response
+
+        if tag is not None:
+            response.set_etag(tag, weak)
+            return response
+
+        if response.is_streamed or response.direct_passthrough:
+            return response
+
+        tag = _compute_etag(response.get_data())
+        if request.if_none_match.contains_weak(tag):
+            return _not_modified(tag, weak)
+        response.set_etag(tag, weak)
+        return response
+
+    def decorator(fn):  # type: ignore
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):  # type: ignore
+                if request.method not in ("GET", "HEAD"):
+                    return await fn(*args, **kwargs)
+                not_modified, tag = _check_version(*args, **kwargs)
+                if not_modified is not None:
+                    return not_modified
+                return _set_etag(current_app.make_response(await fn(*args, **kwargs)), tag)
+
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):  # type: ignore
+            if request.method not in ("GET", "HEAD"):
+                return fn(*args, **kwargs)
+            not_modified, tag = _check_version(*args, **kwargs)
+            if not_modified is not None:
+                return not_modified
+            return _set_etag(current_app.make_response(fn(*args, **kwargs)), tag)
+
+        return wrapper
+
+    return decorator
+
+
+def _stream_error_dict(error: Exception) -> Dict[str, Any]:
+    """Generate the record ending a stream interrupted by an error.
+
+    The errors of the library are rendered with :func:`~flask_utils.errors._error_template._generate_error_dict`,
+    the other ones with a generic 500 error, so that their message is not sent to the client.
+
+    :param error: The error raised by the iterable.
+    :type error: Exception
+
+    :return: The error record.
+    :rtype: Dict[str, Any]
+
+    .. versionadded:: 0.10.0
+    """
+    if isinstance(error, _BaseFlaskException):
+        return _generate_error_dict(error)
+    return {
+        "success": False,
+        "error": {
+            "type": "InternalServerError",
+            "name": "Internal Server Error",
+            "message": "The stream was interrupted by an error.",
+            "solution": "Try again later.",
+        },
+        "code": 500,
+    }
+
+
+def _stream_records(
+    iterable: Iterable[Any], batch_size: int, prefix: str, separator: str, suffix: str, empty: str
+) -> Iterator[str]:
+    """Encode the items of ``iterable`` as JSON, yielding them by batches of ``batch_size`` items.
+
+    If the iterable raises an error, the error is logged and an error record is emitted as the last item.
+
+    :param iterable: The items to encode.
+    :type iterable: Iterable[Any]
+    :param batch_size: The number of items per chunk.
+    :type batch_size: int
+    :param prefix: The string before the first item.
+    :type prefix: str
+    :param separator: The string between two items.
+    :type separator: str
+    :param suffix: The string after the last item.
+    :type suffix: str
+    :param empty: The whole document when there is no item.
+    :type empty: str
+
+    :return: The chunks of the document.
+    :rtype: Iterator[str]
+
+    .. versionadded:: 0.10.0
+    """
+    # Bound now, as the generator is consumed after the end of the request.
+    dumps = current_app.json.dumps
+    logger = current_app.logger
+
+    def generate() -> Iterator[str]:
+        batch: List[str] = [prefix]
+        count = 0
+        try:
+            for item in iterable:
+                if count:
+                    batch.append(separator)
+                batch.append(dumps(item))
+                count += 1
+                if count % batch_size == 0:
+                    yield "".join(batch)
+                    batch.clear()
+        except Exception as e:
+            logger.exception("Error while streaming a response")
+            if count:
+                batch.append(separator)
+            batch.append(dumps(_stream_error_dict(e)))
+            count += 1
+
+        if count:
+            batch.append(suffix)
+            yield "".join(batch)
+        else:
+            yield empty
+
+    return generate()
+
+
+def stream_json_array(iterable: Iterable[Any], batch_size: int = 100, status: int = 200) -> Response:
+    """
+    Create a response streaming the items of ``iterable`` as a JSON array.
+
+    The items are encoded one by one as the client reads the response, so that big collections are sent
+    in constant memory. To limit the number of writes, the encoded items are sent by chunks of ``batch_size``.
+
+    If the iterable raises an error partway through, the status code and the first items are already sent:
+    the error is logged and the array ends with an error record, in the same format as the errors of the library.
+
+    :param iterable: The items to send, for example a generator reading rows from a database.
+        The items must be serializable by the JSON provider of the application.
+    :type iterable: Iterable[Any]
+    :param batch_size: The number of items per chunk. Defaults to ``100``.
+    :type batch_size: int
+    :param status: The status code of the response. Defaults to ``200``.
+    :type status: int
+
+    :return: The streamed response.
+    :rtype: flask.Response
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils import stream_json_array
+
+        @app.route("/users/export")
+        def export_users():
+            rows = db.session.execute(select(User.id, User.name)).yield_per(1000)
+            return stream_json_array({"id": row.id, "name": row.name} for row in rows)
+
+    .. versionadded:: 0.10.0
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    return Response(
+        _stream_records(iterable, batch_size, "[", ",", "]", "[]"), status=status, mimetype="application/json"
+    )
+
+
+def stream_ndjson(iterable: Iterable[Any], batch_size: int = 100, status: int = 200) -> Response:
+    """
+    Create a response streaming the items of ``iterable`` as newline delimited JSON (NDJSON),
+    one JSON document per line.
+
+    The items are encoded one by one as the client reads the response, so that big collections are sent
+    in constant memory. To limit the number of writes, the encoded items are sent by chunks of ``batch_size``.
+
+    If the iterable raises an error partway through, the error is logged and the last line is an error record,
+    in the same format as the errors of the library.
+
+    :param iterable: The items to send. The items must be serializable by the JSON provider of the application.
+    :type iterable: Iterable[Any]
+    :param batch_size: The number of items per chunk. Defaults to ``100``.
+    :type batch_size: int
+    :param status: The status code of the response. Defaults to ``200``.
+    :type status: int
+
+    :return: The streamed response.
+    :rtype: flask.Response
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask_utils import stream_ndjson
+
+        @app.route("/events")
+        def events():
+            return stream_ndjson(event.to_dict() for event in Event.query.yield_per(1000))
+
+    .. versionadded:: 0.10.0
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    return Response(
+        _stream_records(iterable, batch_size, "", "\n", "\n", ""), status=status, mimetype="application/x-ndjson"
+    )
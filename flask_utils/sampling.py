@@ -0,0 +1,163 @@
+import time
+import random
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from collections import deque
+
+from flask import request
+
+
+def _payload_shape(data: Any, max_nodes: int) -> Dict[str, Any]:
+    """Describe the shape of a loaded JSON body, without any of its keys nor values.
+
+    :param data: The loaded JSON body.
+    :type data: Any
+    :param max_nodes: The number of values after which the traversal stops, and the shape is marked as truncated.
+    :type max_nodes: int
+
+    :return: The depth of the body, the number of values, objects, arrays and keys, the size of the biggest
+        object and of the longest array.
+    :rtype: Dict[str, Any]
+
+    .. versionadded:: 0.10.0
+    """
+    shape = {
+        "depth": 0,
+        "values": 0,
+        "objects": 0,
+        "arrays": 0,
+        "keys": 0,
+        "max_keys": 0,
+        "max_array_length": 0,
+        "truncated": False,
+    }
+    stack = [(data, 1)]
+    while stack:
+        if shape["values"] >= max_nodes:
+            shape["truncated"] = True
+            break
+        value, depth = stack.pop()
+        shape["values"] += 1
+        if depth > shape["depth"]:
+            shape["depth"] = depth
+        if isinstance(value, dict):
+            shape["objects"] += 1
+            shape["keys"] += len(value)
+            shape["max_keys"] = max(shape["max_keys"], len(value))
+            stack.extend((item, depth + 1) for item in value.values())
+        elif isinstance(value, list):
+            shape["arrays"] += 1
+            shape["max_array_length"] = max(shape["max_array_length"], len(value))
+            stack.extend((item, depth + 1) for item in value)
+    return shape
+
+
+class SlowValidationSampler(object):
+    """
+    Sampler recording the requests whose validation by :func:`~flask_utils.decorators.validate_params`
+    is slower than a time budget, to find the pathological payloads sent in production.
+
+    The validation time covers reading the body, parsing it and checking it, and the requests whose body
+    can't be parsed are recorded too, without a shape. Each slow request is recorded
+    with its endpoint, its timings and the shape of its body (its depth, the number of keys, the length of
+    the arrays...), but none of its keys nor values, so that no personal data is stored.
+    The records are kept in a ring buffer: the oldest ones are dropped when it is full.
+
+    The requests under the budget only cost a clock read; the shape is computed for the slow ones only.
+    Set ``sample_rate`` to record only a fraction of them during a flood of slow requests.
+
+    :param threshold: The validation time budget, in seconds.
+    :type threshold: float
+    :param capacity: The number of records kept. Defaults to ``100``.
+    :type capacity: int
+    :param sample_rate: The fraction of the slow requests recorded, between ``0`` and ``1``. Defaults to ``1``.
+    :type sample_rate: float
+    :param max_nodes: The number of values of a body after which its shape is truncated. Defaults to ``100000``.
+    :type max_nodes: int
+
+    :Example:
+
+    .. code-block:: python
+
+        from flask import Flask
+        from flask_utils import FlaskUtils
+        from flask_utils import SlowValidationSampler
+
+        app = Flask(__name__)
+        sampler = SlowValidationSampler(threshold=0.005)
+        FlaskUtils(app, slow_validation_sampler=sampler)
+
+        @app.get("/admin/slow-validations")
+        def slow_validations():
+            return {"samples": sampler.samples()}
+
+        # {"endpoint": "create_order", "method": "POST", "timestamp": 1700000000.0, "duration": 0.0123,
+        #  "body_size": 812345, "valid": False,
+        #  "shape": {"depth": 3, "values": 50002, "objects": 1, "arrays": 1, "keys": 2, "max_keys": 2,
+        #            "max_array_length": 50000, "truncated": False}}
+
+    .. versionadded:: 0.10.0
+    """
+
+    def __init__(
+        self, threshold: float, capacity: int = 100, sample_rate: float = 1.0, max_nodes: int = 100_000
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.max_nodes = max_nodes
+        self._samples: "deque[Dict[str, Any]]" = deque(maxlen=capacity)
+        self.slow_requests = 0
+
+    def observe(self, data: Any, duration: float, valid: bool) -> None:
+        """Record the validation of the current request if it is over the budget.
+
+        Called by :func:`~flask_utils.decorators.validate_params` in the request context.
+
+        :param data: The loaded JSON body, or ``None`` if it could not be loaded (malformed JSON,
+            wrong ``Content-Type``...). The shape is then ``None``.
+        :type data: Any
+        :param duration: The validation time, in seconds.
+        :type duration: float
+        :param valid: Whether the body is valid.
+        :type valid: bool
+        """
+        if duration < self.threshold:
+            return
+        self.slow_requests += 1
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        self._samples.append(
+            {
+                "endpoint": request.endpoint,
+                "method": request.method,
+                "timestamp": time.time(),
+                "duration": duration,
+                "body_size": request.content_length,
+                "valid": valid,
+                "shape": _payload_shape(data, self.max_nodes) if data is not None else None,
+            }
+        )
+
+    def samples(self, endpoint: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        :param endpoint: Only return the records of this endpoint. Defaults to ``None`` (all the records).
+        :type endpoint: Optional[str]
+
+        :return: The records, from the oldest to the newest.
+        :rtype: List[Dict[str, Any]]
+        """
+        samples = list(self._samples)
+        if endpoint is not None:
+            samples = [sample for sample in samples if sample["endpoint"] == endpoint]
+        return samples
+
+    def clear(self) -> None:
+        """Drop all the records."""
+        self._samples.clear()
+        self.slow_requests = 0
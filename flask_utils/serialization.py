@@ -0,0 +1,349 @@
+import inspect
+import dataclasses
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Callable
+from typing import Optional
+from typing import get_args
+from typing import get_origin
+from typing import get_type_hints
+from functools import wraps
+from json.encoder import encode_basestring_ascii
+
+from flask import Response
+from flask import current_app
+
+from flask_utils.decorators import _check_type
+
+_Encoder = Callable[[Any], str]
+_OutputChecker = Callable[[Any, str], Optional[str]]
+
+_INFINITY = float("inf")
+
+
+def _encode_any(value: Any) -> str:
+    """Encode a value with the JSON provider of the current application.
+
+    :param value: The value to encode.
+    :type value: Any
+
+    :return: The JSON representation of the value.
+    :rtype: str
+
+    .. versionadded:: 0.10.0
+    """
+    return current_app.json.dumps(value)
+
+
+def _encode_bool(value: Any) -> str:
+    return "true" if value else "false"
+
+
+def _encode_float(value: Any) -> str:
+    if not isinstance(value, float):
+        return int.__repr__(value)
+    # Not valid JSON, but encoded like the json module and the JSON provider of Flask do
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+_LEAF_ENCODERS: Dict[Any, _Encoder] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: _encode_bool,
+    type(None): lambda value: "null",
+}
+
+
+def _optional_arg(type_hint: Any) -> Any:
+    """Get ``X`` if the type hint is ``Optional[X]``, otherwise ``None``."""
+    if get_origin(type_hint) is Union:
+        args = [arg for arg in get_args(type_hint) if arg is not type(None)]
+        if len(args) == 1 and len(args) < len(get_args(type_hint)):
+            return args[0]
+    return None
+
+
+def _get_fields(schema: Any) -> Optional[Dict[str, Any]]:
+    """Get the fields of an object schema: a dict of key names and type hints, or a dataclass.
+
+    :param schema: The schema.
+    :type schema: Any
+
+    :return: The type hint of each key, or ``None`` if the schema doesn't describe an object.
+    :rtype: Optional[Dict[str, Any]]
+
+    .. versionadded:: 0.10.0
+    """
+    if isinstance(schema, dict):
+        return schema
+    if inspect.isclass(schema) and dataclasses.is_dataclass(schema):
+        type_hints = get_type_hints(schema)
+        return {field.name: type_hints[field.name] for field in dataclasses.fields(schema)}
+    return None
+
+
+def _compile_encoder(schema: Any) -> _Encoder:
+    """Compile a schema into a function encoding the values matching it into JSON.
+
+    The type dispatch is done once here, so that encoding a value only calls the encoders of its fields.
+    The values of the types the compiler doesn't know are encoded with the JSON provider of the application.
+
+    :param schema: A type hint, a dict of key names and type hints, or a dataclass.
+    :type schema: Any
+
+    :return: The encoder.
+    :rtype: Callable[[Any], str]
+
+    .. versionadded:: 0.10.0
+    """
+    fields = _get_fields(schema)
+    if fields is not None:
+        return _compile_object_encoder(fields)
+
+    if schema in _LEAF_ENCODERS:
+        return _LEAF_ENCODERS[schema]
+
+    optional_arg = _optional_arg(schema)
+    if optional_arg is not None:
+        encode_value = _compile_encoder(optional_arg)
+        return lambda value: "null" if value is None else encode_value(value)
+
+    origin = get_origin(schema)
+    args = get_args(schema)
+    if origin is list and args:
+        encode_item = _compile_encoder(args[0])
+        return lambda value: "[" + ",".join([encode_item(item) for item in value]) + "]"
+    if origin is dict and args and args[0] is str:
+        encode_item = _compile_encoder(args[1])
+        return lambda value: (
+            "{"
+            + ",".join([encode_basestring_ascii(key) + ":" + encode_item(item) for key, item in value.items()])
+            + "}"
+        )
+
+    return _encode_any
+
+
+def _compile_object_encoder(fields: Dict[str, Any]) -> _Encoder:
+    """Compile the fields of an object schema into an encoder.
+
+    The encoded keys are computed once. The values are read with ``obj[key]`` from the dicts and with
+    ``getattr(obj, key)`` from the other objects (dataclasses, objects with ``__slots__``...).
+    The missing ``Optional`` keys are encoded as ``null``.
+
+    :param fields: The type hint of each key.
+    :type fields: Dict[str, Any]
+
+    :return: The encoder.
+    :rtype: Callable[[Any], str]
+
+    .. versionadded:: 0.10.0
+    """
+    compiled: List[Tuple[str, str, bool, _Encoder]] = []
+    for index, (key, type_hint) in enumerate(fields.items()):
+        prefix = ("{" if index == 0 else ",") + encode_basestring_ascii(key) + ":"
+        optional = type_hint is Any or _optional_arg(type_hint) is not None
+        compiled.append((prefix, key, optional, _compile_encoder(type_hint)))
+
+    if not compiled:
+        return lambda value: "{}"
+
+    def encode_object(value: Any) -> str:
+        parts = []
+        if isinstance(value, dict):
+            for prefix, key, optional, encode_value in compiled:
+                parts.append(prefix)
+                parts.append(encode_value(value.get(key) if optional else value[key]))
+        else:
+            for prefix, key, optional, encode_value in compiled:
+                parts.append(prefix)
+                parts.append(encode_value(getattr(value, key, None) if optional else getattr(value, key)))
+        parts.append("}")
+        return "".join(parts)
+
+    return encode_object
+
+
+def _compile_output_checker(schema: Any) -> _OutputChecker:
+    """Compile a schema into a function checking that a value matches it.
+
+    The ``Optional``, ``List`` and ``Dict[str, ...]`` type hints are walked like :func:`_compile_encoder` does,
+    so that the objects they contain can be dicts or dataclasses. The other types are checked
+    by :func:`~flask_utils.decorators._check_type`.
+
+    :param schema: A type hint, a dict of key names and type hints, or a dataclass.
+    :type schema: Any
+
+    :return: A function taking the value and its path, and returning ``None`` if the value is valid,
+        otherwise the error message.
+    :rtype: Callable[[Any, str], Optional[str]]
+
+    .. versionadded:: 0.10.0
+    """
+    fields = _get_fields(schema)
+    if fields is not None:
+        checkers = [
+            (key, type_hint is Any or _optional_arg(type_hint) is not None, _compile_output_checker(type_hint))
+            for key, type_hint in fields.items()
+        ]
+
+        def check_object(value: Any, path: str) -> Optional[str]:
+            is_dict = isinstance(value, dict)
+            for key, optional, check_value in checkers:
+                if is_dict:
+                    present = key in value
+                    item = value.get(key)
+                else:
+                    present = hasattr(value, key)
+                    item = getattr(value, key, None)
+                if not present:
+                    if optional:
+                        continue
+                    return f"Missing key {path}.{key}" if path else f"Missing key {key}"
+                error = check_value(item, f"{path}.{key}" if path else key)
+                if error is not None:
+                    return error
+            return None
+
+        return check_object
+
+    optional_arg = _optional_arg(schema)
+    if optional_arg is not None:
+        check_optional = _compile_output_checker(optional_arg)
+        return lambda value, path: None if value is None else check_optional(value, path)
+
+    origin = get_origin(schema)
+    args = get_args(schema)
+    if origin is list and args:
+        check_item = _compile_output_checker(args[0])
+
+        def check_list(value: Any, path: str) -> Optional[str]:
+            if not isinstance(value, list):
+                return f"Wrong type for {path or 'the response'}. It should be a list"
+            for index, item in enumerate(value):
+                error = check_item(item, f"{path}[{index}]")
+                if error is not None:
+                    return error
+            return None
+
+        return check_list
+
+    if origin is dict and args and args[0] is str:
+        check_item = _compile_output_checker(args[1])
+
+        def check_dict(value: Any, path: str) -> Optional[str]:
+            if not isinstance(value, dict):
+                return f"Wrong type for {path or 'the response'}. It should be a dict"
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    return f"Wrong type for the key {key!r} of {path or 'the response'}. It should be str"
+                error = check_item(item, f"{path}.{key}" if path else key)
+                if error is not None:
+                    return error
+            return None
+
+        return check_dict
+
+    def check_value(value: Any, path: str) -> Optional[str]:
+        if _check_type(value, schema):
+            return None
+        return f"Wrong type for {path or 'the response'}. It should be {getattr(schema, '__name__', str(schema))}"
+
+    return check_value
+
+
+def serialize_response(schema: Any, validate: Optional[bool] = None) -> Callable:  # type: ignore
+    """
+    Decorator serializing the return value of a view into JSON, following an output schema.
+
+    The schema is compiled once, when the view is decorated, into an encoder producing the JSON document
+    directly, instead of going through :func:`flask.jsonify` and its type dispatch on every value.
+    The view can return dicts, dataclasses or any object with the attributes of the schema
+    (for example with ``__slots__``), optionally with a status code and headers, like any Flask view.
+    Returning a :class:`flask.Response` bypasses the serialization.
+
+    The schema uses the same types as :func:`~flask_utils.decorators.validate_params`. It can be a dict of keys
+    and types, a dataclass, or a type like ``List[...]``, and the nested objects can be described
+    by dicts or dataclasses. The values of the types the compiler doesn't know, like ``Any`` or ``datetime``,
+    are encoded by the JSON provider of the application. The missing ``Optional`` keys are encoded as ``null``.
+
+    :param schema: The output schema.
+    :type schema: Any
+    :param validate: Check that the return value matches the schema before encoding it, and raise a
+        :class:`TypeError` otherwise. Defaults to ``None``, which validates only when the application is
+        in debug mode, so that the checks are skipped in production.
+    :type validate: Optional[bool]
+
+    :Example:
+
+    .. code-block:: python
+
+        from typing import List
+        from typing import Optional
+        from dataclasses import dataclass
+        from flask_utils import serialize_response
+
+        @dataclass
+        class UserOut:
+            id: int
+            name: str
+            email: Optional[str]
+
+        @app.route("/users")
+        @serialize_response({"users": List[UserOut], "total": int})
+        def list_users():
+            users = User.query.all()
+            return {"users": users, "total": len(users)}
+
+        @app.route("/users", methods=["POST"])
+        @serialize_response(UserOut)
+        def create_user():
+            ...
+            return user, 201
+
+    .. versionadded:: 0.10.0
+    """
+    encode = _compile_encoder(schema)
+    check = _compile_output_checker(schema)
+
+    def _make_response(rv: Any) -> Response:
+        if isinstance(rv, Response):
+            return rv
+        rest: Tuple[Any, ...] = ()
+        if isinstance(rv, tuple):
+            rv, rest = rv[0], rv[1:]
+        if validate or (validate is None and current_app.debug):
+            error = check(rv, "")
+            if error is not None:
+                raise TypeError(error)
+        response = current_app.response_class(encode(rv).encode("utf-8"), mimetype="application/json")
+        if rest:
+            return current_app.make_response((response, *rest))
+        return response
+
+    def decorator(fn):  # type: ignore
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):  # type: ignore
+                return _make_response(await fn(*args, **kwargs))
+
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):  # type: ignore
+            return _make_response(fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,136 @@
+import time
+
+import pytest
+
+from flask_utils import CircuitBreaker
+from flask_utils import FailedDependencyError
+from flask_utils import OriginIsUnreachableError
+
+
+class DependencyDown(Exception):
+    pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def fail(breaker, times=1):
+    for _ in range(times):
+        with pytest.raises(DependencyDown):
+            with breaker:
+                raise DependencyDown()
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=3)
+        fail(breaker, 2)
+        assert breaker.state == CircuitBreaker.CLOSED
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(FailedDependencyError) as exc_info:
+            with breaker:
+                pytest.fail("The call should not go through")
+        assert exc_info.value.msg == "The billing dependency is unavailable."
+        assert exc_info.value.retry_after == 30
+
+    def test_failures_leave_the_window(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=3, window=10, buckets=10)
+        fail(breaker, 2)
+        clock[0] += 11
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failure_rate(self, clock):
+        breaker = CircuitBreaker("billing", failure_rate_threshold=0.5, minimum_calls=4)
+        fail(breaker, 3)
+        assert breaker.state == CircuitBreaker.CLOSED  # Not enough calls yet
+        with breaker:
+            pass
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_success_closes(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1, recovery_timeout=30)
+        fail(breaker)
+        clock[0] += 30
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        with breaker:
+            pass
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_failure_opens_again(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1, recovery_timeout=30)
+        fail(breaker)
+        clock[0] += 30
+        fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_max_calls(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1, recovery_timeout=30)
+        fail(breaker)
+        clock[0] += 30
+        breaker.before_call()
+        with pytest.raises(FailedDependencyError):
+            breaker.before_call()
+
+    def test_ignored_exceptions(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1, exceptions=(DependencyDown,))
+        with pytest.raises(ValueError):
+            with breaker:
+                raise ValueError()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_ignored_exception_releases_half_open_slot(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1, exceptions=(DependencyDown,))
+        fail(breaker)
+        clock[0] += 30
+        with pytest.raises(ValueError):
+            with breaker:
+                raise ValueError()
+        with breaker:
+            pass
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_reset(self, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1)
+        fail(breaker)
+        breaker.reset()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_decorator(self, clock):
+        breaker = CircuitBreaker("search", failure_threshold=2, error_class=OriginIsUnreachableError)
+        calls = []
+
+        @breaker
+        def call_search():
+            calls.append(1)
+            raise DependencyDown()
+
+        for _ in range(2):
+            with pytest.raises(DependencyDown):
+                call_search()
+        with pytest.raises(OriginIsUnreachableError):
+            call_search()
+        assert len(calls) == 2
+
+    def test_in_a_route(self, flask_client, client, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1)
+
+        @flask_client.get("/invoices")
+        def invoices():
+            with breaker:
+                raise DependencyDown()
+
+        flask_client.testing = False
+        assert client.get("/invoices").status_code == 500
+
+        response = client.get("/invoices")
+        assert response.status_code == 424
+        assert response.headers["Retry-After"] == "30"
+        assert response.get_json()["error"]["type"] == "FailedDependencyError"
@@ -0,0 +1,145 @@
+import json
+from typing import List
+
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import validate_params
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    FlaskUtils(app)
+
+    @app.post("/users")
+    @validate_params({"name": str, "age": int, "tags": List[str]})
+    def create_user():
+        return "OK", 200
+
+    @app.patch("/users/<int:user_id>")
+    @validate_params({"name": str, "age": int}, partial=True)
+    def update_user(user_id):
+        return "OK", 200
+
+    @app.get("/health")
+    def health():
+        return "OK", 200
+
+    return app
+
+
+@pytest.fixture
+def ndjson(tmp_path):
+    path = tmp_path / "bodies.ndjson"
+    lines = [
+        json.dumps({"name": "Jules", "age": 30, "tags": []}),
+        json.dumps({"name": "Jules", "age": "30", "tags": []}),
+        "",
+        "{not json",
+        json.dumps({"name": 1, "age": "30", "tags": [1]}),
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def invoke(app, *args):
+    return app.test_cli_runner().invoke(args=["flask-utils", "validate", *map(str, args)])
+
+
+def read_errors(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestValidateCommand:
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_ndjson(self, app, ndjson, tmp_path, jobs):
+        output = tmp_path / "errors.ndjson"
+        result = invoke(app, "create_user", ndjson, "--jobs", jobs, "--chunk-size", 1, "-o", output)
+
+        assert result.exit_code == 1
+        assert "Validated 4 records: 1 valid, 3 invalid." in result.output
+        errors = read_errors(output)
+        assert [error["line"] for error in errors] == [2, 4, 5]
+        assert errors[0]["error"]["message"] == "Wrong type for key age."
+        assert errors[0]["error"]["type"] == "BadRequestError"
+        assert errors[0]["code"] == 400
+        assert errors[1]["error"]["message"] == "The Json Body is malformed."
+
+    def test_json_array(self, app, tmp_path):
+        path = tmp_path / "bodies.json"
+        path.write_text(json.dumps([{"name": "Jules", "age": 30, "tags": []}, {"name": "Jules"}]))
+        output = tmp_path / "errors.ndjson"
+        result = invoke(app, "create_user", path, "--jobs", 1, "-o", output)
+
+        assert result.exit_code == 1
+        assert "Validated 2 records: 1 valid, 1 invalid." in result.output
+        errors = read_errors(output)
+        assert [error["index"] for error in errors] == [1]
+        assert errors[0]["error"]["message"] == "Missing key: age"
+
+    def test_leading_blank_lines(self, app, tmp_path):
+        path = tmp_path / "bodies.ndjson"
+        path.write_text("\n  \n" + json.dumps({"name": 1}) + "\n" + json.dumps({"name": 2}) + "\n")
+        output = tmp_path / "errors.ndjson"
+        invoke(app, "create_user", path, "--jobs", 1, "-o", output)
+
+        assert [error["line"] for error in read_errors(output)] == [3, 4]
+
+    def test_malformed_json_array(self, app, tmp_path):
+        path = tmp_path / "bodies.json"
+        path.write_text('\n[{"name": "Jules"},')
+        result = invoke(app, "create_user", path, "--jobs", 1)
+
+        assert result.exit_code == 2
+        assert "The JSON array is malformed" in result.output
+
+    def test_empty_file(self, app, tmp_path):
+        path = tmp_path / "bodies.ndjson"
+        path.write_text("\n\n")
+        result = invoke(app, "create_user", path, "--jobs", 1)
+
+        assert result.exit_code == 0
+        assert "Validated 0 records: 0 valid, 0 invalid." in result.output
+
+    def test_all_valid(self, app, tmp_path):
+        path = tmp_path / "bodies.ndjson"
+        path.write_text(json.dumps({"name": "Jules", "age": 30, "tags": ["a"]}) + "\n")
+        result = invoke(app, "create_user", path, "--jobs", 1)
+
+        assert result.exit_code == 0
+        assert "Validated 1 records: 1 valid, 0 invalid." in result.output
+
+    def test_collect_errors(self, app, ndjson, tmp_path):
+        output = tmp_path / "errors.ndjson"
+        invoke(app, "create_user", ndjson, "--jobs", 1, "--collect-errors", "-o", output)
+
+        errors = read_errors(output)
+        assert [item["path"] for item in errors[2]["error"]["errors"]] == ["name", "age", "tags[0]"]
+
+    def test_partial(self, app, tmp_path):
+        path = tmp_path / "bodies.ndjson"
+        path.write_text(json.dumps({"age": 30}) + "\n")
+
+        assert invoke(app, "update_user", path, "--jobs", 1).exit_code == 0
+        assert invoke(app, "update_user", path, "--jobs", 1, "--no-partial").exit_code == 1
+
+    def test_quiet(self, app, ndjson, tmp_path):
+        output = tmp_path / "errors.ndjson"
+        result = invoke(app, "create_user", ndjson, "--jobs", 1, "--quiet", "-o", output)
+
+        assert result.exit_code == 1
+        assert not output.exists()
+
+    def test_unknown_endpoint(self, app, ndjson):
+        result = invoke(app, "delete_user", ndjson)
+
+        assert result.exit_code == 2
+        assert "No view is registered for the endpoint 'delete_user'." in result.output
+
+    def test_view_without_schema(self, app, ndjson):
+        result = invoke(app, "health", ndjson)
+
+        assert result.exit_code == 2
+        assert "The view 'health' is not decorated with validate_params." in result.output
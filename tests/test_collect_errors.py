@@ -0,0 +1,109 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import validate_params
+
+SCHEMA = {
+    "name": str,
+    "age": int,
+    "courses": List[str],
+    "grades": Dict[str, int],
+    "nicknames": Optional[List[str]],
+    "matrix": List[List[int]],
+}
+
+VALID = {"name": "Jules", "age": 20, "courses": ["math"], "grades": {"math": 18}, "matrix": [[1, 2]]}
+
+
+@pytest.fixture(autouse=True)
+def setup_routes(flask_client):
+    @flask_client.post("/students")
+    @validate_params(SCHEMA, collect_errors=True)
+    def create_student():
+        return "OK", 200
+
+    @flask_client.post("/limited")
+    @validate_params(SCHEMA, collect_errors=True, max_errors=2)
+    def limited():
+        return "OK", 200
+
+
+def paths(response):
+    return [error["path"] for error in response.get_json()["error"]["errors"]]
+
+
+class TestCollectErrors:
+    def test_valid(self, client):
+        assert client.post("/students", json=VALID).status_code == 200
+
+    def test_nested_paths(self, client):
+        body = dict(
+            VALID,
+            courses=["math", 3, "art", None],
+            grades={"math": "A", "art": 12},
+            nicknames=["Jo", 1],
+            matrix=[[1], [2, "x"]],
+        )
+        response = client.post("/students", json=body)
+        assert response.status_code == 400
+        # The test client sorts the keys of the body
+        assert paths(response) == ["courses[1]", "courses[3]", "grades.math", "matrix[1][1]", "nicknames[1]"]
+
+        error = response.get_json()["error"]
+        assert error["message"] == "Wrong type for key courses[1]."
+        assert error["solution"] == "It should be str"
+        assert error["errors"][2] == {
+            "path": "grades.math",
+            "message": "Wrong type for key grades.math.",
+            "solution": "It should be int",
+        }
+
+    def test_missing_unexpected_and_wrong_types(self, client):
+        response = client.post("/students", json={"name": 1, "age": True, "extra": 1})
+        assert paths(response) == ["courses", "grades", "matrix", "extra", "age", "name"]
+        assert response.get_json()["error"]["message"] == "Missing key: courses"
+        assert response.get_json()["error"]["errors"][4]["solution"] == "It should be int"
+
+    def test_max_errors(self, client):
+        response = client.post("/limited", json=dict(VALID, courses=[1, 2, 3, 4]))
+        assert paths(response) == ["courses[0]", "courses[1]"]
+
+    def test_invalid_max_errors(self):
+        with pytest.raises(ValueError, match="max_errors"):
+            validate_params({"age": int}, collect_errors=True, max_errors=0)
+
+    def test_body_errors(self, client):
+        response = client.post("/students", json=[1, 2])
+        error = response.get_json()["error"]
+        assert error["message"] == "JSON body must be a dict"
+        assert error["errors"] == [{"path": "", "message": "JSON body must be a dict", "solution": None}]
+
+    def test_without_error_handlers(self):
+        app = Flask(__name__)
+        FlaskUtils(app, register_error_handlers=False)
+
+        @app.post("/students")
+        @validate_params(SCHEMA, collect_errors=True)
+        def create_student():
+            return "OK", 200
+
+        response = app.test_client().post("/students", json=dict(VALID, age="20", courses=[1]))
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["error"] == "Wrong type for key age."
+        assert [error["path"] for error in data["errors"]] == ["age", "courses[0]"]
+
+    def test_default_mode_unchanged(self, client, flask_client):
+        @flask_client.post("/first")
+        @validate_params(SCHEMA)
+        def first():
+            return "OK", 200
+
+        error = client.post("/first", json=dict(VALID, courses=[1], age="x")).get_json()["error"]
+        assert error["message"] == "Wrong type for key age."
+        assert "errors" not in error
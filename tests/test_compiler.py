@@ -0,0 +1,277 @@
+import pickle
+import multiprocessing
+from enum import Enum
+from typing import Any
+from typing import Set
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Literal
+from typing import Optional
+from typing import FrozenSet
+
+import pytest
+
+from flask_utils import validate_params
+from flask_utils._compiler import _validators
+from flask_utils._compiler import _get_validator
+from flask_utils._compiler import _SchemaValidator
+from flask_utils._compiler import _canonical_schema
+from flask_utils.decorators import VALIDATE_PARAMS_MAX_DEPTH
+from flask_utils.decorators import _check_type
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Level(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+TYPE_HINTS = [
+    str,
+    int,
+    float,
+    bool,
+    list,
+    dict,
+    Any,
+    (int, float),
+    Optional[str],
+    Optional[bool],
+    Optional[int],
+    Union[int, str],
+    Union[int, bool],
+    Union[Any, str],
+    List[str],
+    List[int],
+    List[Optional[int]],
+    List[List[int]],
+    List[List[List[List[int]]]],
+    Dict[str, int],
+    Dict[str, List[bool]],
+    Dict[str, Any],
+    List[Dict[str, Union[int, str]]],
+    Optional[List[Dict[str, bool]]],
+    Literal["a", "b"],
+    Literal[1, True],
+    Optional[Literal["a"]],
+    List[Literal["a", "b"]],
+    Color,
+    Level,
+    Tuple,
+    Tuple[int, str],
+    Tuple[int, ...],
+    Optional[Tuple[int, int]],
+    Set[str],
+    FrozenSet[int],
+    Union[Tuple[int, int], str],
+]
+
+VALUES = [
+    None,
+    "",
+    "hello",
+    0,
+    42,
+    -1.5,
+    True,
+    False,
+    [],
+    {},
+    [1, 2],
+    [1, None],
+    ["a", "b"],
+    [True],
+    [[1], [2, 3]],
+    [[[["x"]]]],
+    {"a": 1},
+    {"a": True},
+    {"a": [True, False]},
+    {"a": ""},
+    {1: 1},
+    [{"a": 1, "b": "x"}],
+    [{"a": 1.5}],
+    "a",
+    "red",
+    1,
+    1.0,
+    2,
+    [1, "a"],
+    [1, 2, 3],
+    ["a", "a"],
+    [1, True],
+]
+
+
+class TestCompiledCheckers:
+    @pytest.mark.parametrize("allow_empty", [False, True])
+    @pytest.mark.parametrize("type_hint", TYPE_HINTS, ids=str)
+    def test_same_result_as_check_type(self, type_hint, allow_empty):
+        validator = _SchemaValidator({"key": type_hint}, allow_empty, VALIDATE_PARAMS_MAX_DEPTH)
+        check = validator.checkers["key"]
+        for value in VALUES:
+            assert check(value) == _check_type(value, type_hint, allow_empty), value
+
+    def test_messages_are_precomputed(self):
+        validator = _SchemaValidator({"name": str, "age": Optional[int]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.required_keys == ("name",)
+        assert validator.validate({"age": 1}) == ("Missing key: name", "Expected keys are: ['name', 'age']")
+        assert validator.validate({"name": "x", "other": 1}) == (
+            "Unexpected key: other.",
+            "Expected keys are: ['name', 'age']",
+        )
+        assert validator.validate({"name": 1}) == ("Wrong type for key name.", "It should be str")
+
+    def test_partial(self):
+        validator = _SchemaValidator({"name": str, "age": int}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.validate({"age": 1}, partial=True) is None
+        assert validator.validate({"age": None}, partial=True) == ("Wrong type for key age.", "It should be int")
+        assert validator.validate({"other": 1}, partial=True)[0] == "Unexpected key: other."
+
+    def test_pickle(self):
+        validator = _SchemaValidator({"names": List[str]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        copy = pickle.loads(pickle.dumps(validator))
+        assert copy.validate({"names": ["a"]}) is None
+        assert copy.validate({"names": [1]}) == ("Wrong type for key names.", "It should be List")
+
+    def test_members_keep_their_type(self):
+        validator = _SchemaValidator({"level": Literal[1, 2]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.validate({"level": 1}) is None
+        assert validator.validate({"level": True}) == ("Wrong type for key level.", "It should be one of [1, 2]")
+        assert validator.validate({"level": 1.0}) is not None
+        assert validator.validate({"level": [1]}) is not None
+
+    def test_enum_solution(self):
+        validator = _SchemaValidator({"color": Color}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.validate({"color": "red"}) is None
+        assert validator.validate({"color": "RED"}) == (
+            "Wrong type for key color.",
+            "It should be one of ['red', 'green']",
+        )
+
+    def test_collect_tuple_paths(self):
+        validator = _SchemaValidator({"point": Tuple[float, float], "tags": Set[str]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        errors = validator.collect({"point": [1.5, "x"], "tags": ["a", 2]})[2]
+        assert [error["path"] for error in errors] == ["point[1]", "tags[1]"]
+
+
+class TestAdaptiveOrder:
+    def test_failing_key_moves_first(self):
+        validator = _SchemaValidator(
+            {"name": str, "tags": List[str], "age": int}, False, VALIDATE_PARAMS_MAX_DEPTH, adaptive=True
+        )
+        validator.reorder_interval = 10
+        for _ in range(20):
+            assert validator.validate({"name": "x", "tags": ["a"], "age": "1"}) == (
+                "Wrong type for key age.",
+                "It should be int",
+            )
+        assert validator._order[0][0] == "age"
+
+    def test_cheapest_first_without_failures(self):
+        validator = _SchemaValidator(
+            {"grades": Dict[str, List[int]], "name": str}, False, VALIDATE_PARAMS_MAX_DEPTH, adaptive=True
+        )
+        assert [key for key, _ in validator._order] == ["name", "grades"]
+
+    def test_same_results_as_payload_order(self):
+        schema = {"name": str, "age": Optional[int], "tags": List[str]}
+        adaptive = _SchemaValidator(schema, False, VALIDATE_PARAMS_MAX_DEPTH, adaptive=True)
+        adaptive.reorder_interval = 2
+        ordered = _SchemaValidator(schema, False, VALIDATE_PARAMS_MAX_DEPTH)
+        bodies = [
+            {"name": "x", "tags": []},
+            {"name": 1, "tags": []},
+            {"name": "x", "age": "1", "tags": []},
+            {"name": "x", "age": None, "tags": [1]},
+            {"age": 1, "tags": []},
+        ]
+        for body in bodies * 3:
+            assert adaptive.validate(body) == ordered.validate(body)
+        assert adaptive.validate({"name": "x", "age": 1, "tags": []}, partial=True) is None
+
+    def test_small_partial_body_doesnt_scan_the_schema(self):
+        class CountingDict(dict):
+            lookups = 0
+
+            def get(self, *args):
+                CountingDict.lookups += 1
+                return super().get(*args)
+
+        schema = {f"field_{index}": int for index in range(200)}
+        validator = _SchemaValidator(schema, False, VALIDATE_PARAMS_MAX_DEPTH, adaptive=True)
+        validator.failures["field_150"] = 10
+        validator._reorder()
+
+        body = CountingDict(field_3="x", field_150="x")
+        assert validator.validate(body, partial=True) == ("Wrong type for key field_150.", "It should be int")
+        assert validator.validate(CountingDict(field_3=1), partial=True) is None
+        assert CountingDict.lookups == 0
+
+    def test_pickle_keeps_mode(self):
+        validator = _SchemaValidator({"name": str}, False, VALIDATE_PARAMS_MAX_DEPTH, adaptive=True)
+        assert pickle.loads(pickle.dumps(validator)).adaptive
+
+
+def _count_compiles_after_unpickling(data):
+    from flask_utils import _compiler
+
+    compiles = []
+    load_code = _compiler._load_code
+    _compiler._load_code = lambda source: compiles.append(source) or load_code(source)
+    for _ in range(2):
+        validator = pickle.loads(data)
+        assert validator.validate({"name": "x"}) is None
+        del validator
+    return len(compiles)
+
+
+class TestSharedValidators:
+    def test_identical_schemas_share_their_validator(self):
+        first = _get_validator({"page": int, "per_page": Optional[int]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        second = _get_validator({"page": int, "per_page": Optional[int]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert first is second
+
+    @pytest.mark.parametrize(
+        "other, options",
+        [
+            ({"per_page": Optional[int], "page": int}, (False,)),
+            ({"page": int, "per_page": Optional[int]}, (True,)),
+            ({"page": int, "per_page": Optional[int]}, (False, True)),
+            ({"page": int, "per_page": Optional[int]}, (False, False, "ignore")),
+            ({"page": float, "per_page": Optional[int]}, (False,)),
+        ],
+    )
+    def test_different_schemas(self, other, options):
+        first = _get_validator({"page": int, "per_page": Optional[int]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        allow_empty, *rest = options
+        assert _get_validator(other, allow_empty, VALIDATE_PARAMS_MAX_DEPTH, *rest) is not first
+
+    def test_key_types_are_kept(self):
+        first = _get_validator({1: int}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        second = _get_validator({True: int}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert first is not second
+        assert second.validate({"other": 1})[0] == "Missing key: True"
+
+    def test_unpickled_validators_are_kept_alive(self):
+        data = pickle.dumps(_get_validator({"name": str}, False, VALIDATE_PARAMS_MAX_DEPTH))
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            assert pool.apply(_count_compiles_after_unpickling, (data,)) == 1
+
+    def test_unhashable_schema(self):
+        assert _canonical_schema({"key": [int]}, False, VALIDATE_PARAMS_MAX_DEPTH, False, "reject") is None
+
+    def test_routes_share_their_validator(self):
+        decorators = [validate_params({"page": int, "per_page": Optional[int]}) for _ in range(3)]
+        validators = [
+            validator
+            for key, validator in _validators.items()
+            if key[0] == ((str, "page", int), (str, "per_page", Optional[int])) and not key[1]
+        ]
+        assert len(decorators) == 3
+        assert len(validators) == 1
@@ -0,0 +1,126 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from flask import Flask
+from flask import Response
+
+from flask_utils import FlaskUtils
+from flask_utils import BadRequestError
+
+BIG_PAYLOAD = {"items": [{"id": i, "name": "item"} for i in range(200)]}
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    FlaskUtils(app, compress_responses=True)
+
+    @app.get("/big")
+    def big():
+        return BIG_PAYLOAD
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/error")
+    def error():
+        raise BadRequestError("Bad request")
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x00" * 2000, mimetype="image/png")
+
+    @app.get("/stream")
+    def stream():
+        def generate():
+            for i in range(100):
+                yield f"line {i}\n"
+
+        return Response(generate(), mimetype="text/plain")
+
+    @app.get("/etag")
+    def etag():
+        response = Response(json.dumps(BIG_PAYLOAD), mimetype="application/json")
+        response.set_etag("abc")
+        return response
+
+    return app
+
+
+@pytest.fixture
+def client(app):
+    with app.test_client() as client:
+        yield client
+
+
+class TestCompression:
+    def test_gzip(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert int(response.headers["Content-Length"]) == len(response.data)
+        assert json.loads(gzip.decompress(response.data)) == BIG_PAYLOAD
+
+    def test_deflate(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "deflate"})
+        assert response.headers["Content-Encoding"] == "deflate"
+        assert json.loads(zlib.decompress(response.data)) == BIG_PAYLOAD
+
+    def test_preferred_encoding(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+        assert response.headers["Content-Encoding"] == "deflate"
+
+    def test_no_accept_encoding(self, client):
+        response = client.get("/big", headers={"Accept-Encoding": "br"})
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json() == BIG_PAYLOAD
+
+    def test_small_response(self, client):
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    def test_error_response(self, client):
+        response = client.get("/error", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 400
+        assert "Content-Encoding" not in response.headers
+
+    def test_mimetype_not_allowed(self, client):
+        response = client.get("/image", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert "Vary" not in response.headers
+
+    def test_stream(self, client):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        expected = "".join(f"line {i}\n" for i in range(100)).encode()
+        assert gzip.decompress(response.data) == expected
+
+    def test_stream_disabled(self, app, client):
+        app.config["FLASK_UTILS_COMPRESS_STREAMS"] = False
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    def test_min_size_config(self, app, client):
+        app.config["FLASK_UTILS_COMPRESS_MIN_SIZE"] = 1
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+
+    def test_strong_etag_becomes_weak(self, client):
+        response = client.get("/etag", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["ETag"] == 'W/"abc"'
+
+    def test_disabled_by_default(self):
+        app = Flask(__name__)
+        FlaskUtils(app)
+
+        @app.get("/big")
+        def big():
+            return BIG_PAYLOAD
+
+        response = app.test_client().get("/big", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert "FLASK_UTILS_COMPRESS_MIN_SIZE" not in app.config
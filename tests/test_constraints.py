@@ -0,0 +1,96 @@
+import re
+import sys
+import pickle
+from typing import List
+from typing import Optional
+
+import pytest
+
+from flask_utils import Range
+from flask_utils import Pattern
+from flask_utils import MaxLength
+from flask_utils import MinLength
+from flask_utils import validate_params
+from flask_utils._compiler import _SchemaValidator
+from flask_utils.decorators import VALIDATE_PARAMS_MAX_DEPTH
+from flask_utils.decorators import _check_type
+
+if sys.version_info < (3, 9):
+    pytest.skip("typing.Annotated requires Python 3.9", allow_module_level=True)
+
+from typing import Annotated  # noqa: E402
+
+USERNAME = Annotated[str, MinLength(3), MaxLength(8), Pattern(r"[a-z0-9_]+")]
+AGE = Annotated[int, Range(min=13, max=130)]
+
+
+@pytest.fixture(autouse=True)
+def setup_routes(flask_client):
+    @flask_client.post("/users")
+    @validate_params(
+        {
+            "username": USERNAME,
+            "age": AGE,
+            "tags": Annotated[List[Annotated[str, MinLength(1)]], MaxLength(3)],
+            "bio": Optional[Annotated[str, MaxLength(10)]],
+        }
+    )
+    def create_user():
+        return "OK", 200
+
+
+class TestConstraints:
+    def test_valid(self, client):
+        response = client.post("/users", json={"username": "jules_1", "age": 20, "tags": ["a"], "bio": None})
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize(
+        "body, key",
+        [
+            ({"username": "ju", "age": 20, "tags": []}, "username"),
+            ({"username": "julesjules", "age": 20, "tags": []}, "username"),
+            ({"username": "Jules", "age": 20, "tags": []}, "username"),
+            ({"username": "jules", "age": 12, "tags": []}, "age"),
+            ({"username": "jules", "age": 131, "tags": []}, "age"),
+            ({"username": "jules", "age": "20", "tags": []}, "age"),
+            ({"username": "jules", "age": 20, "tags": ["a", "b", "c", "d"]}, "tags"),
+            ({"username": "jules", "age": 20, "tags": [""]}, "tags"),
+            ({"username": "jules", "age": 20, "tags": [], "bio": "a" * 11}, "bio"),
+        ],
+    )
+    def test_invalid(self, client, body, key):
+        response = client.post("/users", json=body)
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == f"Wrong type for key {key}."
+
+    def test_solution_describes_constraints(self, client):
+        response = client.post("/users", json={"username": "jules", "age": 200, "tags": []})
+        assert response.get_json()["error"]["solution"] == "It should be int (between 13 and 130)"
+
+    def test_pattern_is_compiled_once(self):
+        pattern = Pattern(r"[a-z]+", re.IGNORECASE)
+        assert isinstance(pattern.regex, re.Pattern)
+        assert pattern("ABC")
+        assert not pattern("ab1")
+
+    def test_constraints_skip_other_types(self):
+        assert MinLength(3)(5)
+        assert Range(min=0)("text")
+
+    def test_optional_annotated(self):
+        validator = _SchemaValidator({"bio": Annotated[Optional[str], MinLength(2)]}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.required_keys == ()
+        assert validator.validate({"bio": None}) is None
+        assert validator.validate({"bio": "a"}) is not None
+
+    @pytest.mark.parametrize("value", ["ab", "abc", "ABC", "abcdefghi", 3, None, True, ["abc"]])
+    @pytest.mark.parametrize("type_hint", [USERNAME, AGE, Annotated[float, Range(max=1.5)], Optional[USERNAME]])
+    def test_same_result_as_check_type(self, type_hint, value):
+        validator = _SchemaValidator({"key": type_hint}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.checkers["key"](value) == _check_type(value, type_hint)
+
+    def test_pickle(self):
+        validator = _SchemaValidator({"username": USERNAME}, False, VALIDATE_PARAMS_MAX_DEPTH)
+        copy = pickle.loads(pickle.dumps(validator))
+        assert copy.validate({"username": "jules"}) is None
+        assert copy.validate({"username": "Jules"}) is not None
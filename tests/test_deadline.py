@@ -0,0 +1,154 @@
+import time
+
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import CircuitBreaker
+from flask_utils import ServiceUnavailableError
+from flask_utils import deadline
+from flask_utils import check_deadline
+from flask_utils import remaining_time
+from flask_utils import validate_params
+from flask_utils import deadline_exceeded
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def deadline_app(clock):
+    app = Flask(__name__)
+    app.testing = True
+    FlaskUtils(app, propagate_deadlines=True)
+
+    @app.route("/remaining")
+    def remaining():
+        clock[0] += 0.1
+        return {"remaining": remaining_time()}
+
+    @app.route("/short")
+    @deadline(0.5)
+    def short():
+        return {"remaining": remaining_time()}
+
+    @app.route("/slow")
+    def slow():
+        clock[0] += 1
+        check_deadline()
+        return {"done": True}
+
+    return app
+
+
+class TestDeadline:
+    def test_no_deadline(self, deadline_app):
+        response = deadline_app.test_client().get("/remaining")
+        assert response.json == {"remaining": None}
+
+    def test_header(self, deadline_app):
+        response = deadline_app.test_client().get("/remaining", headers={"X-Request-Timeout": "2000"})
+        assert response.json["remaining"] == pytest.approx(1.9)
+
+    def test_invalid_header_is_ignored(self, deadline_app):
+        response = deadline_app.test_client().get("/remaining", headers={"X-Request-Timeout": "soon"})
+        assert response.json == {"remaining": None}
+
+    @pytest.mark.parametrize("header", ["nan", "inf", "-inf"])
+    def test_non_finite_header_is_ignored(self, deadline_app, header):
+        deadline_app.config["FLASK_UTILS_DEFAULT_DEADLINE"] = 3
+        response = deadline_app.test_client().get("/remaining", headers={"X-Request-Timeout": header})
+        assert response.json["remaining"] == pytest.approx(2.9)
+
+    def test_default_deadline(self, deadline_app):
+        deadline_app.config["FLASK_UTILS_DEFAULT_DEADLINE"] = 3
+        response = deadline_app.test_client().get("/remaining")
+        assert response.json["remaining"] == pytest.approx(2.9)
+
+    def test_route_budget_keeps_the_earliest_deadline(self, deadline_app):
+        client = deadline_app.test_client()
+        assert client.get("/short").json["remaining"] == pytest.approx(0.5)
+        assert client.get("/short", headers={"X-Request-Timeout": "200"}).json["remaining"] == pytest.approx(0.2)
+        assert client.get("/short", headers={"X-Request-Timeout": "5000"}).json["remaining"] == pytest.approx(0.5)
+
+    def test_check_deadline(self, deadline_app):
+        client = deadline_app.test_client()
+        assert client.get("/slow").status_code == 200
+
+        response = client.get("/slow", headers={"X-Request-Timeout": "500"})
+        assert response.status_code == 503
+        assert response.json["error"]["message"] == "The request deadline has been exceeded."
+
+    def test_outside_request(self):
+        assert remaining_time() is None
+        assert not deadline_exceeded()
+        check_deadline()
+
+
+class TestValidateParamsDeadline:
+    def test_skips_validation(self, deadline_app, clock):
+        @deadline_app.before_request
+        def queued():
+            clock[0] += 1
+
+        @deadline_app.route("/validated", methods=["POST"])
+        @validate_params({"name": str})
+        def validated():
+            return {"ok": True}
+
+        client = deadline_app.test_client()
+        assert client.post("/validated", json={"name": "John"}).status_code == 200
+
+        response = client.post("/validated", json={"name": 1}, headers={"X-Request-Timeout": "500"})
+        assert response.status_code == 503
+        assert response.json["error"]["name"] == "Service Unavailable"
+
+    def test_without_error_handlers(self, clock):
+        app = Flask(__name__)
+        FlaskUtils(app, register_error_handlers=False, propagate_deadlines=True)
+
+        @app.route("/validated", methods=["POST"])
+        @validate_params({"name": str})
+        def validated():
+            return {"ok": True}
+
+        @app.before_request
+        def queued():
+            clock[0] += 1
+
+        response = app.test_client().post("/validated", json={"name": "John"}, headers={"X-Request-Timeout": "500"})
+        assert response.status_code == 503
+        assert response.json == {"error": "The request deadline has been exceeded."}
+
+
+class TestCircuitBreakerDeadline:
+    def test_call_not_made(self, deadline_app, clock):
+        breaker = CircuitBreaker("billing", failure_threshold=1)
+        calls = []
+
+        @deadline_app.route("/billing")
+        def billing():
+            clock[0] += 1
+            with breaker:
+                calls.append(remaining_time())
+            return {"ok": True}
+
+        client = deadline_app.test_client()
+        assert client.get("/billing", headers={"X-Request-Timeout": "500"}).status_code == 503
+        assert calls == []
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        assert client.get("/billing", headers={"X-Request-Timeout": "1500"}).status_code == 200
+        assert calls == [pytest.approx(0.5)]
+
+    def test_raises_service_unavailable(self, deadline_app, clock):
+        breaker = CircuitBreaker("billing")
+        with deadline_app.test_request_context(headers={"X-Request-Timeout": "100"}):
+            deadline_app.preprocess_request()
+            clock[0] += 1
+            with pytest.raises(ServiceUnavailableError):
+                breaker.before_call()
@@ -0,0 +1,106 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from flask import Flask
+from flask import request
+
+from flask_utils import FlaskUtils
+from flask_utils import validate_params
+
+PAYLOAD = {"name": "John", "hobbies": ["reading", "coding"]}
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    FlaskUtils(app, decompress_requests=True)
+
+    @app.post("/validated")
+    @validate_params({"name": str, "hobbies": list})
+    def validated():
+        return request.get_json()
+
+    @app.post("/raw")
+    def raw():
+        return {"size": len(request.get_data()), "encoding": request.headers.get("Content-Encoding")}
+
+    return app
+
+
+@pytest.fixture
+def client(app):
+    with app.test_client() as client:
+        yield client
+
+
+def post(client, url, body, encoding):
+    return client.post(url, data=body, headers={"Content-Type": "application/json", "Content-Encoding": encoding})
+
+
+class TestDecompression:
+    def test_gzip(self, client):
+        response = post(client, "/validated", gzip.compress(json.dumps(PAYLOAD).encode()), "gzip")
+        assert response.status_code == 200
+        assert response.get_json() == PAYLOAD
+
+    def test_deflate(self, client):
+        response = post(client, "/validated", zlib.compress(json.dumps(PAYLOAD).encode()), "deflate")
+        assert response.status_code == 200
+        assert response.get_json() == PAYLOAD
+
+    def test_content_encoding_is_removed(self, client):
+        response = post(client, "/raw", gzip.compress(b"x" * 1000), "gzip")
+        assert response.get_json() == {"size": 1000, "encoding": None}
+
+    def test_uncompressed(self, client):
+        response = client.post("/validated", json=PAYLOAD)
+        assert response.status_code == 200
+
+    def test_validation_still_applies(self, client):
+        response = post(client, "/validated", gzip.compress(json.dumps({"name": 42}).encode()), "gzip")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Missing key: hobbies"
+
+    def test_unsupported_encoding(self, client):
+        response = post(client, "/raw", b"data", "br")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Unsupported Content-Encoding: br."
+
+    def test_invalid_body(self, client):
+        response = post(client, "/raw", b"not gzip", "gzip")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "The compressed body is invalid."
+
+    def test_truncated_body(self, client):
+        response = post(client, "/raw", gzip.compress(b"x" * 1000)[:-10], "gzip")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "The compressed body is truncated."
+
+    def test_max_size(self, app, client):
+        app.config["FLASK_UTILS_DECOMPRESS_MAX_SIZE"] = 1000
+        response = post(client, "/raw", gzip.compress(b"x" * 1001), "gzip")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "The decompressed body is bigger than 1000 bytes."
+
+        response = post(client, "/raw", gzip.compress(b"x" * 1000), "gzip")
+        assert response.status_code == 200
+
+    def test_bomb_is_rejected_by_ratio(self, client):
+        bomb = gzip.compress(b"\x00" * (5 * 1024 * 1024))
+        response = post(client, "/raw", bomb, "gzip")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "The compression ratio of the body is higher than 100."
+
+    def test_disabled_by_default(self):
+        app = Flask(__name__)
+        FlaskUtils(app)
+
+        @app.post("/raw")
+        def raw():
+            return {"size": len(request.get_data())}
+
+        body = gzip.compress(b"x" * 1000)
+        response = post(app.test_client(), "/raw", body, "gzip")
+        assert response.get_json() == {"size": len(body)}
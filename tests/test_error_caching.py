@@ -0,0 +1,78 @@
+import pytest
+
+from flask_utils import GoneError
+from flask_utils import NotFoundError
+from flask_utils import ServiceUnavailableError
+
+
+class ArticleGoneError(GoneError):
+    cache_max_age = 86400
+    vary = ("Accept-Language",)
+
+
+class MaintenanceError(ServiceUnavailableError):
+    retry_after = 120
+    cache_max_age = 0
+
+
+@pytest.fixture(autouse=True)
+def setup_routes(flask_client):
+    @flask_client.route("/no_policy")
+    def no_policy():
+        raise GoneError("Gone")
+
+    @flask_client.route("/class_policy")
+    def class_policy():
+        raise ArticleGoneError("This article was deleted.")
+
+    @flask_client.route("/instance_policy")
+    def instance_policy():
+        raise NotFoundError("This article does not exist.").cache(300, vary=["Accept-Language", "Accept"])
+
+    @flask_client.route("/private")
+    def private():
+        raise NotFoundError("This draft does not exist.").cache(60, private=True)
+
+    @flask_client.route("/maintenance")
+    def maintenance():
+        raise MaintenanceError("Down for maintenance.")
+
+
+class TestErrorCaching:
+    def test_no_policy(self, client):
+        response = client.get("/no_policy")
+        assert "Cache-Control" not in response.headers
+        assert "Vary" not in response.headers
+
+    def test_class_policy(self, client):
+        response = client.get("/class_policy")
+        assert response.status_code == 410
+        assert response.cache_control.max_age == 86400
+        assert response.cache_control.public
+        assert response.headers["Vary"] == "Accept-Language"
+
+    def test_instance_policy(self, client):
+        response = client.get("/instance_policy")
+        assert response.status_code == 404
+        assert response.cache_control.max_age == 300
+        assert set(response.vary) == {"Accept-Language", "Accept"}
+
+    def test_instance_policy_does_not_leak_to_class(self, client):
+        client.get("/instance_policy")
+        assert NotFoundError.cache_max_age is None
+        assert NotFoundError.vary == ()
+
+    def test_private(self, client):
+        response = client.get("/private")
+        assert response.cache_control.private
+        assert not response.cache_control.public
+        assert response.cache_control.max_age == 60
+
+    def test_no_store_and_retry_after_default(self, client):
+        response = client.get("/maintenance")
+        assert response.status_code == 503
+        assert response.cache_control.no_store
+        assert response.headers["Retry-After"] == "120"
+
+    def test_retry_after_argument_overrides_class(self):
+        assert MaintenanceError("Down", retry_after=5).retry_after == 5
@@ -0,0 +1,117 @@
+import logging
+import threading
+
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import NotFoundError
+from flask_utils import BackgroundErrorLogger
+from flask_utils import ServiceUnavailableError
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def handler():
+    handler = ListHandler()
+    logger = logging.getLogger("tests.error_logging")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield handler
+    logger.removeHandler(handler)
+
+
+@pytest.fixture
+def error_logger():
+    error_logger = BackgroundErrorLogger(logger=logging.getLogger("tests.error_logging"), window=3600)
+    yield error_logger
+    error_logger.close()
+
+
+@pytest.fixture
+def logged_app(error_logger):
+    app = Flask(__name__)
+    FlaskUtils(app, error_logger=error_logger)
+
+    @app.get("/users/<int:user_id>")
+    def get_user(user_id):
+        raise NotFoundError("User not found")
+
+    @app.get("/down")
+    def down():
+        raise ServiceUnavailableError("Down")
+
+    return app
+
+
+def messages(handler):
+    return [record.getMessage() for record in handler.records]
+
+
+class TestBackgroundErrorLogger:
+    def test_logs_from_background_thread(self, logged_app, error_logger, handler):
+        response = logged_app.test_client().get("/users/1")
+        assert response.status_code == 404
+        error_logger.flush()
+        assert messages(handler) == ["NotFoundError (404) on GET get_user: User not found"]
+        assert handler.records[0].levelno == logging.WARNING
+        assert handler.records[0].thread != threading.get_ident()
+
+    def test_repeated_errors_are_summarized(self, logged_app, error_logger, handler):
+        client = logged_app.test_client()
+        for user_id in range(5):
+            client.get(f"/users/{user_id}")
+        client.get("/down")
+        error_logger.close()
+        assert messages(handler) == [
+            "NotFoundError (404) on GET get_user: User not found",
+            "ServiceUnavailableError (503) on GET down: Down",
+            "NotFoundError (404) on GET get_user: User not found (repeated 4 times in 3600s)",
+        ]
+        assert handler.records[1].levelno == logging.ERROR
+
+    def test_window_resets_counts(self, handler):
+        error_logger = BackgroundErrorLogger(logger=logging.getLogger("tests.error_logging"), window=0)
+        for _ in range(3):
+            error_logger.log(NotFoundError("Gone"))
+            error_logger.flush()
+        error_logger.close()
+        assert messages(handler).count("NotFoundError (404): Gone") == 3
+
+    def test_max_keys(self, handler):
+        error_logger = BackgroundErrorLogger(logger=logging.getLogger("tests.error_logging"), window=3600, max_keys=1)
+        for message in ["a", "b", "b"]:
+            error_logger.log(NotFoundError(message))
+        error_logger.close()
+        assert messages(handler) == ["NotFoundError (404): a", "NotFoundError (404): b", "NotFoundError (404): b"]
+
+    @pytest.mark.parametrize("drop_policy, kept", [("newest", "0"), ("oldest", "9")])
+    def test_drop_policy(self, handler, drop_policy, kept):
+        error_logger = BackgroundErrorLogger(
+            logger=logging.getLogger("tests.error_logging"), window=3600, max_queue_size=1, drop_policy=drop_policy
+        )
+        error_logger._thread = threading.current_thread()  # Keep the records in the queue
+        for index in range(10):
+            error_logger.log(NotFoundError(str(index)))
+        assert error_logger.dropped == 9
+        error_logger._thread = None
+        error_logger.log(NotFoundError("last"))
+        error_logger.close()
+        assert messages(handler)[0] == f"NotFoundError (404): {kept}"
+        assert "Dropped 9 error log records: the queue was full" in messages(handler)
+
+    def test_invalid_drop_policy(self):
+        with pytest.raises(ValueError):
+            BackgroundErrorLogger(drop_policy="random")
+
+    def test_disabled_by_default(self, flask_client):
+        assert flask_client.extensions["flask_utils"].error_logger is None
@@ -8,6 +8,7 @@ from flask_utils.errors.forbidden import ForbiddenError
 from flask_utils.errors.badrequest import BadRequestError
 from flask_utils.errors.unauthorized import UnauthorizedError
 from flask_utils.errors.failed_dependency import FailedDependencyError
+from flask_utils.errors.too_many_requests import TooManyRequestsError
 from flask_utils.errors.web_server_is_down import WebServerIsDownError
 from flask_utils.errors.service_unavailable import ServiceUnavailableError
 from flask_utils.errors.unprocessableentity import UnprocessableEntityError
@@ -64,6 +65,10 @@ def setup_routes(flask_client):
     def method_not_allowed():
         raise MethodNotAllowedError("Method not allowed error")
 
+    @flask_client.route("/too_many_requests")
+    def too_many_requests():
+        raise TooManyRequestsError("Too many requests error", retry_after=30)
+
 
 def test_bad_request_error_handler(client):
     response = client.get("/bad_request")
@@ -197,6 +202,18 @@ def test_method_not_allowed_error_handler(client):
     assert response_json["error"]["type"] == "MethodNotAllowedError"
 
 
+def test_too_many_requests_error_handler(client):
+    response = client.get("/too_many_requests")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "30"
+
+    response_json = response.get_json()
+    assert response_json["error"]["message"] == "Too many requests error"
+    assert response_json["error"]["solution"] == "Try again later."
+    assert response_json["error"]["name"] == "Too Many Requests"
+    assert response_json["error"]["type"] == "TooManyRequestsError"
+
+
 def test_method_not_allowed_with_post_method(client):
     response = client.post("/method_not_allowed")
     assert response.status_code == 405
@@ -0,0 +1,118 @@
+import pytest
+
+from flask_utils import etag
+
+
+class TestEtagWithoutVersion:
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client, calls):
+        @flask_client.route("/countries", methods=["GET", "POST"])
+        @etag()
+        def countries():
+            calls.append(1)
+            return {"countries": ["France", "Spain"]}
+
+        @flask_client.get("/weak")
+        @etag(weak=True)
+        def weak():
+            return {"countries": ["France", "Spain"]}
+
+        @flask_client.get("/not-found")
+        @etag()
+        def not_found():
+            return {"error": "not found"}, 404
+
+    def test_etag_is_set(self, client):
+        response = client.get("/countries")
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+
+    def test_not_modified(self, client, calls):
+        tag = client.get("/countries").headers["ETag"]
+        response = client.get("/countries", headers={"If-None-Match": tag})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == tag
+
+    def test_other_etag(self, client):
+        response = client.get("/countries", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+
+    def test_weak(self, client):
+        tag = client.get("/weak").headers["ETag"]
+        assert tag.startswith('W/"')
+        assert client.get("/weak", headers={"If-None-Match": tag}).status_code == 304
+
+    def test_post_is_passed_through(self, client):
+        response = client.post("/countries")
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+    def test_errors_have_no_etag(self, client):
+        response = client.get("/not-found")
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+
+class TestEtagWithVersion:
+    @pytest.fixture
+    def state(self):
+        return {"version": 1, "calls": 0}
+
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client, state):
+        @flask_client.get("/articles/<int:article_id>")
+        @etag(version=lambda article_id: (article_id, state["version"]))
+        def article(article_id):
+            state["calls"] += 1
+            return {"id": article_id}
+
+        @flask_client.get("/async/<int:article_id>")
+        @etag(version=lambda article_id: (article_id, state["version"]))
+        async def async_article(article_id):
+            state["calls"] += 1
+            return {"id": article_id}
+
+        @flask_client.get("/unknown-version")
+        @etag(version=lambda: None)
+        def unknown_version():
+            state["calls"] += 1
+            return {"id": 1}
+
+    def test_view_is_not_called_when_not_modified(self, client, state):
+        tag = client.get("/articles/1").headers["ETag"]
+        assert state["calls"] == 1
+
+        response = client.get("/articles/1", headers={"If-None-Match": tag})
+        assert response.status_code == 304
+        assert state["calls"] == 1
+
+    def test_new_version(self, client, state):
+        tag = client.get("/articles/1").headers["ETag"]
+        state["version"] = 2
+
+        response = client.get("/articles/1", headers={"If-None-Match": tag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != tag
+
+    def test_version_depends_on_arguments(self, client):
+        assert client.get("/articles/1").headers["ETag"] != client.get("/articles/2").headers["ETag"]
+
+    def test_none_version_falls_back_to_body_hash(self, client, state):
+        tag = client.get("/unknown-version").headers["ETag"]
+        response = client.get("/unknown-version", headers={"If-None-Match": tag})
+        assert response.status_code == 304
+        assert state["calls"] == 2
+
+    def test_async_view(self, client, state):
+        response = client.get("/async/1")
+        assert response.status_code == 200
+        assert response.get_json() == {"id": 1}
+
+        response = client.get("/async/1", headers={"If-None-Match": response.headers["ETag"]})
+        assert response.status_code == 304
+        assert state["calls"] == 1
@@ -7,6 +7,7 @@ from flask_utils.errors import NotFoundError
 from flask_utils.errors import ForbiddenError
 from flask_utils.errors import BadRequestError
 from flask_utils.errors import UnauthorizedError
+from flask_utils.errors import TooManyRequestsError
 from flask_utils.errors import WebServerIsDownError
 from flask_utils.errors import FailedDependencyError
 from flask_utils.errors import ServiceUnavailableError
@@ -30,6 +31,7 @@ class TestGenerateErrorDict:
             OriginIsUnreachableError("This is the message", "This is the solution"),
             WebServerIsDownError("This is the message", "This is the solution"),
             MethodNotAllowedError("This is the message", "This is the solution"),
+            TooManyRequestsError("This is the message", "This is the solution"),
         ],
     )
     def test_generate_error_dict(self, error):
@@ -0,0 +1,93 @@
+import pytest
+from flask import Flask
+from flask import abort
+from werkzeug.exceptions import NotFound
+
+from flask_utils import FlaskUtils
+from flask_utils import NotFoundError
+from flask_utils.errors._error_template import _generate_http_exception_response
+
+
+@pytest.fixture
+def http_app():
+    app = Flask(__name__)
+    FlaskUtils(app, handle_http_exceptions=True)
+
+    @app.route("/items", methods=["GET", "POST"])
+    def items():
+        return {"items": []}
+
+    @app.route("/items/<int:item_id>")
+    def item(item_id):
+        abort(404, description=f"Item {item_id} does not exist.")
+
+    @app.route("/teapot")
+    def teapot():
+        abort(418)
+
+    return app
+
+
+class TestHttpExceptions:
+    def test_routing_not_found(self, http_app):
+        response = http_app.test_client().get("/nope")
+        assert response.status_code == 404
+        assert response.content_type == "application/json"
+        assert response.json == {
+            "success": False,
+            "error": {
+                "type": "NotFound",
+                "name": "Not Found",
+                "message": NotFound.description,
+                "solution": None,
+            },
+            "code": 404,
+        }
+
+    def test_method_not_allowed_keeps_allow_header(self, http_app):
+        response = http_app.test_client().delete("/items")
+        assert response.status_code == 405
+        assert response.json["error"]["type"] == "MethodNotAllowed"
+        assert set(response.headers["Allow"].split(", ")) == {"GET", "HEAD", "POST", "OPTIONS"}
+        assert response.content_type == "application/json"
+
+    def test_custom_description(self, http_app):
+        response = http_app.test_client().get("/items/3")
+        assert response.status_code == 404
+        assert response.json["error"]["message"] == "Item 3 does not exist."
+
+    def test_abort(self, http_app):
+        response = http_app.test_client().get("/teapot")
+        assert response.status_code == 418
+        assert response.json["error"]["name"] == "I'm a teapot"
+
+    def test_library_errors_unchanged(self, http_app):
+        @http_app.route("/missing")
+        def missing():
+            raise NotFoundError("Missing", "Look elsewhere.")
+
+        response = http_app.test_client().get("/missing")
+        assert response.json["error"]["type"] == "NotFoundError"
+        assert response.json["error"]["solution"] == "Look elsewhere."
+
+    def test_disabled_by_default(self, client):
+        response = client.get("/nope")
+        assert response.status_code == 404
+        assert response.content_type.startswith("text/html")
+
+
+class TestHttpExceptionCache:
+    def test_default_description_is_cached(self, flask_client):
+        cache = {}
+        with flask_client.app_context():
+            first = _generate_http_exception_response(NotFound(), cache)
+            assert list(cache) == [(NotFound, 404)]
+            second = _generate_http_exception_response(NotFound(), cache)
+        assert first.get_data() == second.get_data() == cache[(NotFound, 404)]
+
+    def test_custom_description_is_not_cached(self, flask_client):
+        cache = {}
+        with flask_client.app_context():
+            response = _generate_http_exception_response(NotFound("Item 3 does not exist."), cache)
+        assert cache == {}
+        assert response.json["error"]["message"] == "Item 3 does not exist."
@@ -0,0 +1,266 @@
+import os
+import time
+import hashlib
+from contextlib import contextmanager
+
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import FileIdempotencyStore
+from flask_utils import MemoryIdempotencyStore
+from flask_utils import idempotent
+
+
+class TestMemoryIdempotencyStore:
+    def test_reserve_save_get(self):
+        store = MemoryIdempotencyStore()
+        assert store.get("key") is None
+        assert store.reserve("key") is True
+        assert store.reserve("key") is False
+        assert store.get("key") is None
+
+        store.save("key", {"status": 200})
+        assert store.get("key") == {"status": 200}
+        assert store.reserve("key") is False
+
+    def test_release(self):
+        store = MemoryIdempotencyStore()
+        store.reserve("key")
+        store.release("key")
+        assert store.reserve("key") is True
+
+    def test_ttl(self):
+        store = MemoryIdempotencyStore(ttl=0.01)
+        store.reserve("key")
+        store.save("key", {"status": 200})
+        time.sleep(0.02)
+        assert store.get("key") is None
+
+    def test_lock_timeout(self):
+        store = MemoryIdempotencyStore(lock_timeout=0.01)
+        store.reserve("key")
+        time.sleep(0.02)
+        assert store.reserve("key") is True
+
+    def test_lru_eviction(self):
+        store = MemoryIdempotencyStore(maxsize=2)
+        for key in ("a", "b"):
+            store.reserve(key)
+            store.save(key, {"key": key})
+        store.get("a")
+        store.reserve("c")
+        store.save("c", {"key": "c"})
+
+        assert store.get("a") == {"key": "a"}
+        assert store.get("b") is None
+        assert store.get("c") == {"key": "c"}
+
+
+class TestFileIdempotencyStore:
+    def test_reserve_save_get(self, tmp_path):
+        store = FileIdempotencyStore(str(tmp_path))
+        assert store.get("key") is None
+        assert store.reserve("key") is True
+        assert store.reserve("key") is False
+
+        store.save("key", {"status": 200})
+        assert store.get("key") == {"status": 200}
+        assert store.reserve("key") is False
+        assert [name for name in os.listdir(tmp_path) if not name.endswith(".json")] == []
+
+    def test_shared_between_instances(self, tmp_path):
+        first = FileIdempotencyStore(str(tmp_path))
+        second = FileIdempotencyStore(str(tmp_path))
+        assert first.reserve("key") is True
+        assert second.reserve("key") is False
+        first.save("key", {"status": 201})
+        assert second.get("key") == {"status": 201}
+
+    def test_release(self, tmp_path):
+        store = FileIdempotencyStore(str(tmp_path))
+        store.reserve("key")
+        store.release("key")
+        assert store.reserve("key") is True
+
+    def test_expired_entries(self, tmp_path):
+        store = FileIdempotencyStore(str(tmp_path), ttl=10, lock_timeout=10)
+        store.reserve("key")
+        store.save("key", {"status": 200})
+        old = time.time() - 20
+        os.utime(store._path("key", ".json"), (old, old))
+        assert store.get("key") is None
+
+        store.reserve("other")
+        os.utime(store._path("other", ".lock"), (old, old))
+        assert store.reserve("other") is True
+
+    def test_stale_lock_taken_over_once(self, tmp_path):
+        first = FileIdempotencyStore(str(tmp_path), lock_timeout=10)
+        second = FileIdempotencyStore(str(tmp_path), lock_timeout=10)
+        first.reserve("key")
+        old = time.time() - 20
+        os.utime(first._path("key", ".lock"), (old, old))
+
+        guard = first._guard
+
+        @contextmanager
+        def racing_guard():
+            # The second worker takes the stale lock over while the first one waits for the guard.
+            assert second.reserve("key") is True
+            with guard():
+                yield
+
+        first._guard = racing_guard
+        assert first.reserve("key") is False
+        assert os.path.exists(first._path("key", ".lock"))
+
+
+class TestIdempotentDecorator:
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def in_flight_store(self):
+        return MemoryIdempotencyStore()
+
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client, calls, tmp_path, in_flight_store):
+        @flask_client.post("/payments")
+        @idempotent()
+        def payments():
+            calls.append(1)
+            return {"id": len(calls)}, 201, {"X-Custom": "value", "Set-Cookie": "session=secret"}
+
+        @flask_client.post("/required")
+        @idempotent(required=True)
+        def required():
+            return "OK", 200
+
+        @flask_client.post("/fails")
+        @idempotent()
+        def fails():
+            calls.append(1)
+            return "Error", 500
+
+        @flask_client.post("/file")
+        @idempotent(store=FileIdempotencyStore(str(tmp_path)))
+        def file():
+            calls.append(1)
+            return {"id": len(calls)}, 201
+
+        @flask_client.post("/async")
+        @idempotent()
+        async def async_payments():
+            calls.append(1)
+            return {"id": len(calls)}, 201
+
+        @flask_client.post("/in-flight")
+        @idempotent(store=in_flight_store)
+        def in_flight():
+            return "OK", 200
+
+    def test_replay(self, client, calls):
+        first = client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        second = client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+
+        assert len(calls) == 1
+        assert first.status_code == second.status_code == 201
+        assert first.get_json() == second.get_json() == {"id": 1}
+        assert second.headers["X-Custom"] == "value"
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+
+    def test_set_cookie_is_not_replayed(self, client):
+        first = client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        second = client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        assert first.headers["Set-Cookie"] == "session=secret"
+        assert "Set-Cookie" not in second.headers
+
+    def test_scoped_to_the_caller(self, client, calls):
+        alice = client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc", "Authorization": "a"})
+        bob = client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc", "Authorization": "b"})
+        assert len(calls) == 2
+        assert alice.get_json() == {"id": 1}
+        assert bob.get_json() == {"id": 2}
+        assert "Idempotent-Replayed" not in bob.headers
+
+        other_ip = client.post(
+            "/payments",
+            json={"amount": 10},
+            headers={"Idempotency-Key": "def"},
+            environ_base={"REMOTE_ADDR": "10.0.0.2"},
+        )
+        client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "def"})
+        assert len(calls) == 4
+        assert other_ip.get_json() == {"id": 3}
+
+    def test_async_view(self, client, calls):
+        first = client.post("/async", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        second = client.post("/async", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        assert len(calls) == 1
+        assert first.status_code == second.status_code == 201
+        assert first.get_json() == second.get_json() == {"id": 1}
+        assert second.headers["Idempotent-Replayed"] == "true"
+
+    def test_different_keys(self, client, calls):
+        client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        response = client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "def"})
+        assert len(calls) == 2
+        assert response.get_json() == {"id": 2}
+
+    def test_without_key(self, client, calls):
+        client.post("/payments", json={"amount": 10})
+        client.post("/payments", json={"amount": 10})
+        assert len(calls) == 2
+
+    def test_key_reused_with_different_body(self, client):
+        client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        response = client.post("/payments", json={"amount": 20}, headers={"Idempotency-Key": "abc"})
+        assert response.status_code == 422
+        assert response.get_json()["error"]["type"] == "UnprocessableEntityError"
+
+    def test_required(self, client):
+        response = client.post("/required")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Missing Idempotency-Key header."
+
+    def test_server_errors_are_not_stored(self, client, calls):
+        client.post("/fails", headers={"Idempotency-Key": "abc"})
+        client.post("/fails", headers={"Idempotency-Key": "abc"})
+        assert len(calls) == 2
+
+    def test_file_store(self, client, calls):
+        first = client.post("/file", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        second = client.post("/file", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        assert len(calls) == 1
+        assert first.get_json() == second.get_json()
+
+    def test_concurrent_duplicate(self, client, in_flight_store):
+        caller = hashlib.blake2b(b"127.0.0.1", digest_size=16).hexdigest()
+        in_flight_store.reserve(f"POST:/in-flight:{caller}:abc")
+        response = client.post("/in-flight", headers={"Idempotency-Key": "abc"})
+        assert response.status_code == 409
+        assert response.get_json()["error"]["type"] == "ConflictError"
+
+
+class TestIdempotentWithoutErrorHandlers:
+    def test_errors_are_json(self):
+        app = Flask(__name__)
+        FlaskUtils(app, register_error_handlers=False)
+
+        @app.post("/payments")
+        @idempotent(required=True)
+        def payments():
+            return {"id": 1}, 201
+
+        client = app.test_client()
+        client.post("/payments", json={"amount": 10}, headers={"Idempotency-Key": "abc"})
+        response = client.post("/payments", json={"amount": 20}, headers={"Idempotency-Key": "abc"})
+        assert response.status_code == 422
+        assert response.get_json()["error"]["type"] == "UnprocessableEntityError"
+
+        response = client.post("/payments")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["type"] == "BadRequestError"
@@ -0,0 +1,189 @@
+import threading
+
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import ConcurrencyLimiter
+from flask_utils import ServiceUnavailableError
+from flask_utils import limit_concurrency
+
+
+class TestConcurrencyLimiter:
+    def test_acquire_release(self):
+        limiter = ConcurrencyLimiter(2)
+        assert limiter.acquire() is True
+        assert limiter.acquire() is True
+        assert limiter.acquire() is False
+        assert limiter.in_flight == 2
+
+        limiter.release()
+        assert limiter.acquire() is True
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(0)
+
+    def test_queue_timeout(self):
+        limiter = ConcurrencyLimiter(1, queue_size=1, queue_timeout=0.01)
+        limiter.acquire()
+        assert limiter.acquire() is False
+        assert limiter.waiting == 0
+
+    def test_queued_request_gets_the_released_slot(self):
+        limiter = ConcurrencyLimiter(1, queue_size=1, queue_timeout=5)
+        limiter.acquire()
+        results = []
+
+        thread = threading.Thread(target=lambda: results.append(limiter.acquire()))
+        thread.start()
+        while limiter.waiting == 0:
+            pass
+        assert limiter.acquire() is False  # The queue is full
+        limiter.release()
+        thread.join()
+
+        assert results == [True]
+        assert limiter.in_flight == 1
+
+    def test_adaptive_increase(self):
+        limiter = ConcurrencyLimiter(2, adaptive=True, target_latency=0.1)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(0.01)
+        assert limiter.limit > 2
+
+    def test_adaptive_decrease(self):
+        limiter = ConcurrencyLimiter(10, adaptive=True, target_latency=0.1, min_limit=2)
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(1)
+        assert limiter.limit == 2
+
+    def test_adaptive_max_limit(self):
+        limiter = ConcurrencyLimiter(2, adaptive=True, max_limit=3)
+        for _ in range(100):
+            limiter.acquire()
+            limiter.release(0.01)
+        assert limiter.limit == 3
+
+    def test_adaptive_without_target(self):
+        limiter = ConcurrencyLimiter(10, adaptive=True)
+        limiter.acquire()
+        limiter.release(0.01)
+        limiter.acquire()
+        limiter.release(0.5)
+        assert limiter.limit == 9
+
+
+class TestServiceUnavailableRetryAfter:
+    def test_retry_after_header(self, flask_client, client):
+        @flask_client.get("/unavailable")
+        def unavailable():
+            raise ServiceUnavailableError("Down for maintenance", retry_after=120)
+
+        response = client.get("/unavailable")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "120"
+
+    def test_no_retry_after_header(self, flask_client, client):
+        @flask_client.get("/unavailable")
+        def unavailable():
+            raise ServiceUnavailableError("Down for maintenance")
+
+        response = client.get("/unavailable")
+        assert "Retry-After" not in response.headers
+
+
+class TestLoadShedding:
+    @pytest.fixture
+    def release(self):
+        release = threading.Event()
+        yield release
+        release.set()
+
+    def test_global_limit(self, release):
+        app = Flask(__name__)
+        limiter = ConcurrencyLimiter(1, retry_after=3)
+        FlaskUtils(app, concurrency_limiter=limiter)
+        entered = threading.Event()
+
+        @app.get("/slow")
+        def slow():
+            entered.set()
+            release.wait(5)
+            return "OK"
+
+        @app.get("/fast")
+        def fast():
+            return "OK"
+
+        thread = threading.Thread(target=lambda: app.test_client().get("/slow"))
+        thread.start()
+        assert entered.wait(5)
+
+        response = app.test_client().get("/fast")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert response.get_json()["error"]["type"] == "ServiceUnavailableError"
+
+        release.set()
+        thread.join()
+        assert limiter.in_flight == 0
+        assert app.test_client().get("/fast").status_code == 200
+
+    def test_slot_released_on_error(self):
+        app = Flask(__name__)
+        limiter = ConcurrencyLimiter(1)
+        FlaskUtils(app, concurrency_limiter=limiter)
+
+        @app.get("/error")
+        def error():
+            raise ServiceUnavailableError("Error")
+
+        app.test_client().get("/error")
+        assert limiter.in_flight == 0
+
+    def test_route_limit(self, release):
+        app = Flask(__name__)
+        FlaskUtils(app)
+        entered = threading.Event()
+
+        @app.get("/slow")
+        @limit_concurrency(1)
+        def slow():
+            entered.set()
+            release.wait(5)
+            return "OK"
+
+        @app.get("/other")
+        def other():
+            return "OK"
+
+        thread = threading.Thread(target=lambda: app.test_client().get("/slow"))
+        thread.start()
+        assert entered.wait(5)
+
+        assert app.test_client().get("/slow").status_code == 503
+        assert app.test_client().get("/other").status_code == 200
+
+        release.set()
+        thread.join()
+        assert app.test_client().get("/slow").status_code == 200
+
+    def test_async_view(self):
+        app = Flask(__name__)
+        FlaskUtils(app)
+        limiter = ConcurrencyLimiter(1)
+        in_flight = []
+
+        @app.get("/async")
+        @limit_concurrency(limiter)
+        async def async_view():
+            in_flight.append(limiter.in_flight)
+            return "OK"
+
+        response = app.test_client().get("/async")
+        assert response.status_code == 200
+        assert in_flight == [1]
+        assert limiter.in_flight == 0
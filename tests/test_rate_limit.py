@@ -0,0 +1,150 @@
+import os
+import time
+
+import pytest
+from flask import Flask
+
+from flask_utils import TokenBucketTable
+from flask_utils import rate_limit
+
+
+class TestTokenBucketTable:
+    def test_burst(self):
+        table = TokenBucketTable(slots=16)
+        for _ in range(3):
+            assert table.consume("client", rate=1, burst=3) == 0
+        assert table.consume("client", rate=1, burst=3) > 0
+
+    def test_wait_time(self):
+        table = TokenBucketTable(slots=16)
+        table.consume("client", rate=0.5, burst=1)
+        assert table.consume("client", rate=0.5, burst=1) == pytest.approx(2, abs=0.1)
+
+    def test_refill(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        table = TokenBucketTable(slots=16)
+        table.consume("client", rate=1, burst=1)
+        assert table.consume("client", rate=1, burst=1) > 0
+
+        now[0] += 1
+        assert table.consume("client", rate=1, burst=1) == 0
+
+    def test_keys_are_independent(self):
+        table = TokenBucketTable(slots=1024)
+        table.consume("a", rate=1, burst=1)
+        assert table.consume("a", rate=1, burst=1) > 0
+        assert table.consume("b", rate=1, burst=1) == 0
+
+    def test_clear(self):
+        table = TokenBucketTable(slots=16)
+        table.consume("client", rate=1, burst=1)
+        table.clear()
+        assert table.consume("client", rate=1, burst=1) == 0
+
+    def test_invalid_slots(self):
+        with pytest.raises(ValueError):
+            TokenBucketTable(slots=0)
+
+    def test_file_backed_table_is_shared(self, tmp_path):
+        path = str(tmp_path / "buckets")
+        first = TokenBucketTable(slots=16, path=path)
+        second = TokenBucketTable(slots=16, path=path)
+        assert os.path.getsize(path) == 16 * 16
+
+        first.consume("client", rate=1, burst=1)
+        assert second.consume("client", rate=1, burst=1) > 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_shared_table_is_inherited_by_forked_processes(self):
+        table = TokenBucketTable(slots=16, shared=True)
+        pid = os.fork()
+        if pid == 0:
+            table.consume("client", rate=1, burst=1)
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert table.consume("client", rate=1, burst=1) > 0
+
+
+class TestRateLimitDecorator:
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client):
+        @flask_client.get("/ip")
+        @rate_limit(2, period=60)
+        def ip():
+            return "OK"
+
+        @flask_client.get("/header")
+        @rate_limit(1, period=60, key="header:X-Api-Key")
+        def header():
+            return "OK"
+
+        @flask_client.get("/custom")
+        @rate_limit(1, period=60, burst=2, key=lambda: "everyone")
+        def custom():
+            return "OK"
+
+        @flask_client.get("/other")
+        @rate_limit(2, period=60)
+        def other():
+            return "OK"
+
+    def test_limit_by_ip(self, client):
+        assert client.get("/ip").status_code == 200
+        assert client.get("/ip").status_code == 200
+
+        response = client.get("/ip")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
+        assert response.get_json()["error"]["type"] == "TooManyRequestsError"
+
+        response = client.get("/ip", environ_base={"REMOTE_ADDR": "10.0.0.2"})
+        assert response.status_code == 200
+
+    def test_routes_are_independent(self, client):
+        client.get("/ip")
+        client.get("/ip")
+        assert client.get("/other").status_code == 200
+
+    def test_limit_by_header(self, client):
+        assert client.get("/header", headers={"X-Api-Key": "a"}).status_code == 200
+        assert client.get("/header", headers={"X-Api-Key": "a"}).status_code == 429
+        assert client.get("/header", headers={"X-Api-Key": "b"}).status_code == 200
+        # Requests without a key are not limited
+        assert client.get("/header").status_code == 200
+        assert client.get("/header").status_code == 200
+
+    def test_custom_key_and_burst(self, client):
+        assert client.get("/custom").status_code == 200
+        assert client.get("/custom").status_code == 200
+        assert client.get("/custom").status_code == 429
+
+    def test_default_table_is_shared_by_the_views_of_an_application(self, flask_client, client):
+        client.get("/ip")
+        table = flask_client.extensions["flask_utils.rate_limit"]
+        assert isinstance(table, TokenBucketTable)
+        client.get("/other")
+        assert flask_client.extensions["flask_utils.rate_limit"] is table
+
+        other_app = Flask(__name__)
+        other_app.get("/ip")(rate_limit(1)(lambda: "OK"))
+        other_app.test_client().get("/ip")
+        assert other_app.extensions["flask_utils.rate_limit"] is not table
+
+    def test_async_view(self, flask_client, client):
+        @flask_client.get("/async")
+        @rate_limit(1, period=60)
+        async def async_view():
+            return "OK"
+
+        assert client.get("/async").status_code == 200
+        assert client.get("/async").status_code == 429
+
+    @pytest.mark.parametrize("arguments", [{"limit": 0}, {"limit": 1, "period": 0}, {"limit": 1, "burst": 0}])
+    def test_invalid_arguments(self, arguments):
+        with pytest.raises(ValueError):
+            rate_limit(**arguments)
+
+    def test_invalid_key(self):
+        with pytest.raises(ValueError):
+            rate_limit(1, key="cookie")
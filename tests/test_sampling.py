@@ -0,0 +1,101 @@
+from typing import Any
+from typing import Dict
+from typing import List
+
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import SlowValidationSampler
+from flask_utils import validate_params
+from flask_utils.sampling import _payload_shape
+
+
+def make_app(sampler, **kwargs):
+    app = Flask(__name__)
+    FlaskUtils(app, slow_validation_sampler=sampler, **kwargs)
+
+    @app.post("/orders")
+    @validate_params({"customer": str, "lines": List[Dict[str, Any]]})
+    def create_order():
+        return "OK", 200
+
+    return app
+
+
+class TestPayloadShape:
+    def test_shape(self):
+        shape = _payload_shape({"customer": "secret@example.com", "lines": [{"a": 1}, {"b": [1, 2, 3]}]}, 1000)
+        assert shape == {
+            "depth": 5,
+            "values": 10,
+            "objects": 3,
+            "arrays": 2,
+            "keys": 4,
+            "max_keys": 2,
+            "max_array_length": 3,
+            "truncated": False,
+        }
+        assert "secret" not in repr(shape)
+
+    def test_truncated(self):
+        shape = _payload_shape(list(range(100)), 10)
+        assert shape["truncated"] is True
+        assert shape["values"] == 10
+
+
+class TestSlowValidationSampler:
+    def test_records_slow_requests(self):
+        sampler = SlowValidationSampler(threshold=0)
+        client = make_app(sampler).test_client()
+        client.post("/orders", json={"customer": "Jules", "lines": [{"sku": "A"}] * 3})
+        client.post("/orders", json={"customer": 1, "lines": []})
+
+        samples = sampler.samples()
+        assert [sample["valid"] for sample in samples] == [True, False]
+        assert samples[0]["endpoint"] == "create_order"
+        assert samples[0]["method"] == "POST"
+        assert samples[0]["shape"]["max_array_length"] == 3
+        assert samples[0]["duration"] >= 0
+        assert "Jules" not in repr(samples)
+        assert sampler.samples(endpoint="other") == []
+
+    @pytest.mark.parametrize("register_error_handlers", [True, False])
+    def test_records_malformed_bodies(self, register_error_handlers):
+        sampler = SlowValidationSampler(threshold=0)
+        app = make_app(sampler, register_error_handlers=register_error_handlers)
+        response = app.test_client().post("/orders", data="{not json", content_type="application/json")
+
+        assert response.status_code == 400
+        samples = sampler.samples()
+        assert len(samples) == 1
+        assert samples[0]["valid"] is False
+        assert samples[0]["shape"] is None
+        assert samples[0]["body_size"] == 9
+
+    def test_fast_requests_are_not_recorded(self):
+        sampler = SlowValidationSampler(threshold=60)
+        make_app(sampler).test_client().post("/orders", json={"customer": "Jules", "lines": []})
+        assert sampler.samples() == []
+        assert sampler.slow_requests == 0
+
+    def test_ring_buffer(self):
+        sampler = SlowValidationSampler(threshold=0, capacity=2)
+        client = make_app(sampler).test_client()
+        for count in range(4):
+            client.post("/orders", json={"customer": "Jules", "lines": [{}] * count})
+        assert [sample["shape"]["max_array_length"] for sample in sampler.samples()] == [2, 3]
+        assert sampler.slow_requests == 4
+        sampler.clear()
+        assert sampler.samples() == []
+
+    def test_sample_rate(self):
+        sampler = SlowValidationSampler(threshold=0, sample_rate=0)
+        make_app(sampler).test_client().post("/orders", json={"customer": "Jules", "lines": []})
+        assert sampler.samples() == []
+        assert sampler.slow_requests == 1
+
+    @pytest.mark.parametrize("kwargs", [{"capacity": 0}, {"sample_rate": 2}])
+    def test_invalid_parameters(self, kwargs):
+        with pytest.raises(ValueError):
+            SlowValidationSampler(threshold=0, **kwargs)
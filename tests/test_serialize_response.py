@@ -0,0 +1,160 @@
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from dataclasses import dataclass
+
+import pytest
+from flask import Flask
+
+from flask_utils import serialize_response
+
+
+@dataclass
+class UserOut:
+    id: int
+    name: str
+    email: Optional[str]
+
+
+class Point(object):
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+@pytest.fixture
+def serialize_app():
+    app = Flask(__name__)
+
+    @app.route("/users")
+    @serialize_response({"users": List[UserOut], "total": int, "meta": Dict[str, Any]})
+    def users():
+        return {
+            "users": [UserOut(1, "Jules", None), UserOut(2, "Zoë", "zoe@example.com")],
+            "total": 2,
+            "meta": {"page": 1},
+        }
+
+    @app.route("/user", methods=["POST"])
+    @serialize_response(UserOut)
+    def create_user():
+        return UserOut(3, "John", None), 201, {"Location": "/users/3"}
+
+    @app.route("/points")
+    @serialize_response(List[Dict[str, float]])
+    def points():
+        return [{"x": 1.5, "y": 2}]
+
+    @app.route("/slots")
+    @serialize_response({"point": {"x": float, "y": float}, "label": Optional[str], "visible": bool})
+    def slots():
+        return {"point": Point(1.5, 2), "visible": True}
+
+    @app.route("/invalid")
+    @serialize_response({"total": int})
+    def invalid():
+        return {"total": "2"}
+
+    @app.route("/missing")
+    @serialize_response({"total": int})
+    def missing():
+        return {}
+
+    return app
+
+
+class TestSerializeResponse:
+    def test_dataclasses(self, serialize_app):
+        response = serialize_app.test_client().get("/users")
+        assert response.status_code == 200
+        assert response.content_type == "application/json"
+        assert response.json == {
+            "users": [
+                {"id": 1, "name": "Jules", "email": None},
+                {"id": 2, "name": "Zoë", "email": "zoe@example.com"},
+            ],
+            "total": 2,
+            "meta": {"page": 1},
+        }
+
+    def test_status_and_headers(self, serialize_app):
+        response = serialize_app.test_client().post("/user")
+        assert response.status_code == 201
+        assert response.headers["Location"] == "/users/3"
+        assert response.json == {"id": 3, "name": "John", "email": None}
+
+    def test_slots_and_missing_optional(self, serialize_app):
+        response = serialize_app.test_client().get("/slots")
+        assert json.loads(response.get_data()) == {"point": {"x": 1.5, "y": 2}, "label": None, "visible": True}
+
+    def test_output_is_valid_json(self, serialize_app):
+        body = serialize_app.test_client().get("/users").get_data()
+        assert json.loads(body)["users"][1]["name"] == "Zoë"
+        assert body.isascii()
+
+    def test_list_schema(self, serialize_app):
+        assert serialize_app.test_client().get("/points").get_data() == b'[{"x":1.5,"y":2}]'
+
+    def test_no_validation_in_production(self, serialize_app):
+        # The value is not checked, but the encoder never produces invalid JSON
+        response = serialize_app.test_client().get("/invalid")
+        assert response.status_code == 500
+
+    def test_validation_in_debug(self, serialize_app):
+        serialize_app.debug = True
+        serialize_app.testing = True
+        with pytest.raises(TypeError, match="Wrong type for total"):
+            serialize_app.test_client().get("/invalid")
+        with pytest.raises(TypeError, match="Missing key total"):
+            serialize_app.test_client().get("/missing")
+
+    def test_non_finite_floats(self, serialize_app):
+        @serialize_app.route("/non-finite")
+        @serialize_response({"values": List[float]})
+        def non_finite():
+            return {"values": [float("nan"), float("inf"), float("-inf"), 1.5]}
+
+        body = serialize_app.test_client().get("/non-finite").get_data()
+        assert body == b'{"values":[NaN,Infinity,-Infinity,1.5]}'
+        assert body.decode() == json.dumps(
+            {"values": [float("nan"), float("inf"), float("-inf"), 1.5]}, separators=(",", ":")
+        )
+
+    def test_validation_of_nested_objects(self):
+        app = Flask(__name__)
+        app.testing = True
+
+        @app.route("/optional")
+        @serialize_response({"users": Optional[List[UserOut]], "by_name": Dict[str, UserOut]}, validate=True)
+        def optional():
+            user = {"id": 1, "name": "Jules", "email": None}
+            return {"users": [user], "by_name": {"Jules": UserOut(1, "Jules", None)}}
+
+        @app.route("/invalid")
+        @serialize_response({"by_name": Dict[str, UserOut]}, validate=True)
+        def invalid():
+            return {"by_name": {"Jules": {"id": "1", "name": "Jules", "email": None}}}
+
+        response = app.test_client().get("/optional")
+        assert response.json == {
+            "users": [{"id": 1, "name": "Jules", "email": None}],
+            "by_name": {"Jules": {"id": 1, "name": "Jules", "email": None}},
+        }
+        with pytest.raises(TypeError, match=r"by_name\.Jules\.id"):
+            app.test_client().get("/invalid")
+
+    def test_explicit_validation(self):
+        app = Flask(__name__)
+        app.testing = True
+
+        @app.route("/")
+        @serialize_response({"users": List[UserOut]}, validate=True)
+        def index():
+            return {"users": [{"id": 1, "name": 2, "email": None}]}
+
+        with pytest.raises(TypeError, match=r"users\[0\]\.name"):
+            app.test_client().get("/")
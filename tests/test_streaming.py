@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from flask_utils import NotFoundError
+from flask_utils import stream_ndjson
+from flask_utils import stream_json_array
+
+
+def failing_rows(error):
+    yield {"id": 1}
+    yield {"id": 2}
+    raise error
+
+
+@pytest.fixture(autouse=True)
+def setup_routes(flask_client):
+    @flask_client.route("/array/<int:count>")
+    def array(count):
+        return stream_json_array(({"id": i} for i in range(count)), batch_size=2)
+
+    @flask_client.route("/ndjson/<int:count>")
+    def ndjson(count):
+        return stream_ndjson(({"id": i} for i in range(count)), batch_size=2)
+
+    @flask_client.route("/array_error")
+    def array_error():
+        return stream_json_array(failing_rows(RuntimeError("database password is hunter2")))
+
+    @flask_client.route("/ndjson_error")
+    def ndjson_error():
+        return stream_ndjson(failing_rows(NotFoundError("The export was deleted.")))
+
+
+class TestStreamJsonArray:
+    @pytest.mark.parametrize("count", [0, 1, 2, 5])
+    def test_items(self, client, count):
+        response = client.get(f"/array/{count}")
+        assert response.status_code == 200
+        assert response.content_type == "application/json"
+        assert response.is_streamed
+        assert response.json == [{"id": i} for i in range(count)]
+
+    def test_batches(self, flask_client):
+        with flask_client.test_request_context():
+            response = stream_json_array(iter(range(5)), batch_size=2)
+            assert list(response.response) == ["[0,1", ",2,3", ",4]"]
+
+    def test_error_record(self, client):
+        response = client.get("/array_error")
+        assert response.status_code == 200
+        data = response.json
+        assert data[:2] == [{"id": 1}, {"id": 2}]
+        assert data[2]["success"] is False
+        assert data[2]["code"] == 500
+        assert "hunter2" not in response.get_data(as_text=True)
+
+    def test_invalid_batch_size(self, flask_client):
+        with flask_client.test_request_context():
+            with pytest.raises(ValueError):
+                stream_json_array([], batch_size=0)
+
+
+class TestStreamNdjson:
+    @pytest.mark.parametrize("count", [0, 1, 2, 5])
+    def test_items(self, client, count):
+        response = client.get(f"/ndjson/{count}")
+        assert response.content_type == "application/x-ndjson"
+        body = response.get_data(as_text=True)
+        assert body.count("\n") == count
+        assert [json.loads(line) for line in body.splitlines()] == [{"id": i} for i in range(count)]
+
+    def test_error_record(self, client):
+        lines = client.get("/ndjson_error").get_data(as_text=True).splitlines()
+        assert [json.loads(line) for line in lines[:2]] == [{"id": 1}, {"id": 2}]
+        assert json.loads(lines[2]) == {
+            "success": False,
+            "error": {
+                "type": "NotFoundError",
+                "name": "Not Found",
+                "message": "The export was deleted.",
+                "solution": "Try again.",
+            },
+            "code": 404,
+        }
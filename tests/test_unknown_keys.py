@@ -0,0 +1,83 @@
+from typing import Dict
+from typing import List
+
+import pytest
+from flask import request
+
+from flask_utils import validate_params
+
+SCHEMA = {"name": str, "tags": List[str], "meta": Dict[str, int]}
+BODY = {"name": "Jules", "tags": ["a"], "meta": {"a": 1}}
+
+
+@pytest.fixture(autouse=True)
+def setup_routes(flask_client):
+    @flask_client.post("/reject")
+    @validate_params(SCHEMA)
+    def reject():
+        return "OK", 200
+
+    @flask_client.post("/ignore")
+    @validate_params(SCHEMA, unknown_keys="ignore")
+    def ignore():
+        return {"keys": sorted(request.get_json())}
+
+    @flask_client.post("/strip")
+    @validate_params(SCHEMA, unknown_keys="strip")
+    def strip():
+        data = request.get_json()
+        return {"keys": sorted(data), "tags": data["tags"]}
+
+    @flask_client.post("/strip-echo")
+    @validate_params(SCHEMA, unknown_keys="strip")
+    def strip_echo():
+        return request.get_json()
+
+    @flask_client.post("/strip-partial")
+    @validate_params(SCHEMA, unknown_keys="strip", partial=True, adaptive_order=True)
+    def strip_partial():
+        return {"keys": sorted(request.json)}
+
+
+class TestUnknownKeys:
+    def test_reject(self, client):
+        response = client.post("/reject", json=dict(BODY, telemetry=1))
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Unexpected key: telemetry."
+
+    def test_ignore(self, client):
+        response = client.post("/ignore", json=dict(BODY, telemetry=1))
+        assert response.status_code == 200
+        assert response.get_json()["keys"] == ["meta", "name", "tags", "telemetry"]
+
+    def test_ignore_still_checks_types(self, client):
+        response = client.post("/ignore", json=dict(BODY, name=1, telemetry=1))
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Wrong type for key name."
+
+    def test_ignore_still_requires_keys(self, client):
+        response = client.post("/ignore", json={"name": "Jules", "telemetry": 1})
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Missing key: tags"
+
+    def test_strip(self, client):
+        response = client.post("/strip", json=dict(BODY, telemetry={"cpu": [1, 2]}))
+        assert response.status_code == 200
+        assert response.get_json() == {"keys": ["meta", "name", "tags"], "tags": ["a"]}
+
+    def test_strip_without_unknown_keys(self, client):
+        response = client.post("/strip", json=BODY)
+        assert response.get_json()["keys"] == ["meta", "name", "tags"]
+
+    def test_strip_returned_body(self, client):
+        response = client.post("/strip-echo", json=dict(BODY, telemetry=1))
+        assert response.status_code == 200
+        assert response.get_json() == BODY
+
+    def test_strip_partial(self, client):
+        response = client.post("/strip-partial", json={"name": "Jules", "telemetry": 1})
+        assert response.get_json()["keys"] == ["name"]
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            validate_params(SCHEMA, unknown_keys="drop")
@@ -437,3 +437,54 @@ class TestMixAndMatch:
 
         error_dict = response.get_json()["error"]
         assert error_dict["message"] == "Unexpected key: unexpected_key."
+
+
+class TestPartial:
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client):
+        fields = {f"field_{i}": str for i in range(200)}
+        fields.update({"age": int, "bio": Optional[str]})
+
+        @flask_client.patch("/partial")
+        @validate_params(fields, partial=True)
+        def partial():
+            return "OK", 200
+
+    def test_only_present_keys(self, client):
+        response = client.patch("/partial", json={"age": 42})
+        assert response.status_code == 200
+
+    def test_wrong_type(self, client):
+        response = client.patch("/partial", json={"field_3": "x", "age": "42"})
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Wrong type for key age."
+
+    def test_none_only_for_optional(self, client):
+        assert client.patch("/partial", json={"bio": None}).status_code == 200
+
+        response = client.patch("/partial", json={"age": None})
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Wrong type for key age."
+
+    def test_unexpected_key(self, client):
+        response = client.patch("/partial", json={"nickname": "Jo"})
+        assert response.status_code == 400
+        assert response.get_json()["error"]["message"] == "Unexpected key: nickname."
+
+
+class TestAdaptiveOrder:
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client):
+        @flask_client.post("/adaptive")
+        @validate_params({"name": str, "tags": List[str], "age": int}, adaptive_order=True)
+        def adaptive():
+            return "OK", 200
+
+    def test_valid(self, client):
+        assert client.post("/adaptive", json={"name": "Jules", "tags": ["a"], "age": 20}).status_code == 200
+
+    def test_single_wrong_key(self, client):
+        for _ in range(3):
+            response = client.post("/adaptive", json={"name": "Jules", "tags": ["a"], "age": "20"})
+            assert response.status_code == 400
+            assert response.get_json()["error"]["message"] == "Wrong type for key age."
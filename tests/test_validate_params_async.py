@@ -0,0 +1,119 @@
+from typing import Dict
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from flask_utils import validate_params
+
+pytest.importorskip("asgiref")
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestAsyncView:
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client):
+        @flask_client.post("/async")
+        @validate_params({"name": str, "age": int})
+        async def async_view():
+            return "OK", 200
+
+    def test_valid_request(self, client):
+        response = client.post("/async", json={"name": "John", "age": 25})
+        assert response.status_code == 200
+        assert response.text == "OK"
+
+    def test_wrong_type(self, client):
+        response = client.post("/async", json={"name": "John", "age": "25"})
+        assert response.status_code == 400
+
+        error_dict = response.get_json()["error"]
+        assert error_dict["message"] == "Wrong type for key age."
+
+    def test_malformed_body(self, client):
+        response = client.post("/async", data="not a json", headers={"Content-Type": "application/json"})
+        assert response.status_code == 400
+
+        error_dict = response.get_json()["error"]
+        assert error_dict["message"] == "The Json Body is malformed."
+
+
+class TestOffload:
+    @pytest.fixture
+    def executor(self):
+        executor = CountingExecutor()
+        yield executor
+        executor.shutdown()
+
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client, executor):
+        @flask_client.post("/offload")
+        @validate_params({"numbers": List[int]}, offload_threshold=100, offload_executor=executor)
+        async def offload():
+            return "OK", 200
+
+        @flask_client.post("/default-executor")
+        @validate_params({"numbers": List[int]}, offload_threshold=100)
+        async def default_executor():
+            return "OK", 200
+
+    def test_small_body_is_validated_inline(self, client, executor):
+        response = client.post("/offload", json={"numbers": [1, 2, 3]})
+        assert response.status_code == 200
+        assert executor.submitted == 0
+
+    def test_big_body_is_offloaded(self, client, executor):
+        response = client.post("/offload", json={"numbers": list(range(100))})
+        assert response.status_code == 200
+        assert executor.submitted == 1
+
+    def test_big_body_wrong_type(self, client, executor):
+        response = client.post("/offload", json={"numbers": list(range(100)) + ["101"]})
+        assert response.status_code == 400
+        assert executor.submitted == 1
+
+        error_dict = response.get_json()["error"]
+        assert error_dict["message"] == "Wrong type for key numbers."
+
+    def test_default_executor(self, client):
+        response = client.post("/default-executor", json={"numbers": list(range(100))})
+        assert response.status_code == 200
+
+        response = client.post("/default-executor", json={"numbers": list(range(100)) + [None]})
+        assert response.status_code == 400
+
+
+class TestProcessPoolOffload:
+    @pytest.fixture
+    def executor(self):
+        executor = ProcessPoolExecutor(max_workers=1)
+        yield executor
+        executor.shutdown()
+
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client, executor):
+        @flask_client.post("/process")
+        @validate_params({"grades": Dict[str, int]}, offload_threshold=0, offload_executor=executor)
+        async def process():
+            return "OK", 200
+
+    def test_valid_request(self, client):
+        response = client.post("/process", json={"grades": {"math": 18}})
+        assert response.status_code == 200
+
+    def test_wrong_type(self, client):
+        response = client.post("/process", json={"grades": {"math": "18"}})
+        assert response.status_code == 400
+
+        error_dict = response.get_json()["error"]
+        assert error_dict["message"] == "Wrong type for key grades."
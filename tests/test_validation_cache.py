@@ -0,0 +1,117 @@
+import threading
+from typing import List
+
+import pytest
+
+from flask_utils import decorators
+from flask_utils import validate_params
+from flask_utils._cache import _LRUCache
+
+
+class TestLRUCache:
+    def test_get_set(self):
+        cache = _LRUCache(maxsize=2)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("b", "default") == "default"
+
+    def test_eviction(self):
+        cache = _LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        cache = _LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            _LRUCache(maxsize=0)
+
+    def test_thread_safety(self):
+        cache = _LRUCache(maxsize=64)
+
+        def worker(offset):
+            for i in range(2000):
+                cache.set((offset, i % 100), i)
+                cache.get((offset, (i + 1) % 100))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 64
+
+
+class TestValidationCache:
+    @pytest.fixture(autouse=True)
+    def calls(self, monkeypatch):
+        calls = []
+        validate_data = decorators._validate_data
+
+        def counting_validate_data(*args):
+            calls.append(args)
+            return validate_data(*args)
+
+        monkeypatch.setattr(decorators, "_validate_data", counting_validate_data)
+        return calls
+
+    @pytest.fixture(autouse=True)
+    def setup_routes(self, flask_client):
+        @flask_client.post("/cached")
+        @validate_params({"name": str, "tags": List[str]}, cache_size=2)
+        def cached():
+            return "OK", 200
+
+        @flask_client.post("/not-cached")
+        @validate_params({"name": str})
+        def not_cached():
+            return "OK", 200
+
+    def test_identical_bodies_are_validated_once(self, client, calls):
+        for _ in range(3):
+            response = client.post("/cached", json={"name": "John", "tags": ["a"]})
+            assert response.status_code == 200
+        assert len(calls) == 1
+
+    def test_errors_are_cached(self, client, calls):
+        for _ in range(3):
+            response = client.post("/cached", json={"name": "John", "tags": [1]})
+            assert response.status_code == 400
+            assert response.get_json()["error"]["message"] == "Wrong type for key tags."
+        assert len(calls) == 1
+
+    def test_different_bodies(self, client, calls):
+        client.post("/cached", json={"name": "John", "tags": ["a"]})
+        client.post("/cached", json={"name": "Jane", "tags": ["a"]})
+        assert len(calls) == 2
+
+    def test_eviction(self, client, calls):
+        client.post("/cached", json={"name": "A", "tags": []})
+        client.post("/cached", json={"name": "B", "tags": []})
+        client.post("/cached", json={"name": "C", "tags": []})
+        client.post("/cached", json={"name": "A", "tags": []})
+        assert len(calls) == 4
+
+    def test_big_bodies_are_not_cached(self, client, calls, monkeypatch):
+        monkeypatch.setattr(decorators, "VALIDATION_CACHE_MAX_BODY_SIZE", 10)
+        client.post("/cached", json={"name": "John", "tags": ["a"]})
+        client.post("/cached", json={"name": "John", "tags": ["a"]})
+        assert len(calls) == 2
+
+    def test_cache_disabled_by_default(self, client, calls):
+        client.post("/not-cached", json={"name": "John"})
+        client.post("/not-cached", json={"name": "John"})
+        assert len(calls) == 2
@@ -0,0 +1,91 @@
+import pytest
+from flask import Flask
+
+from flask_utils import FlaskUtils
+from flask_utils import validate_params
+
+
+@pytest.fixture
+def phases():
+    return []
+
+
+@pytest.fixture
+def hooked_app(phases):
+    app = Flask(__name__)
+
+    def hook(phase, start, end):
+        assert start <= end
+        phases.append(phase)
+
+    FlaskUtils(app, validation_hook=hook, register_error_handlers=False)
+
+    @app.post("/users")
+    @validate_params({"name": str, "age": int})
+    def create_user():
+        return "OK", 200
+
+    @app.post("/collect")
+    @validate_params({"name": str}, collect_errors=True)
+    def collect():
+        return "OK", 200
+
+    @app.post("/async")
+    @validate_params({"name": str})
+    async def async_view():
+        return "OK", 200
+
+    return app
+
+
+class TestValidationHooks:
+    def test_valid_body(self, hooked_app, phases):
+        response = hooked_app.test_client().post("/users", json={"name": "Jules", "age": 20})
+        assert response.status_code == 200
+        assert phases == ["body_read", "json_parse", "key_check", "type_check"]
+
+    def test_wrong_type(self, hooked_app, phases):
+        response = hooked_app.test_client().post("/users", json={"name": "Jules", "age": "20"})
+        assert response.status_code == 400
+        assert phases == ["body_read", "json_parse", "key_check", "type_check", "error_render"]
+
+    def test_missing_key_skips_type_check(self, hooked_app, phases):
+        response = hooked_app.test_client().post("/users", json={"name": "Jules"})
+        assert response.status_code == 400
+        assert phases == ["body_read", "json_parse", "key_check", "error_render"]
+
+    def test_malformed_body(self, hooked_app, phases):
+        response = hooked_app.test_client().post("/users", data="{", content_type="application/json")
+        assert response.status_code == 400
+        assert phases == ["body_read", "json_parse"]
+
+    def test_collect_errors(self, hooked_app, phases):
+        hooked_app.test_client().post("/collect", json={"name": 1})
+        assert phases == ["body_read", "json_parse", "type_check", "error_render"]
+
+    def test_async_view(self, hooked_app, phases):
+        pytest.importorskip("asgiref")
+        hooked_app.test_client().post("/async", json={"name": "Jules"})
+        assert phases == ["body_read", "json_parse", "key_check", "type_check"]
+
+    def test_error_render_with_error_handlers(self, phases):
+        app = Flask(__name__)
+        FlaskUtils(app, validation_hook=lambda phase, start, end: phases.append(phase))
+
+        @app.post("/users")
+        @validate_params({"name": str})
+        def create_user():
+            return "OK", 200
+
+        response = app.test_client().post("/users", json={"name": 1})
+        assert response.status_code == 400
+        assert phases[-1] == "error_render"
+
+    def test_no_hook(self, client, flask_client):
+        @flask_client.post("/plain")
+        @validate_params({"name": str})
+        def plain():
+            return "OK", 200
+
+        assert flask_client.extensions["flask_utils"].validation_hook is None
+        assert client.post("/plain", json={"name": "Jules"}).status_code == 200
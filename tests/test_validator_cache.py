@@ -0,0 +1,72 @@
+import os
+from typing import Dict
+from typing import List
+
+import pytest
+
+from flask_utils import _compiler
+from flask_utils._compiler import _load_code
+from flask_utils._compiler import _SchemaValidator
+from flask_utils._compiler import _generate_checkers_source
+from flask_utils.decorators import VALIDATE_PARAMS_MAX_DEPTH
+
+SCHEMA = {"name": str, "grades": Dict[str, List[int]]}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLASK_UTILS_VALIDATOR_CACHE", str(tmp_path / "validators"))
+    return tmp_path / "validators"
+
+
+def entries(cache_dir):
+    return [name for name in os.listdir(cache_dir) if not name.startswith(".")]
+
+
+class TestValidatorCache:
+    def test_disabled_by_default(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("FLASK_UTILS_VALIDATOR_CACHE", raising=False)
+        validator = _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.validate({"name": "Jules", "grades": {"math": [1]}}) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_entries_are_written_then_loaded(self, cache_dir, monkeypatch):
+        first = _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert len(entries(cache_dir)) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("compiled again")
+
+        monkeypatch.setattr(_compiler, "compile", fail, raising=False)
+        second = _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert second.validate({"name": "Jules", "grades": {"math": ["A"]}}) == first.validate(
+            {"name": "Jules", "grades": {"math": ["A"]}}
+        )
+
+    def test_other_schema_other_entry(self, cache_dir):
+        _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        _SchemaValidator(SCHEMA, True, VALIDATE_PARAMS_MAX_DEPTH)
+        assert len(entries(cache_dir)) == 2
+
+    def test_stale_version_is_ignored(self, cache_dir, monkeypatch):
+        _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        monkeypatch.setattr(_compiler, "__version__", "99.0.0")
+        _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert len(entries(cache_dir)) == 2
+
+    def test_corrupted_entry_is_replaced(self, cache_dir):
+        source, _ = _generate_checkers_source(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        _load_code(source)
+        (entry,) = entries(cache_dir)
+        (cache_dir / entry).write_bytes(b"\x00garbage")
+
+        validator = _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.validate({"name": 1, "grades": {}}) == ("Wrong type for key name.", "It should be str")
+        assert (cache_dir / entry).read_bytes() != b"\x00garbage"
+
+    def test_unwritable_directory(self, tmp_path, monkeypatch):
+        path = tmp_path / "file"
+        path.write_text("not a directory")
+        monkeypatch.setenv("FLASK_UTILS_VALIDATOR_CACHE", str(path))
+        validator = _SchemaValidator(SCHEMA, False, VALIDATE_PARAMS_MAX_DEPTH)
+        assert validator.validate({"name": "Jules", "grades": {}}) is None